@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: message codecs for large list_objects responses.
+
+Builds a synthetic object list shaped like the plugin's list_objects reply
+(name, type, guid, position/rotation/scale floats, depth) and measures, per
+codec, encode time, decode time (frame decoding included) and bytes on the
+wire:
+
+- json            newline-delimited text frame (the protocol 1 format)
+- json+zlib       compressed JSON in a #MSG frame
+- msgpack         msgpack in a #MSG frame (skipped if msgpack is missing)
+- msgpack+zlib    compressed msgpack
+
+Run from the repository root:
+
+    python benchmarks/bench_codec.py [--objects 50000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_root, "src"))
+
+from cinema4d_mcp.codec import available_codecs, decode_message, encode_message  # noqa: E402
+from cinema4d_mcp.framing import FrameDecoder  # noqa: E402
+
+
+def synthetic_objects(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    types = ["Cube", "Sphere", "Null", "Polygon Object", "Camera", "Light"]
+
+    def vector():
+        return [round(rng.uniform(-1000, 1000), 4) for _ in range(3)]
+
+    return {
+        "objects": [
+            {
+                "name": f"Object.{i}",
+                "id": str(rng.getrandbits(63)),
+                "type": rng.choice(types),
+                "type_id": 5159 + i % 7,
+                "position": vector(),
+                "rotation": vector(),
+                "scale": [1.0, 1.0, 1.0],
+                "visible": True,
+                "depth": i % 4,
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def _decode(frame_bytes: bytes):
+    decoder = FrameDecoder()
+    decoder.feed(frame_bytes)
+    return decode_message(decoder.next_frame())
+
+
+def _best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    message = synthetic_objects(args.objects)
+    cases = [("json", "json", None), ("json+zlib", "json", args.threshold)]
+    if "msgpack" in available_codecs():
+        cases += [
+            ("msgpack", "msgpack", None),
+            ("msgpack+zlib", "msgpack", args.threshold),
+        ]
+    else:
+        print("msgpack not installed; `pip install msgpack` to include it")
+
+    print(f"{args.objects} objects, best of {args.repeat}")
+    print(f"{'codec':<14} {'encode s':>9} {'decode s':>9} {'MB':>8}")
+    for label, name, threshold in cases:
+        encode_seconds, frame = _best_of(
+            lambda: encode_message(message, name, threshold), args.repeat
+        )
+        decode_seconds, decoded = _best_of(lambda: _decode(frame), args.repeat)
+        assert decoded == message, label
+        print(
+            f"{label:<14} {encode_seconds:>9.4f} {decode_seconds:>9.4f} {len(frame) / 1e6:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: FrameDecoder vs. the previous ad-hoc receive loops.
+
+Replays a large response frame (default 10 MB, about the size of a base64
+1080p render preview) in socket-sized chunks through:
+
+- legacy server:  ``response_data += chunk`` until a chunk contains b"\\n"
+- legacy plugin:  ``buffer += data.decode()`` then ``while "\\n" in buffer: split``
+- FrameDecoder:   shared codec used by both sides now
+
+Run from the repository root:
+
+    python benchmarks/bench_framing.py [--size-mb 10] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_root, "src"))
+
+from cinema4d_mcp.framing import FrameDecoder  # noqa: E402
+
+
+def _chunks(payload: bytes, size: int):
+    return [payload[i : i + size] for i in range(0, len(payload), size)]
+
+
+def legacy_server(chunks):
+    response_data = b""
+    for chunk in chunks:
+        response_data += chunk
+        if b"\n" in chunk:
+            break
+    return response_data.decode("utf-8").strip()
+
+
+def legacy_plugin(chunks):
+    buffer = ""
+    messages = []
+    for data in chunks:
+        buffer += data.decode("utf-8")
+        while "\n" in buffer:
+            message, buffer = buffer.split("\n", 1)
+            messages.append(message)
+    return messages[0]
+
+
+def frame_decoder(chunks):
+    decoder = FrameDecoder()
+    for chunk in chunks:
+        decoder.feed(chunk)
+    return decoder.next_frame().decode("utf-8")
+
+
+def _best_of(func, chunks, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body_size = int(args.size_mb * 1024 * 1024)
+    # Base64-like ASCII body wrapped in a JSON envelope, newline-terminated
+    payload = (
+        b'{"image_data": "data:image/png;base64,' + b"A" * body_size + b'"}\n'
+    )
+    expected = payload[:-1].decode("utf-8")
+
+    cases = [
+        ("legacy server (bytes +=, 8 KB)", legacy_server, 8192),
+        ("legacy plugin (str split, 4 KB)", legacy_plugin, 4096),
+        ("FrameDecoder (8 KB)", frame_decoder, 8192),
+        ("FrameDecoder (4 KB)", frame_decoder, 4096),
+        ("FrameDecoder (64 KB)", frame_decoder, 65536),
+    ]
+    print(f"Frame size: {len(payload) / 1e6:.1f} MB, best of {args.repeat}")
+    print(f"{'implementation':<34} {'seconds':>9} {'MB/s':>9}")
+    for label, func, chunk_size in cases:
+        seconds, result = _best_of(func, _chunks(payload, chunk_size), args.repeat)
+        assert result == expected, label
+        print(f"{label:<34} {seconds:>9.4f} {len(payload) / 1e6 / seconds:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
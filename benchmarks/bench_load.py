@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MCP tool throughput and latency against the fake plugin.
+
+Drives the server's tool functions (the same coroutines FastMCP calls) at
+each concurrency level, with every worker looping over a mix of tools, and
+reports per level:
+
+- calls/s           completed calls per second of wall time
+- p50 / p95 / p99   call latency in milliseconds (nearest rank)
+- errors            calls that returned an error message or raised
+
+By default it starts benchmarks/fake_plugin.py in-process; pass
+``--target host:port`` to measure a fake plugin in another process (which
+keeps its threads off this interpreter's GIL) or a real Cinema 4D.
+
+Run from the repository root:
+
+    python benchmarks/bench_load.py [--concurrency 1,4,16,64] [--calls 400] \\
+        [--tools get_scene_info,list_objects,add_primitive,render_preview] \\
+        [--latency "*=1ms"] [--objects 1000] [--failure-rate "*=0"] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_root, "src"))
+sys.path.insert(0, os.path.join(_root, "benchmarks"))
+
+from cinema4d_mcp import server  # noqa: E402
+from cinema4d_mcp.endpoints import EndpointPool  # noqa: E402
+from fake_plugin import FAILURE_MODES, FakePlugin, parse_seconds, parse_spec  # noqa: E402
+
+# Tool name -> coroutine factory; arguments are what a typical client sends
+TOOLS: Dict[str, Callable[[], Awaitable[Any]]] = {
+    "get_scene_info": lambda: server.get_scene_info(None),
+    "list_objects": lambda: server.list_objects(fields=["name", "type", "position"]),
+    "add_primitive": lambda: server.add_primitive("cube"),
+    "render_preview": lambda: server.render_preview(width=64, height=64),
+    "render_frame": lambda: server.render_frame(width=64, height=64),
+}
+DEFAULT_TOOLS = ("get_scene_info", "list_objects", "add_primitive", "render_preview")
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _failed(result: Any) -> bool:
+    if isinstance(result, str):
+        return result.lstrip().startswith("❌")
+    if isinstance(result, dict):
+        return "error" in result
+    return False
+
+
+async def run_level(
+    concurrency: int, calls: int, tools: Sequence[str]
+) -> Dict[str, Any]:
+    """Run ``calls`` tool calls with ``concurrency`` workers; return the summary."""
+    latencies: List[float] = []
+    per_tool: Dict[str, List[float]] = {name: [] for name in tools}
+    errors = 0
+    issued = 0
+
+    async def worker(offset: int) -> None:
+        nonlocal errors, issued
+        index = offset
+        while issued < calls:
+            issued += 1
+            name = tools[index % len(tools)]
+            index += 1
+            start = time.perf_counter()
+            try:
+                result = await TOOLS[name]()
+                failed = _failed(result)
+            except Exception:
+                failed = True
+            elapsed = (time.perf_counter() - start) * 1000
+            latencies.append(elapsed)
+            per_tool[name].append(elapsed)
+            errors += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "calls": len(latencies),
+        "errors": errors,
+        "seconds": round(wall, 3),
+        "calls_per_s": round(len(latencies) / wall, 1) if wall else None,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1] if latencies else None,
+        "per_tool_p50_ms": {
+            name: percentile(sorted(values), 50) for name, values in per_tool.items()
+        },
+    }
+
+
+async def run_benchmark(
+    target: Tuple[str, int],
+    levels: Sequence[int],
+    calls: int,
+    tools: Sequence[str],
+    warmup: int = 10,
+) -> List[Dict[str, Any]]:
+    """Point the server at ``target`` and run every concurrency level in turn."""
+    endpoints = EndpointPool([target])
+    original, server._endpoints = server._endpoints, endpoints
+    try:
+        if warmup:
+            await run_level(1, warmup, tools)
+        return [await run_level(level, calls, tools) for level in levels]
+    finally:
+        server._endpoints = original
+        endpoints.stop()
+        endpoints.close()
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--concurrency", default="1,4,16,64")
+    parser.add_argument("--calls", type=int, default=400, help="calls per level")
+    parser.add_argument("--tools", default=",".join(DEFAULT_TOOLS))
+    parser.add_argument("--target", help="host:port of a running plugin (default: in-process fake)")
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--latency", default="*=1ms")
+    parser.add_argument("--payload-bytes", default="render_preview=65536")
+    parser.add_argument("--failure-rate", default="")
+    parser.add_argument("--failure-mode", default="error", choices=FAILURE_MODES)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    tools = [name.strip() for name in args.tools.split(",") if name.strip()]
+    unknown = [name for name in tools if name not in TOOLS]
+    if unknown:
+        parser.error(f"unknown tools {unknown}; choose from {sorted(TOOLS)}")
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    plugin = None
+    if args.target:
+        host, _, port = args.target.rpartition(":")
+        target = (host or "127.0.0.1", int(port))
+    else:
+        plugin = FakePlugin(
+            latency=parse_spec(args.latency, parse_seconds),
+            payload_bytes=parse_spec(args.payload_bytes, int),
+            failure_rate=parse_spec(args.failure_rate, float),
+            failure_mode=args.failure_mode,
+            objects=args.objects,
+        ).start()
+        target = (plugin.host, plugin.port)
+    try:
+        results = asyncio.run(run_benchmark(target, levels, args.calls, tools))
+    finally:
+        if plugin is not None:
+            plugin.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"tools: {', '.join(tools)}  target: {target[0]}:{target[1]}")
+    print(f"{'conc':>5} {'calls':>6} {'errors':>6} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for r in results:
+        print(
+            f"{r['concurrency']:>5} {r['calls']:>6} {r['errors']:>6} {r['calls_per_s']:>9} "
+            f"{_fmt(r['p50_ms']):>8} {_fmt(r['p95_ms']):>8} {_fmt(r['p99_ms']):>8} {_fmt(r['max_ms']):>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
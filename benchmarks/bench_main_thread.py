@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark: round trip of trivial commands through the plugin's main-thread handoff.
+
+Loads c4d_plugin/mcp_server_plugin.pyp against the fake ``c4d`` module and
+runs a simulated Cinema 4D main thread (fake_c4d.MainThread) that calls
+``SocketServerDialog.CoreMessage`` on every ``SpecialEventAdd``, the way
+Cinema 4D does. Worker threads then time, per call:
+
+- noop            ``execute_on_main_thread`` of a function that returns at once
+- execute_python  the ``execute_python`` command with ``x = 1`` (dispatch included)
+
+and report p50 / p99 / max in microseconds and calls per second for each
+number of concurrent workers. The worker wakes as soon as the main thread
+finishes; before the handoff was event driven it polled every 10 ms.
+
+Run from the repository root:
+
+    python benchmarks/bench_main_thread.py [--calls 2000] [--workers 1,4,16] [--json]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_c4d  # noqa: E402
+
+plugin_module = fake_c4d.load_plugin()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _noop():
+    return {"success": True}
+
+
+def _commands(server) -> Dict[str, Callable[[], Any]]:
+    return {
+        "noop": lambda: server.execute_on_main_thread(_noop),
+        "execute_python": lambda: server.dispatch_command(
+            {"command": "execute_python", "code": "x = 1"}
+        ),
+    }
+
+
+COMMANDS = ("noop", "execute_python")
+
+
+def run_level(call: Callable[[], Any], workers: int, calls: int) -> Dict[str, Any]:
+    """Split ``calls`` over ``workers`` threads; latency of every call in seconds."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+    per_worker = max(1, calls // workers)
+
+    def worker():
+        mine = []
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            call()
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "workers": workers,
+        "calls": len(latencies),
+        "calls_per_s": round(len(latencies) / elapsed) if elapsed else None,
+        "p50_us": round(percentile(latencies, 50) * 1e6, 1),
+        "p99_us": round(percentile(latencies, 99) * 1e6, 1),
+        "max_us": round(latencies[-1] * 1e6, 1),
+    }
+
+
+def run(commands: List[str], levels: List[int], calls: int) -> List[Dict[str, Any]]:
+    dialog = plugin_module.SocketServerDialog()
+    # Status messages go through the same queue as EXEC work; log lines to the dialog's buffer
+    server = plugin_module.C4DSocketServer(dialog.msg_queue, log_buffer=dialog.log_buffer)
+    table = _commands(server)
+    results = []
+    with fake_c4d.MainThread(dialog, plugin_module.PLUGIN_ID):
+        for name in commands:
+            run_level(table[name], 1, min(calls, 50))  # warm-up
+            for workers in levels:
+                results.append(dict(run_level(table[name], workers, calls), command=name))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=2000, help="calls per level")
+    parser.add_argument("--workers", default="1,4,16")
+    parser.add_argument("--commands", default=",".join(COMMANDS))
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    commands = [c.strip() for c in args.commands.split(",") if c.strip()]
+    unknown = [c for c in commands if c not in COMMANDS]
+    if unknown:
+        parser.error(f"unknown commands {unknown}; choose from {', '.join(COMMANDS)}")
+    levels = [int(level) for level in args.workers.split(",")]
+
+    results = run(commands, levels, args.calls)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'command':<16} {'workers':>7} {'calls':>6} {'calls/s':>9} {'p50 us':>9} {'p99 us':>9} {'max us':>9}")
+    for r in results:
+        print(
+            f"{r['command']:<16} {r['workers']:>7} {r['calls']:>6} {r['calls_per_s']:>9} "
+            f"{r['p50_us']:>9} {r['p99_us']:>9} {r['max_us']:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark: plugin scene handlers on synthetic scenes, without Cinema 4D.
+
+Loads c4d_plugin/mcp_server_plugin.pyp against the fake ``c4d`` module
+(fake_c4d.py), builds scenes with synthetic_scenes.py and times each
+handler on each scene (median of ``--repeat`` runs):
+
+- list_objects          full listing, every field
+- list_objects_fields   projection to name/type/path (what the server mirror needs)
+- get_scene_info        counts and scene_version
+- find_by_name          the last object in traversal order, by name
+- find_by_guid          the first object, by GUID
+- find_by_tag           a name only stored in an MCP_NAME comment tag
+- scene_state           the hierarchy snapshot used for scene events
+
+Run from the repository root:
+
+    python benchmarks/bench_plugin.py [--objects 10000,100000] [--shapes flat,wide,deep] \\
+        [--handlers list_objects,find_by_name] [--repeat 3] [--profile list_objects]
+
+``--objects 500000`` works but needs a few GB of memory for the fake scene.
+With ``--profile HANDLER`` the handler also runs under cProfile on the
+largest scene and the top functions by cumulative time are printed.
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_c4d  # noqa: E402
+from synthetic_scenes import SHAPES, build_scene  # noqa: E402
+
+plugin_module = fake_c4d.load_plugin()
+
+
+def _handlers(server, doc) -> Dict[str, Callable[[], Any]]:
+    order = server._get_all_objects(doc)
+    last_name = order[-1].GetName()
+    first_guid = str(order[0].GetGUID())
+    tagged = next(
+        (
+            tag[fake_c4d.COMMENTTAG_TEXT][len("MCP_NAME:"):]
+            for obj in reversed(order)
+            for tag in obj.GetTags()
+            if tag.GetType() == fake_c4d.Tcomment
+        ),
+        last_name,
+    )
+
+    def fresh_find(name, use_guid=False):
+        # The name registry would answer repeats without searching
+        server._name_to_guid_registry.clear()
+        server._guid_to_name_registry.clear()
+        return server.find_object_by_name(doc, name, use_guid=use_guid)
+
+    return {
+        "list_objects": lambda: server.handle_list_objects({}),
+        "list_objects_fields": lambda: server.handle_list_objects(
+            {"fields": ["name", "type", "path"]}
+        ),
+        "get_scene_info": server.handle_get_scene_info,
+        "find_by_name": lambda: fresh_find(last_name),
+        "find_by_guid": lambda: fresh_find(first_guid, use_guid=True),
+        "find_by_tag": lambda: fresh_find(tagged),
+        "scene_state": lambda: server._scene_state(doc),
+    }
+
+
+HANDLERS = (
+    "list_objects",
+    "list_objects_fields",
+    "get_scene_info",
+    "find_by_name",
+    "find_by_guid",
+    "find_by_tag",
+    "scene_state",
+)
+
+
+def run(
+    counts: List[int],
+    shapes: List[str],
+    handlers: List[str],
+    repeat: int = 3,
+    deep_depth: int = 200,
+) -> List[Dict[str, Any]]:
+    """Time every handler on every scene; one result row per (scene, handler)."""
+    server = plugin_module.C4DSocketServer(fake_c4d.NullQueue())
+    results = []
+    for count in counts:
+        for shape in shapes:
+            start = time.perf_counter()
+            doc = build_scene(count, shape, depth=deep_depth if shape == "deep" else 3)
+            build_seconds = time.perf_counter() - start
+            fake_c4d.documents.SetActiveDocument(doc)
+            table = _handlers(server, doc)
+            for name in handlers:
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    table[name]()
+                    samples.append(time.perf_counter() - start)
+                median = statistics.median(samples)
+                results.append(
+                    {
+                        "shape": shape,
+                        "objects": count,
+                        "handler": name,
+                        "median_ms": round(median * 1000, 2),
+                        "objects_per_s": round(count / median) if median else None,
+                        "build_s": round(build_seconds, 2),
+                    }
+                )
+    return results
+
+
+def profile(count: int, shape: str, handler: str, top: int = 25, deep_depth: int = 200) -> None:
+    server = plugin_module.C4DSocketServer(fake_c4d.NullQueue())
+    doc = build_scene(count, shape, depth=deep_depth if shape == "deep" else 3)
+    fake_c4d.documents.SetActiveDocument(doc)
+    call = _handlers(server, doc)[handler]
+    profiler = cProfile.Profile()
+    profiler.runcall(call)
+    print(f"\nprofile: {handler} on {shape} scene with {count} objects")
+    pstats.Stats(profiler, stream=sys.stdout).sort_stats("cumulative").print_stats(top)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", default="10000,100000")
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--handlers", default=",".join(HANDLERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--deep-depth", type=int, default=200, help="chain length of deep scenes")
+    parser.add_argument("--profile", metavar="HANDLER", help="cProfile this handler on the largest scene")
+    args = parser.parse_args()
+
+    counts = [int(c) for c in args.objects.split(",")]
+    shapes = [s.strip() for s in args.shapes.split(",") if s.strip()]
+    handlers = [h.strip() for h in args.handlers.split(",") if h.strip()]
+    unknown = [h for h in handlers + ([args.profile] if args.profile else []) if h not in HANDLERS]
+    if unknown:
+        parser.error(f"unknown handlers {unknown}; choose from {', '.join(HANDLERS)}")
+
+    results = run(counts, shapes, handlers, args.repeat, args.deep_depth)
+    print(f"{'shape':<6} {'objects':>8} {'handler':<20} {'median ms':>10} {'objects/s':>12}")
+    for r in results:
+        print(
+            f"{r['shape']:<6} {r['objects']:>8} {r['handler']:<20} "
+            f"{r['median_ms']:>10.2f} {r['objects_per_s']:>12}"
+        )
+    if args.profile:
+        profile(max(counts), shapes[0], args.profile, deep_depth=args.deep_depth)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
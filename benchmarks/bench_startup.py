@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: server cold start, from ``python -X importtime``.
+
+MCP clients such as Claude Desktop restart the server often, so import cost
+is paid on every restart. Each run starts a fresh interpreter that imports
+cinema4d_mcp.server (mcp, every tool registered; all that ``main()`` does
+before serving) with ``-X importtime`` and reports:
+
+- total     cumulative import time of the module (median over runs)
+- own       self time of cinema4d_mcp.* modules (tool registration included)
+- wall      wall-clock time of the whole interpreter run
+- slowest   modules with the largest self time in the median run
+
+It also lists modules that must stay out of a plain import (starlette's
+routing is only needed for the SSE transport) and whether they were loaded.
+``--module cinema4d_mcp.config`` measures what main.py imports before it
+starts the background probe.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py [--runs 5] [--module cinema4d_mcp.server] [--budget-ms 2500]
+
+With ``--budget-ms`` it exits with status 1 when the median total exceeds the
+budget; tests/test_startup.py checks the same budget.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_src = os.path.join(_root, "src")
+
+# Median cumulative import time of cinema4d_mcp.server (mcp included); generous
+# enough for a cold CI machine, tight enough to catch an eager heavy import
+STARTUP_BUDGET_MS = 2500
+# Self time of the package's own modules, which includes FastMCP building a
+# schema for every tool
+OWN_BUDGET_MS = 600
+# Modules the stdio server must not load
+DEFERRED_MODULES = ("starlette.routing", "starlette.applications")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Rows of ``{"module", "self_us", "cumulative_us", "depth"}`` in output order."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append(
+                {
+                    "module": match.group(4),
+                    "self_us": int(match.group(1)),
+                    "cumulative_us": int(match.group(2)),
+                    "depth": len(match.group(3)) // 2,
+                }
+            )
+    return rows
+
+
+def measure_once(module: str = "cinema4d_mcp.server", python: Optional[str] = None) -> Dict:
+    env = dict(os.environ)
+    # Installed servers start from cached bytecode; do not time the compiler
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_src, env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = parse_importtime(proc.stderr)
+    top = next((r for r in reversed(rows) if r["module"] == module), None)
+    return {
+        "total_ms": top["cumulative_us"] / 1000 if top else 0.0,
+        "own_ms": sum(
+            r["self_us"] for r in rows if r["module"].split(".")[0] == "cinema4d_mcp"
+        )
+        / 1000,
+        "wall_ms": wall_ms,
+        "loaded": {r["module"] for r in rows},
+        "rows": rows,
+    }
+
+
+def measure(module: str = "cinema4d_mcp.server", runs: int = 5, python: Optional[str] = None) -> Dict:
+    """Median of ``runs`` fresh-interpreter imports, plus the median run's details."""
+    measure_once(module, python)  # warm-up: writes bytecode caches
+    samples = sorted(
+        (measure_once(module, python) for _ in range(max(1, runs))),
+        key=lambda s: s["total_ms"],
+    )
+    median = samples[len(samples) // 2]
+    return {
+        "module": module,
+        "runs": len(samples),
+        "total_ms": median["total_ms"],
+        "own_ms": statistics.median(s["own_ms"] for s in samples),
+        "wall_ms": statistics.median(s["wall_ms"] for s in samples),
+        "min_total_ms": samples[0]["total_ms"],
+        "max_total_ms": samples[-1]["total_ms"],
+        "deferred": {name: name in median["loaded"] for name in DEFERRED_MODULES},
+        "slowest": sorted(median["rows"], key=lambda r: r["self_us"], reverse=True),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="cinema4d_mcp.server")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--python", help="interpreter to measure (default: this one)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        nargs="?",
+        const=STARTUP_BUDGET_MS,
+        help=f"fail when the median total exceeds this (default {STARTUP_BUDGET_MS})",
+    )
+    args = parser.parse_args()
+
+    result = measure(args.module, args.runs, args.python)
+    print(f"import {result['module']}  ({result['runs']} runs)")
+    print(
+        f"  total  {result['total_ms']:8.1f} ms  "
+        f"(min {result['min_total_ms']:.1f}, max {result['max_total_ms']:.1f})"
+    )
+    print(f"  own    {result['own_ms']:8.1f} ms")
+    print(f"  wall   {result['wall_ms']:8.1f} ms")
+    for name, loaded in result["deferred"].items():
+        print(f"  {name:<24} {'LOADED' if loaded else 'deferred'}")
+    print("  slowest modules (self time):")
+    for row in result["slowest"][: args.top]:
+        print(f"    {row['self_us'] / 1000:8.1f} ms  {row['module']}")
+
+    if args.budget_ms is not None and result["total_ms"] > args.budget_ms:
+        print(f"over budget: {result['total_ms']:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
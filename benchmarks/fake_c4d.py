@@ -0,0 +1,672 @@
+"""
+Stand-in for Cinema 4D's ``c4d`` module, enough to run the plugin's scene
+handlers on a machine without Cinema 4D.
+
+Covers the parts the handlers walk: ``BaseDocument`` with its object tree
+and materials, ``BaseObject`` / ``PolygonObject`` linked through
+GetNext/GetPred/GetDown/GetUp, 64-bit GUIDs, tags (texture and comment),
+user data, parameter access with ``obj[ID]``, dirty counters and the
+``documents``/``threading``/``utils``/``gui``/``plugins`` submodules.
+``GeIsMainThread()`` is true on every thread, so ``execute_on_main_thread``
+runs handlers inline, unless a ``MainThread`` is running: then only its
+thread counts as the main thread and ``SpecialEventAdd`` wakes it to call
+the dialog's ``CoreMessage``, as Cinema 4D does. Unknown upper-case constants (``c4d.MG_LINEAR_COUNT``)
+resolve to stable fake ids; anything else missing raises AttributeError,
+so the plugin's ``hasattr`` feature checks behave as on an older build.
+
+    import fake_c4d
+    plugin = fake_c4d.load_plugin()          # installs the fake as "c4d"
+    server = plugin.C4DSocketServer(fake_c4d.NullQueue())
+
+See synthetic_scenes.py for scene generators and bench_plugin.py for the
+handler benchmark.
+"""
+
+import importlib.machinery
+import importlib.util
+import itertools
+import math
+import os
+import sys
+import threading as _threading
+import time
+import types
+import zlib
+from typing import Any, Dict, List, Optional
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGIN_PATH = os.path.join(_root, "c4d_plugin", "mcp_server_plugin.pyp")
+
+# --- Constants (values as in the Cinema 4D 2025 SDK where it matters) -------
+
+Opolygon = 5100
+Ospline = 5101
+Olight = 5102
+Ocamera = 5103
+Onull = 5140
+Ocube = 5159
+Osphere = 5160
+Ocone = 5162
+Otorus = 5163
+Odisc = 5164
+Otube = 5165
+Oplane = 5168
+Ocylinder = 5170
+Ocapsule = 5171
+Omgcloner = 1018544
+Omgmatrix = 1018545
+Omgrandom = 1018643
+Omgtracer = 1018655
+Omgstep = 1018881
+Omgformula = 1018883
+Omgtext = 1019268
+Mmaterial = 5703
+Ttexture = 5616
+Tphong = 5612
+Tcomment = 1046412
+COMMENTTAG_TEXT = 1000
+DIRTYFLAGS_ALL = -1
+MAXON_CREATOR_ID = 440000266
+DESC_ID = 0
+DESC_NAME = 1
+DLG_TYPE_ASYNC = 1
+CMD_ENABLED = 1
+EVMSG_CHANGE = 604
+
+
+def __getattr__(name: str) -> int:
+    # Parameter ids and enum values the handlers read but this fake does not
+    # model; module __getattr__ is only consulted for names not defined above
+    if name.isupper() or name.startswith(("ID_", "PRIM_", "MG_", "MGGRID")):
+        value = zlib.crc32(name.encode()) & 0x7FFFFFF
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'c4d' has no attribute {name!r}")
+
+
+def GetC4DVersion() -> int:
+    return 2025100
+
+
+def SpecialEventAdd(*args) -> None:
+    if _main_thread is not None:
+        _main_thread.wake()
+
+
+def EventAdd(*args) -> None:
+    pass
+
+
+class Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float = 0.0, y: Optional[float] = None, z: Optional[float] = None):
+        self.x = float(x)
+        self.y = float(x if y is None else y)
+        self.z = float(x if z is None else z)
+
+    def __repr__(self) -> str:
+        return f"Vector({self.x}, {self.y}, {self.z})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Vector) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+
+class BaseTime:
+    __slots__ = ("seconds",)
+
+    def __init__(self, value: float = 0.0, fps: Optional[float] = None):
+        self.seconds = value / fps if fps else float(value)
+
+    def GetFrame(self, fps: float) -> int:
+        return int(round(self.seconds * fps))
+
+    def Get(self) -> float:
+        return self.seconds
+
+
+_guids = itertools.count(1 << 52)
+
+
+class BaseList2D:
+    """Named node with parameters addressed as ``node[ID]``."""
+
+    __slots__ = ("_type", "_name", "_params", "_guid")
+
+    def __init__(self, type_id: int = 0):
+        self._type = type_id
+        self._name = ""
+        self._params: Optional[Dict[Any, Any]] = None
+        # Real GUIDs are large signed 64-bit ints; the plugin checks len(str) > 10
+        self._guid = next(_guids)
+
+    def GetType(self) -> int:
+        return self._type
+
+    def GetName(self) -> str:
+        return self._name
+
+    def SetName(self, name: str) -> None:
+        self._name = name
+        self._touch()
+
+    def GetGUID(self) -> int:
+        return self._guid
+
+    def _touch(self) -> None:
+        pass
+
+    def __getitem__(self, key):
+        return (self._params or {}).get(key, 0)
+
+    def __setitem__(self, key, value) -> None:
+        if self._params is None:
+            self._params = {}
+        self._params[key] = value
+        self._touch()
+
+
+class BaseMaterial(BaseList2D):
+    __slots__ = ()
+
+    def __init__(self, type_id: int = Mmaterial):
+        super().__init__(type_id)
+        self._name = "Material"
+
+
+class BaseTag(BaseList2D):
+    __slots__ = ("_material",)
+
+    def __init__(self, type_id: int):
+        super().__init__(type_id)
+        self._material = None
+
+    def GetMaterial(self) -> Optional[BaseMaterial]:
+        return self._material
+
+    def SetMaterial(self, material: Optional[BaseMaterial]) -> None:
+        self._material = material
+
+
+TextureTag = BaseTag
+
+
+class BaseObject(BaseList2D):
+    """Object in a document tree; siblings form a doubly linked list."""
+
+    __slots__ = ("_up", "_down", "_last", "_next", "_pred", "_doc", "_pos", "_rot", "_scale", "_tags", "_userdata")
+
+    def __init__(self, type_id: int = Onull):
+        super().__init__(type_id)
+        self._up = self._down = self._last = self._next = self._pred = None
+        self._doc: Optional["BaseDocument"] = None
+        self._pos = Vector()
+        self._rot = Vector()
+        self._scale = Vector(1.0)
+        self._tags: Optional[List[BaseTag]] = None
+        self._userdata: Optional[List[Any]] = None
+
+    # Hierarchy
+
+    def GetNext(self) -> Optional["BaseObject"]:
+        return self._next
+
+    def GetPred(self) -> Optional["BaseObject"]:
+        return self._pred
+
+    def GetDown(self) -> Optional["BaseObject"]:
+        return self._down
+
+    def GetDownLast(self) -> Optional["BaseObject"]:
+        return self._last
+
+    def GetUp(self) -> Optional["BaseObject"]:
+        return self._up
+
+    def GetChildren(self) -> List["BaseObject"]:
+        children, child = [], self._down
+        while child:
+            children.append(child)
+            child = child._next
+        return children
+
+    def GetDocument(self) -> Optional["BaseDocument"]:
+        return self._doc
+
+    def _touch(self) -> None:
+        if self._doc is not None:
+            self._doc._dirty += 1
+
+    def _link(self, parent, doc, pred) -> None:
+        """Insert after ``pred`` among ``parent``'s children (first when pred is None)."""
+        self.Remove()
+        holder = parent if parent is not None else doc._root
+        self._up = parent
+        self._pred = pred
+        self._next = pred._next if pred is not None else holder._down
+        if self._next is not None:
+            self._next._pred = self
+        else:
+            holder._last = self
+        if pred is not None:
+            pred._next = self
+        else:
+            holder._down = self
+        self._set_doc(doc)
+        if doc is not None:
+            doc._dirty += 1
+
+    def _set_doc(self, doc) -> None:
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            obj._doc = doc
+            child = obj._down
+            while child:
+                stack.append(child)
+                child = child._next
+
+    def InsertUnder(self, parent: "BaseObject") -> None:
+        self._link(parent, parent._doc, None)
+
+    def InsertUnderLast(self, parent: "BaseObject") -> None:
+        self._link(parent, parent._doc, parent._last)
+
+    def InsertAfter(self, pred: "BaseObject") -> None:
+        self._link(pred._up, pred._doc, pred)
+
+    def Remove(self) -> None:
+        doc = self._doc
+        holder = self._up if self._up is not None else (doc._root if doc is not None else None)
+        if self._pred is not None:
+            self._pred._next = self._next
+        elif holder is not None and holder._down is self:
+            holder._down = self._next
+        if self._next is not None:
+            self._next._pred = self._pred
+        elif holder is not None and holder._last is self:
+            holder._last = self._pred
+        if doc is not None:
+            doc._dirty += 1
+        self._up = self._next = self._pred = None
+        self._set_doc(None)
+
+    # Transform
+
+    def GetAbsPos(self) -> Vector:
+        return self._pos
+
+    def SetAbsPos(self, value: Vector) -> None:
+        self._pos = value
+        self._touch()
+
+    def GetRelPos(self) -> Vector:
+        return self._pos
+
+    def SetRelPos(self, value: Vector) -> None:
+        self.SetAbsPos(value)
+
+    def GetRelRot(self) -> Vector:
+        return self._rot
+
+    def GetAbsRot(self) -> Vector:
+        return self._rot
+
+    def SetRelRot(self, value: Vector) -> None:
+        self._rot = value
+        self._touch()
+
+    SetAbsRot = SetRelRot
+
+    def GetAbsScale(self) -> Vector:
+        return self._scale
+
+    def GetRelScale(self) -> Vector:
+        return self._scale
+
+    def SetAbsScale(self, value: Vector) -> None:
+        self._scale = value
+        self._touch()
+
+    SetRelScale = SetAbsScale
+
+    # Tags and user data
+
+    def GetTags(self) -> List[BaseTag]:
+        return list(self._tags or ())
+
+    def GetTag(self, type_id: int) -> Optional[BaseTag]:
+        return next((tag for tag in self._tags or () if tag.GetType() == type_id), None)
+
+    def InsertTag(self, tag: BaseTag, pred: Optional[BaseTag] = None) -> None:
+        if self._tags is None:
+            self._tags = []
+        self._tags.append(tag)
+        self._touch()
+
+    def MakeTag(self, type_id: int) -> BaseTag:
+        tag = BaseTag(type_id)
+        self.InsertTag(tag)
+        return tag
+
+    def GetUserDataContainer(self) -> List[Any]:
+        # (DescID, name) pairs; the plugin reads entry[DESC_ID] and entry[DESC_NAME]
+        return list(self._userdata or ())
+
+    def AddUserData(self, name: str, value: Any = None) -> Any:
+        if self._userdata is None:
+            self._userdata = []
+        desc_id = ("userdata", len(self._userdata) + 1)
+        self._userdata.append((desc_id, name))
+        self[desc_id] = value
+        return desc_id
+
+    def GetPolygonCount(self) -> int:
+        return 0
+
+    def GetPointCount(self) -> int:
+        return 0
+
+    def Message(self, *args) -> bool:
+        return True
+
+    def SetDirty(self, *args) -> None:
+        self._touch()
+
+    def GetClone(self, *args) -> "BaseObject":
+        clone = type(self)(self._type)
+        clone._name = self._name
+        clone._pos, clone._rot, clone._scale = self._pos, self._rot, self._scale
+        return clone
+
+
+class PolygonObject(BaseObject):
+    __slots__ = ("_points", "_polygons")
+
+    def __init__(self, pcnt: int = 0, vcnt: int = 0):
+        super().__init__(Opolygon)
+        self._points = pcnt
+        self._polygons = vcnt
+
+    def GetPolygonCount(self) -> int:
+        return self._polygons
+
+    def GetPointCount(self) -> int:
+        return self._points
+
+
+class _Root:
+    """Invisible parent of a document's top-level objects."""
+
+    __slots__ = ("_down", "_last")
+
+    def __init__(self):
+        self._down = self._last = None
+
+
+class BaseDocument(BaseList2D):
+    __slots__ = ("_root", "_materials", "_dirty", "_fps", "_time", "_min_time", "_max_time", "_path", "_active")
+
+    def __init__(self):
+        super().__init__(0)
+        self._name = "Untitled 1"
+        self._root = _Root()
+        self._materials: List[BaseMaterial] = []
+        self._dirty = 1
+        self._fps = 30
+        self._time = BaseTime(0)
+        self._min_time = BaseTime(0)
+        self._max_time = BaseTime(90, 30)
+        self._path = ""
+        self._active = None
+
+    def GetFirstObject(self) -> Optional[BaseObject]:
+        return self._root._down
+
+    def GetObjects(self) -> List[BaseObject]:
+        objects, obj = [], self._root._down
+        while obj:
+            objects.append(obj)
+            obj = obj._next
+        return objects
+
+    def InsertObject(self, obj: BaseObject, parent: Optional[BaseObject] = None, pred: Optional[BaseObject] = None) -> None:
+        obj._link(parent, self, pred)
+
+    def SearchObject(self, name: str) -> Optional[BaseObject]:
+        """First object named ``name`` in depth-first order, like C4D."""
+        stack = [self._root._down]
+        while stack:
+            obj = stack.pop()
+            while obj:
+                if obj._name == name:
+                    return obj
+                if obj._down is not None:
+                    stack.append(obj._next)
+                    obj = obj._down
+                    continue
+                obj = obj._next
+        return None
+
+    def GetMaterials(self) -> List[BaseMaterial]:
+        return list(self._materials)
+
+    def InsertMaterial(self, material: BaseMaterial) -> None:
+        self._materials.append(material)
+        self._dirty += 1
+
+    def SearchMaterial(self, name: str) -> Optional[BaseMaterial]:
+        return next((m for m in self._materials if m.GetName() == name), None)
+
+    def GetActiveObject(self) -> Optional[BaseObject]:
+        return self._active
+
+    def SetActiveObject(self, obj: Optional[BaseObject], mode: int = 0) -> None:
+        self._active = obj
+
+    def GetDocumentName(self) -> str:
+        return self._name
+
+    def SetDocumentName(self, name: str) -> None:
+        self._name = name
+
+    def GetDocumentPath(self) -> str:
+        return self._path
+
+    def SetDocumentPath(self, path: str) -> None:
+        self._path = path
+
+    def FindUniqueID(self, app_id: int) -> None:
+        # Identity falls back to path + name, as for unsaved documents
+        return None
+
+    def GetDirty(self, flags: int = DIRTYFLAGS_ALL) -> int:
+        return self._dirty
+
+    def SetChanged(self) -> None:
+        self._dirty += 1
+
+    def GetFps(self) -> int:
+        return self._fps
+
+    def GetTime(self) -> BaseTime:
+        return self._time
+
+    def SetTime(self, time: BaseTime) -> None:
+        self._time = time
+
+    def GetMinTime(self) -> BaseTime:
+        return self._min_time
+
+    def GetMaxTime(self) -> BaseTime:
+        return self._max_time
+
+    def StartUndo(self) -> None:
+        pass
+
+    def EndUndo(self) -> None:
+        pass
+
+    def AddUndo(self, *args) -> None:
+        pass
+
+
+class C4DThread:
+    def Start(self, *args) -> bool:
+        return True
+
+    def End(self, *args) -> None:
+        pass
+
+    def TestBreak(self) -> bool:
+        return False
+
+
+class GeDialog:
+    """Keeps gadget strings; layout calls are accepted and ignored."""
+
+    def __init__(self):
+        self._strings: Dict[int, str] = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith(("Add", "Group", "Set", "Enable")):
+            return lambda *args, **kwargs: True
+        raise AttributeError(name)
+
+    def SetString(self, gadget_id: int, value: str, *args) -> bool:
+        self._strings[gadget_id] = value
+        return True
+
+    def GetString(self, gadget_id: int) -> str:
+        return self._strings.get(gadget_id, "")
+
+
+class MainThread:
+    """
+    Cinema 4D's main thread for a dialog: calls ``dialog.CoreMessage(event_id,
+    None)`` after ``SpecialEventAdd`` and ``dialog.Timer(None)`` every
+    ``timer`` seconds. While it runs, ``GeIsMainThread()`` is true only on it.
+
+        with fake_c4d.MainThread(dialog, plugin.PLUGIN_ID):
+            server.execute_on_main_thread(func)
+    """
+
+    def __init__(self, dialog, event_id: int, timer: Optional[float] = 0.1):
+        self.dialog = dialog
+        self.event_id = event_id
+        self.timer = timer
+        self.thread: Optional[_threading.Thread] = None
+        self._event = _threading.Event()
+        self._running = False
+
+    def wake(self) -> None:
+        self._event.set()
+
+    def start(self) -> "MainThread":
+        global _main_thread
+        self._running = True
+        self.thread = _threading.Thread(target=self._run, name="c4d-main", daemon=True)
+        _main_thread = self
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        global _main_thread
+        self._running = False
+        self._event.set()
+        if self.thread is not None:
+            self.thread.join()
+        if _main_thread is self:
+            _main_thread = None
+
+    def __enter__(self) -> "MainThread":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        next_timer = time.monotonic() + (self.timer or 0)
+        while self._running:
+            timeout = max(0.0, next_timer - time.monotonic()) if self.timer else None
+            if self._event.wait(timeout):
+                self._event.clear()
+                self.dialog.CoreMessage(self.event_id, None)
+            if self.timer and time.monotonic() >= next_timer:
+                self.dialog.Timer(None)
+                next_timer = time.monotonic() + self.timer
+
+
+def _is_main_thread() -> bool:
+    return _main_thread is None or _threading.current_thread() is _main_thread.thread
+
+
+class CommandData:
+    pass
+
+
+class NullQueue:
+    """Message queue for ``C4DSocketServer`` that drops log and status messages."""
+
+    def put(self, item) -> None:
+        pass
+
+    def put_nowait(self, item) -> None:
+        pass
+
+
+_active_document = BaseDocument()
+_main_thread: Optional[MainThread] = None
+
+
+def _submodule(name: str, **attrs) -> types.ModuleType:
+    module = types.ModuleType(f"c4d.{name}")
+    module.__dict__.update(attrs)
+    return module
+
+
+def _set_active(doc: BaseDocument) -> None:
+    global _active_document
+    _active_document = doc
+
+
+documents = _submodule(
+    "documents",
+    BaseDocument=BaseDocument,
+    GetActiveDocument=lambda: _active_document,
+    SetActiveDocument=_set_active,
+    InsertBaseDocument=lambda doc: None,
+)
+threading = _submodule(
+    "threading", C4DThread=C4DThread, GeIsMainThread=_is_main_thread
+)
+utils = _submodule(
+    "utils", RadToDeg=math.degrees, DegToRad=math.radians
+)
+gui = _submodule("gui", GeDialog=GeDialog, MessageDialog=lambda *args: None)
+plugins = _submodule(
+    "plugins", CommandData=CommandData, RegisterCommandPlugin=lambda *args: True
+)
+bitmaps = _submodule("bitmaps")
+
+_SUBMODULES = ("documents", "threading", "utils", "gui", "plugins", "bitmaps")
+
+
+def install() -> types.ModuleType:
+    """Register this module as ``c4d`` (and its submodules) in ``sys.modules``."""
+    module = sys.modules[__name__]
+    sys.modules["c4d"] = module
+    for name in _SUBMODULES:
+        sys.modules[f"c4d.{name}"] = getattr(module, name)
+    return module
+
+
+def load_plugin(path: str = PLUGIN_PATH) -> types.ModuleType:
+    """Import mcp_server_plugin.pyp against the fake (without registering it)."""
+    install()
+    loader = importlib.machinery.SourceFileLoader("mcp_server_plugin", path)
+    spec = importlib.util.spec_from_loader("mcp_server_plugin", loader)
+    module = importlib.util.module_from_spec(spec)
+    module.__file__ = path
+    loader.exec_module(module)
+    return module
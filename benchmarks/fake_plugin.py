@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Pure-Python stand-in for the plugin's ``C4DSocketServer``.
+
+Speaks the same wire protocol as c4d_plugin/mcp_server_plugin.pyp: the
+``hello`` handshake (protocol 1 or 2, codec and compression negotiation),
+request ids with worker threads answering out of order, progress and rows
+frames, binary attachments and ``cancel``. Scenes are synthetic: a flat list
+of ``objects`` cubes whose ``scene_version`` moves on every mutating command.
+
+Behaviour is configurable per command name (``"*"`` is the fallback):
+
+- ``latency``        seconds, or ``(low, high)`` for a uniform random delay
+- ``payload_bytes``  image size for render commands, padding for the others
+- ``failure_rate``   probability of injecting ``failure_mode``:
+                     ``error`` (error reply), ``drop`` (close the connection),
+                     ``hang`` (never reply) or ``garbage`` (invalid JSON)
+
+Use it in-process:
+
+    with FakePlugin(latency={"render_preview": 0.2, "*": 0.002}) as plugin:
+        ...  # connect to plugin.host, plugin.port
+
+or as a server for the real MCP server or benchmarks/bench_load.py:
+
+    python benchmarks/fake_plugin.py --port 5555 --latency "*=2ms,render_preview=200ms" \\
+        --objects 10000 --failure-rate "add_primitive=0.01" --failure-mode drop
+"""
+
+import argparse
+import base64
+import concurrent.futures
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_root, "src"))
+
+from cinema4d_mcp import codec, framing  # noqa: E402
+from cinema4d_mcp.config import READ_ONLY_COMMANDS  # noqa: E402
+
+PROTOCOL_VERSION = 2
+DEFAULT_CAPABILITIES = (
+    "attachments",
+    "scene_version",
+    "progress",
+    "cancel",
+    "list_objects_stream",
+)
+FAILURE_MODES = ("error", "drop", "hang", "garbage")
+IMAGE_COMMANDS = ("render_preview", "snapshot_scene", "render_frame")
+LIST_STREAM_BATCH = 256
+
+Latency = Union[float, Tuple[float, float]]
+
+
+def _per_command(table: Optional[Dict[str, Any]], command: str, default: Any) -> Any:
+    if not table:
+        return default
+    return table.get(command, table.get("*", default))
+
+
+def parse_spec(text: str, parse=float) -> Dict[str, Any]:
+    """Parse ``"*=2ms,render_preview=150..250ms"`` into ``{command: value}``."""
+    spec: Dict[str, Any] = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, raw = item.partition("=")
+        if ".." in raw:
+            low, high = raw.split("..", 1)
+            spec[name.strip()] = (parse(low), parse(high))
+        else:
+            spec[name.strip()] = parse(raw)
+    return spec
+
+
+def parse_seconds(text: str) -> float:
+    """``"5ms"``, ``"0.2s"`` or plain seconds."""
+    text = text.strip()
+    if text.endswith("ms"):
+        return float(text[:-2]) / 1000
+    return float(text.rstrip("s"))
+
+
+class FakePlugin:
+    """
+    Threaded socket server answering like the Cinema 4D plugin.
+
+    One thread per client reads frames; protocol 2 commands run on a worker
+    pool, as in the real plugin, so a slow command does not hold up others on
+    the same connection. ``received`` counts commands by name and
+    ``connections`` counts accepted sockets.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: Optional[Dict[str, Latency]] = None,
+        payload_bytes: Optional[Dict[str, int]] = None,
+        failure_rate: Optional[Dict[str, float]] = None,
+        failure_mode: str = "error",
+        objects: int = 100,
+        capabilities: Iterable[str] = DEFAULT_CAPABILITIES,
+        protocol: int = PROTOCOL_VERSION,
+        workers: int = 8,
+        seed: Optional[int] = None,
+    ):
+        if failure_mode not in FAILURE_MODES:
+            raise ValueError(f"failure_mode must be one of {', '.join(FAILURE_MODES)}")
+        self.host = host
+        self.port = port
+        self.latency = latency or {}
+        self.payload_bytes = payload_bytes or {}
+        self.failure_rate = failure_rate or {}
+        self.failure_mode = failure_mode
+        self.capabilities = list(capabilities)
+        self.protocol = protocol
+        self.objects = [self._object(i) for i in range(objects)]
+        self.version = 1
+        self.received: Counter = Counter()
+        self.connections = 0
+        self._workers = workers
+        self._random = random.Random(seed)
+        # Like C4D, every plugin run hands out different GUIDs
+        self._guid_base = self._random.getrandbits(40) << 20
+        self._lock = threading.Lock()
+        self._listener: Optional[socket.socket] = None
+        self._clients: list = []
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._running = False
+
+    # --- Lifecycle -------------------------------------------------------
+
+    def start(self) -> "FakePlugin":
+        self._listener = socket.create_server((self.host, self.port))
+        self.port = self._listener.getsockname()[1]
+        self._executor = concurrent.futures.ThreadPoolExecutor(self._workers)
+        self._running = True
+        threading.Thread(target=self._accept, name="fake-plugin", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._running = False
+        if self._listener is not None:
+            self._listener.close()
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            self._close(client)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "FakePlugin":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _accept(self) -> None:
+        while self._running:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                break
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self.connections += 1
+                self._clients.append(client)
+            threading.Thread(
+                target=self._handle_client, args=(client,), daemon=True
+            ).start()
+
+    @staticmethod
+    def _close(client: socket.socket) -> None:
+        try:
+            client.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        client.close()
+
+    # --- Protocol --------------------------------------------------------
+
+    def _handle_client(self, client: socket.socket) -> None:
+        decoder = framing.FrameDecoder()
+        session = {"protocol": 1, "codec": "json", "threshold": None, "cancel": {}}
+        send_lock = threading.Lock()
+        try:
+            while self._running:
+                data = client.recv(65536)
+                if not data:
+                    break
+                decoder.feed(data)
+                for frame in decoder:
+                    try:
+                        command = codec.decode_message(frame)
+                    except ValueError:
+                        self._send(client, send_lock, session, {"error": "Invalid JSON format"})
+                        continue
+                    name = command.get("command")
+                    with self._lock:
+                        self.received[name] += 1
+                    if name == "hello":
+                        self._hello(client, send_lock, session, command)
+                    elif name == "cancel":
+                        event = session["cancel"].get(command.get("target"))
+                        if event is not None:
+                            event.set()
+                    elif session["protocol"] >= 2 and "id" in command:
+                        event = session["cancel"][command["id"]] = threading.Event()
+                        self._executor.submit(
+                            self._process, client, send_lock, session, command, event
+                        )
+                    else:
+                        self._process(client, send_lock, session, command, threading.Event())
+        except OSError:
+            pass
+        finally:
+            for event in session["cancel"].values():
+                event.set()
+            with self._lock:
+                if client in self._clients:
+                    self._clients.remove(client)
+            client.close()
+
+    def _hello(self, client, send_lock, session, command) -> None:
+        session["protocol"] = min(int(command.get("protocol", 1)), self.protocol)
+        reply = {
+            "protocol": session["protocol"],
+            "plugin_version": "fake",
+            "capabilities": self.capabilities,
+        }
+        if "codecs" in command:
+            reply["codec"] = codec.choose_codec(command["codecs"])
+            reply["compress_threshold"] = command.get("compress_threshold")
+        # Like the plugin, the hello reply itself is plain JSON
+        self._send(client, send_lock, session, reply, command.get("id"))
+        if "codec" in reply:
+            session["codec"] = reply["codec"]
+            session["threshold"] = reply["compress_threshold"]
+
+    def _send(self, client, send_lock, session, response, request_id=None) -> None:
+        response = dict(response)
+        attachments = response.pop("_attachments", None) or ()
+        if attachments:
+            response["attachments"] = [
+                {"field": field, "length": len(data), "mime": mime}
+                for field, data, mime in attachments
+            ]
+        if request_id is not None:
+            response["id"] = request_id
+        payload = codec.encode_message(response, session["codec"], session["threshold"])
+        with send_lock:
+            client.sendall(payload)
+            for _, data, _ in attachments:
+                client.sendall(framing.encode_binary_frame(data))
+
+    def _process(self, client, send_lock, session, command, cancel_event) -> None:
+        name = command.get("command", "")
+        request_id = command.get("id")
+        try:
+            delay = _per_command(self.latency, name, 0.0)
+            if isinstance(delay, tuple):
+                delay = self._random.uniform(*delay)
+            if command.get("progress") and "progress" in self.capabilities:
+                self._send(
+                    client,
+                    send_lock,
+                    session,
+                    {"type": "progress", "progress": 0, "total": 100, "phase": name},
+                    request_id,
+                )
+            if delay and cancel_event.wait(delay):
+                response = {"error": "Cancelled"}
+            elif self._random.random() < _per_command(self.failure_rate, name, 0.0):
+                if self.failure_mode == "hang":
+                    return
+                if self.failure_mode == "drop":
+                    self._close(client)
+                    return
+                if self.failure_mode == "garbage":
+                    with send_lock:
+                        client.sendall(b"{not json\n")
+                    return
+                response = {"error": f"Injected failure in {name}"}
+            else:
+                response = self.respond(command, client, send_lock, session)
+            self._send(client, send_lock, session, response, request_id)
+        except OSError:
+            pass
+        finally:
+            session["cancel"].pop(request_id, None)
+
+    # --- Scene -----------------------------------------------------------
+
+    @staticmethod
+    def _object(index: int, name: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "name": name or f"Cube.{index}",
+            "id": str(100000 + index),
+            "type": "Cube",
+            "type_id": 5159,
+            "level": 0,
+            "position": [float(index), 0.0, 0.0],
+            "rotation": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0],
+            "visible": True,
+        }
+
+    def respond(self, command: Dict[str, Any], client=None, send_lock=None, session=None):
+        """Answer one command; ``client`` is needed to stream rows frames."""
+        name = command.get("command", "")
+        with self._lock:
+            version = f"fake:{self.version}"
+        if name == "scene_version":
+            return {"scene_version": version}
+        if name == "get_scene_info":
+            return {
+                "scene_info": {
+                    "filename": "fake.c4d",
+                    "object_count": len(self.objects),
+                    "polygon_count": 6 * len(self.objects),
+                    "material_count": 0,
+                    "current_frame": 0,
+                    "fps": 30,
+                    "frame_start": 0,
+                    "frame_end": 90,
+                },
+                "scene_version": version,
+            }
+        if name == "list_objects":
+            fields = command.get("fields")
+            rows = (
+                [{k: obj.get(k) for k in fields} for obj in self.objects]
+                if fields
+                else list(self.objects)
+            )
+            if command.get("stream") and client is not None:
+                for start in range(0, len(rows), LIST_STREAM_BATCH):
+                    self._send(
+                        client,
+                        send_lock,
+                        session,
+                        {"type": "rows", "rows": rows[start : start + LIST_STREAM_BATCH]},
+                        command.get("id"),
+                    )
+                return {"count": len(rows), "streamed": True, "scene_version": version}
+            return {"objects": rows, "scene_version": version}
+        if name in IMAGE_COMMANDS:
+            return self._image(command, _per_command(self.payload_bytes, name, 1024))
+
+        response: Dict[str, Any] = {"success": True}
+        padding = _per_command(self.payload_bytes, name, 0)
+        if padding:
+            response["padding"] = "x" * padding
+        if name not in READ_ONLY_COMMANDS:
+            with self._lock:
+                self.version += 1
+                if name == "add_primitive":
+                    requested = command.get("name") or command.get("object_name")
+                    obj = self._object(len(self.objects), requested)
+                    self.objects.append(obj)
+                    response["object"] = {
+                        "name": obj["name"],
+                        "id": obj["id"],
+                        "requested_name": requested or obj["name"],
+                        "actual_name": obj["name"],
+                        "guid": str(self._guid_base + len(self.objects)),
+                    }
+        return response
+
+    def _image(self, command: Dict[str, Any], size: int) -> Dict[str, Any]:
+        data = b"\x89PNG\r\n\x1a\n" + bytes(max(0, size - 8))
+        info: Dict[str, Any] = {"success": True, "format": "png", "width": 64, "height": 64}
+        if command.get("image_transport") == "binary" and "attachments" in self.capabilities:
+            info["_attachments"] = [("image_data", data, "image/png")]
+        else:
+            info["image_data"] = "data:image/png;base64," + base64.b64encode(data).decode()
+        return info
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5555)
+    parser.add_argument("--objects", type=int, default=100)
+    parser.add_argument("--latency", default="", help='e.g. "*=2ms,render_preview=150..250ms"')
+    parser.add_argument("--payload-bytes", default="", help='e.g. "render_preview=2000000"')
+    parser.add_argument("--failure-rate", default="", help='e.g. "*=0.01"')
+    parser.add_argument("--failure-mode", default="error", choices=FAILURE_MODES)
+    parser.add_argument("--protocol", type=int, default=PROTOCOL_VERSION)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    plugin = FakePlugin(
+        args.host,
+        args.port,
+        latency=parse_spec(args.latency, parse_seconds),
+        payload_bytes=parse_spec(args.payload_bytes, int),
+        failure_rate=parse_spec(args.failure_rate, float),
+        failure_mode=args.failure_mode,
+        objects=args.objects,
+        protocol=args.protocol,
+        seed=args.seed,
+    ).start()
+    print(f"Fake Cinema 4D plugin on {plugin.host}:{plugin.port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        plugin.stop()
+        print(dict(plugin.received))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
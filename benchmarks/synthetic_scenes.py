@@ -0,0 +1,150 @@
+"""
+Synthetic scenes for the fake ``c4d`` module (see fake_c4d.py).
+
+Every generator returns a ``BaseDocument`` with exactly ``count`` objects,
+named ``<Type>.<n>`` in insertion order, with a mix of primitives, nulls and
+polygon objects. Roughly one object in ``tag_every`` carries a texture tag
+(materials are shared from a small pool), a comment tag and an
+``mcp_original_name`` user data entry, like objects the plugin created.
+
+- ``flat``  every object at the top level
+- ``wide``  nulls with ``branching`` children each, ``depth`` levels deep
+- ``deep``  chains ``depth`` levels deep, one child per level
+
+    doc = build_scene(100_000, shape="wide")
+    fake_c4d.documents.SetActiveDocument(doc)
+"""
+
+import math
+import random
+from typing import Callable, Dict, Optional
+
+import fake_c4d as c4d
+
+SHAPES = ("flat", "wide", "deep")
+_PRIMITIVES = (c4d.Ocube, c4d.Osphere, c4d.Ocylinder, c4d.Oplane, c4d.Olight, c4d.Ocamera)
+_TYPE_NAMES = {
+    c4d.Ocube: "Cube",
+    c4d.Osphere: "Sphere",
+    c4d.Ocylinder: "Cylinder",
+    c4d.Oplane: "Plane",
+    c4d.Olight: "Light",
+    c4d.Ocamera: "Camera",
+    c4d.Onull: "Null",
+    c4d.Opolygon: "Polygon",
+}
+
+
+class _Builder:
+    def __init__(self, doc, seed: int, tag_every: int, materials: int):
+        self.doc = doc
+        self.rng = random.Random(seed)
+        self.tag_every = tag_every
+        self.count = 0
+        self.materials = []
+        for i in range(materials):
+            material = c4d.BaseMaterial()
+            material.SetName(f"Material.{i}")
+            doc.InsertMaterial(material)
+            self.materials.append(material)
+
+    def make(self, type_id: Optional[int] = None) -> "c4d.BaseObject":
+        rng = self.rng
+        if type_id is None:
+            roll = rng.random()
+            type_id = c4d.Opolygon if roll < 0.2 else rng.choice(_PRIMITIVES)
+        if type_id == c4d.Opolygon:
+            points = rng.randrange(8, 2000)
+            obj = c4d.PolygonObject(points, points - 2)
+        else:
+            obj = c4d.BaseObject(type_id)
+        obj.SetName(f"{_TYPE_NAMES[type_id]}.{self.count}")
+        obj.SetAbsPos(c4d.Vector(rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3)))
+        obj.SetRelRot(c4d.Vector(rng.uniform(-3.14, 3.14), 0.0, 0.0))
+        if self.tag_every and self.count % self.tag_every == 0:
+            if self.materials:
+                tag = obj.MakeTag(c4d.Ttexture)
+                tag.SetMaterial(self.materials[self.count % len(self.materials)])
+            comment = obj.MakeTag(c4d.Tcomment)
+            comment[c4d.COMMENTTAG_TEXT] = f"MCP_NAME:requested_{self.count}"
+            obj.AddUserData("mcp_original_name", f"original_{self.count}")
+        self.count += 1
+        return obj
+
+
+def _flat(b: _Builder, count: int, branching: Optional[int], depth: int) -> None:
+    last = None
+    for _ in range(count):
+        obj = b.make()
+        b.doc.InsertObject(obj, None, last)
+        last = obj
+
+
+def _wide(b: _Builder, count: int, branching: Optional[int], depth: int) -> None:
+    # Breadth-first: `depth` levels of nulls fanning out `branching` ways, leaves at the bottom
+    branching = branching or max(2, math.ceil(count ** (1 / max(1, depth))))
+    level = [None]
+    for current_depth in range(depth):
+        leaf = current_depth == depth - 1
+        next_level = []
+        for parent in level:
+            last = None
+            for _ in range(branching):
+                if b.count >= count:
+                    return
+                obj = b.make(None if leaf else c4d.Onull)
+                if parent is None:
+                    b.doc.InsertObject(obj, None, last)
+                    last = obj
+                else:
+                    obj.InsertUnderLast(parent)
+                next_level.append(obj)
+        level = next_level
+    # An explicit branching too small for count: spread the rest over the leaves
+    i = 0
+    while b.count < count:
+        b.make().InsertUnderLast(level[i % len(level)])
+        i += 1
+
+
+def _deep(b: _Builder, count: int, branching: Optional[int], depth: int) -> None:
+    last_top = None
+    while b.count < count:
+        top = b.make(c4d.Onull)
+        b.doc.InsertObject(top, None, last_top)
+        last_top = parent = top
+        for _ in range(depth - 1):
+            if b.count >= count:
+                break
+            child = b.make()
+            child.InsertUnderLast(parent)
+            parent = child
+
+
+_GENERATORS: Dict[str, Callable] = {"flat": _flat, "wide": _wide, "deep": _deep}
+
+
+def build_scene(
+    count: int,
+    shape: str = "wide",
+    *,
+    branching: Optional[int] = None,
+    depth: int = 3,
+    tag_every: int = 50,
+    materials: int = 16,
+    seed: int = 1,
+    name: Optional[str] = None,
+) -> "c4d.BaseDocument":
+    """
+    Document with ``count`` objects in the given ``shape``. For ``wide``
+    scenes ``depth`` is the number of levels and ``branching`` defaults to
+    what spreads ``count`` evenly over them; for ``deep`` scenes ``depth`` is
+    the chain length (try 100 or more).
+    """
+    if shape not in _GENERATORS:
+        raise ValueError(f"shape must be one of {', '.join(SHAPES)}")
+    doc = c4d.BaseDocument()
+    doc.SetDocumentName(name or f"synthetic_{shape}_{count}.c4d")
+    builder = _Builder(doc, seed, tag_every, materials)
+    _GENERATORS[shape](builder, count, branching, depth)
+    return doc
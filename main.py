@@ -6,7 +6,9 @@ Runs as a script or module; ensures package is on path and starts the MCP server
 """
 
 import os
+import socket
 import sys
+import threading
 import traceback
 
 # Ensure package is importable when run as script from project root
@@ -21,6 +23,26 @@ def _log(msg: str) -> None:
     print(msg, file=sys.stderr, flush=True)
 
 
+def _probe(host: str, port: int, timeout: float) -> None:
+    _log(f"Checking Cinema 4D at {host}:{port} ...")
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+        _log("✅ Connected to Cinema 4D socket.")
+    except Exception as e:
+        _log(f"❌ No Cinema 4D socket: {e}")
+        _log("   Server will start; C4D tools will fail until the plugin is running.")
+
+
+def _probe_in_background(host: str, port: int, timeout: float) -> threading.Thread:
+    """Report whether the plugin is reachable without delaying startup."""
+    thread = threading.Thread(
+        target=_probe, args=(host, port, timeout), name="c4d-probe", daemon=True
+    )
+    thread.start()
+    return thread
+
+
 def main() -> None:
     """Main entry point."""
     _log("========== CINEMA 4D MCP SERVER STARTING ==========")
@@ -34,16 +56,9 @@ def main() -> None:
         C4D_PORT = int(os.environ.get("C4D_PORT", "5555"))
         C4D_TIMEOUT_CHECK = 5
 
-    _log(f"Checking Cinema 4D at {C4D_HOST}:{C4D_PORT} ...")
-    try:
-        import socket
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(C4D_TIMEOUT_CHECK)
-            sock.connect((C4D_HOST, C4D_PORT))
-        _log("✅ Connected to Cinema 4D socket.")
-    except Exception as e:
-        _log(f"❌ No Cinema 4D socket: {e}")
-        _log("   Server will start; C4D tools will fail until the plugin is running.")
+    # Probe in the background: the server does not need C4D to start, and
+    # the MCP client should not wait up to C4D_TIMEOUT_CHECK seconds for it
+    _probe_in_background(C4D_HOST, C4D_PORT, C4D_TIMEOUT_CHECK)
 
     try:
         from cinema4d_mcp import main as _run
@@ -3,16 +3,24 @@
 __version__ = "0.1.2"
 __all__ = ["main", "main_wrapper", "mcp_app", "__version__"]
 
-from . import server
 
-mcp_app = server.mcp_app
+def __getattr__(name: str):
+    # The server module pulls in mcp and registers every tool; importing
+    # cinema4d_mcp.config (as main.py does before starting) should not pay for it
+    if name == "mcp_app":
+        from .server import mcp_app
+
+        return mcp_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Main entry point for the package."""
-    server.mcp_app.run()
+    from . import server
+
+    server.run()
 
 
 def main_wrapper() -> None:
     """Entry point for the wrapper script."""
-    main()
\ No newline at end of file
+    main()
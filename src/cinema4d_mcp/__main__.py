@@ -0,0 +1,5 @@
+"""Allow ``python -m cinema4d_mcp``, as used by bin/cinema4d-mcp-wrapper."""
+
+from . import main
+
+main()
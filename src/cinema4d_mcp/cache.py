@@ -0,0 +1,59 @@
+"""Scene-state caches for read-only plugin commands."""
+
+__all__ = ["SceneCache"]
+
+from typing import Any, Dict, Optional, Tuple
+
+from .utils import logger
+
+
+class SceneCache:
+    """
+    Remember read-only command results together with the scene version they
+    were computed at.
+
+    The plugin stamps ``get_scene_info`` and ``list_objects`` responses with a
+    ``scene_version`` token (document identity plus ``GetDirty`` counter) and
+    answers a cheap ``scene_version`` command. A cached result is served only
+    while the current token still matches; any mutating command clears the
+    cache outright. ``generation`` guards against a slow read storing a result
+    that an edit finished in the meantime has already invalidated.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def version_of(self, key: str) -> Optional[str]:
+        """Version the cached entry for ``key`` was stored at, if any."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def get(self, key: str, version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached result if it was stored at ``version``."""
+        entry = self._entries.get(key)
+        if entry is not None and version is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(
+        self, key: str, version: Optional[str], result: Dict[str, Any], generation: int
+    ) -> None:
+        """Store ``result``; ignored if the cache was invalidated since ``generation``."""
+        if version is None or generation != self.generation:
+            return
+        self._entries[key] = (version, result)
+
+    def invalidate(self) -> None:
+        if self._entries:
+            logger.debug("Scene cache invalidated")
+        self._entries.clear()
+        self.generation += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
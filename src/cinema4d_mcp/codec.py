@@ -0,0 +1,107 @@
+"""Message codecs negotiated between the MCP server and the C4D plugin.
+
+JSON in newline-delimited text frames is always understood. A peer with
+``msgpack`` installed may offer it in the ``hello`` handshake, and either
+codec may be zlib-compressed once a message reaches the negotiated
+threshold. Anything other than plain JSON travels in a ``#MSG <codec>
+<length>`` frame, so every frame says how to decode it and the two
+directions never need to agree on more than what each side can read.
+
+Like ``framing`` this module is loaded by file path from the plugin, so it
+only depends on the standard library; msgpack is optional on both ends.
+"""
+
+__all__ = [
+    "CodecError",
+    "available_codecs",
+    "choose_codec",
+    "decode_message",
+    "encode_message",
+]
+
+import json
+import zlib
+from typing import Any, Iterable, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # optional: JSON is the fallback
+    msgpack = None
+
+try:
+    from .framing import encode_frame, message_frame_header
+except ImportError:  # loaded by path from the plugin, next to framing.py
+    import importlib.util as _importlib_util
+    import os as _os
+
+    _spec = _importlib_util.spec_from_file_location(
+        "c4d_mcp_framing",
+        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "framing.py"),
+    )
+    _framing = _importlib_util.module_from_spec(_spec)
+    _spec.loader.exec_module(_framing)
+    encode_frame = _framing.encode_frame
+    message_frame_header = _framing.message_frame_header
+
+ZLIB_SUFFIX = "+zlib"
+# zlib level 1: most of the size win on repetitive JSON for a fraction of the CPU
+ZLIB_LEVEL = 1
+
+
+class CodecError(ValueError):
+    """Raised when a frame cannot be decoded with its declared codec."""
+
+
+def available_codecs() -> List[str]:
+    """Codecs this process can encode and decode, most preferred first."""
+    return (["msgpack"] if msgpack is not None else []) + ["json"]
+
+
+def choose_codec(offered: Optional[Iterable[str]]) -> str:
+    """Pick the first locally available codec in the peer's preference order."""
+    local = available_codecs()
+    for name in offered or ():
+        if name in local:
+            return name
+    return "json"
+
+
+def encode_message(
+    message: Any, codec: str = "json", compress_threshold: Optional[int] = None
+) -> bytes:
+    """
+    Encode one message as a complete frame. Plain JSON stays a text frame so
+    peers that never negotiated still read it.
+    """
+    if codec == "msgpack" and msgpack is not None:
+        data = msgpack.packb(message, use_bin_type=True)
+    else:
+        codec = "json"
+        data = json.dumps(message).encode("utf-8")
+    if compress_threshold and len(data) >= compress_threshold:
+        data = zlib.compress(data, ZLIB_LEVEL)
+        codec += ZLIB_SUFFIX
+    if codec == "json":
+        return encode_frame(data)
+    return message_frame_header(codec, len(data)) + data
+
+
+def decode_message(frame: bytes) -> Any:
+    """Decode a text frame (JSON) or a ``MessagePayload`` in its declared codec."""
+    # Duck-typed: the plugin's framing module is a separate copy of the class
+    codec = getattr(frame, "codec", None)
+    if codec is None:
+        return json.loads(frame.decode("utf-8").strip())
+    name = codec
+    data = bytes(frame)
+    try:
+        if name.endswith(ZLIB_SUFFIX):
+            data = zlib.decompress(data)
+            name = name[: -len(ZLIB_SUFFIX)]
+        if name == "json":
+            return json.loads(data.decode("utf-8"))
+        if name == "msgpack" and msgpack is not None:
+            return msgpack.unpackb(data, raw=False)
+    except Exception as e:  # zlib.error, ValueError and msgpack's own types
+        raise CodecError(f"Could not decode {codec} frame: {e}") from e
+    raise CodecError(f"Unsupported codec: {codec}")
@@ -2,26 +2,47 @@
 
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 __all__ = [
     "C4D_HOST",
     "C4D_PORT",
+    "C4D_ENDPOINTS",
     "C4D_TIMEOUT_DEFAULT",
     "C4D_TIMEOUT_LONG",
     "C4D_TIMEOUT_CHECK",
     "C4D_LOG_LEVEL",
+    "C4D_POOL_SIZE",
+    "C4D_POOL_IDLE_TIMEOUT",
+    "C4D_MAX_FRAME_SIZE",
+    "C4D_HEALTH_INTERVAL",
+    "C4D_COMPRESS_THRESHOLD",
+    "C4D_JOB_TTL",
+    "C4D_JOB_CONCURRENCY",
+    "C4D_SCENE_MIRROR",
+    "C4D_MCP_TRANSPORT",
     "LONG_TIMEOUT_COMMANDS",
+    "READ_ONLY_COMMANDS",
     "C4DConfig",
 ]
 
 # Environment keys
 _ENV_HOST = "C4D_HOST"
 _ENV_PORT = "C4D_PORT"
+_ENV_ENDPOINTS = "C4D_ENDPOINTS"
 _ENV_TIMEOUT_DEFAULT = "C4D_TIMEOUT_DEFAULT"
 _ENV_TIMEOUT_LONG = "C4D_TIMEOUT_LONG"
 _ENV_TIMEOUT_CHECK = "C4D_TIMEOUT_CHECK"
 _ENV_LOG_LEVEL = "C4D_LOG_LEVEL"
+_ENV_POOL_SIZE = "C4D_POOL_SIZE"
+_ENV_POOL_IDLE_TIMEOUT = "C4D_POOL_IDLE_TIMEOUT"
+_ENV_MAX_FRAME_SIZE = "C4D_MAX_FRAME_SIZE"
+_ENV_HEALTH_INTERVAL = "C4D_HEALTH_INTERVAL"
+_ENV_COMPRESS_THRESHOLD = "C4D_COMPRESS_THRESHOLD"
+_ENV_JOB_TTL = "C4D_JOB_TTL"
+_ENV_JOB_CONCURRENCY = "C4D_JOB_CONCURRENCY"
+_ENV_SCENE_MIRROR = "C4D_SCENE_MIRROR"
+_ENV_MCP_TRANSPORT = "C4D_MCP_TRANSPORT"
 
 # Defaults (aligned with C4D plugin: host 127.0.0.1, port 5555)
 DEFAULT_HOST = "127.0.0.1"
@@ -29,14 +50,37 @@ DEFAULT_PORT = 5555
 DEFAULT_TIMEOUT = 20
 LONG_OPERATION_TIMEOUT = 120
 CONNECTION_CHECK_TIMEOUT = 5
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_IDLE_TIMEOUT = 60
+DEFAULT_MAX_FRAME_SIZE = 256 * 1024 * 1024  # bytes per protocol frame
+DEFAULT_HEALTH_INTERVAL = 5  # seconds between background reachability probes
+DEFAULT_COMPRESS_THRESHOLD = 64 * 1024  # bytes; larger messages are zlib-compressed
+DEFAULT_JOB_TTL = 600  # seconds a finished job's result is kept
+DEFAULT_JOB_CONCURRENCY = 1  # jobs running at once per Cinema 4D instance
 VALID_PORT_RANGE = (1, 65535)
+MCP_TRANSPORTS = ("stdio", "sse")
 
-# Commands that use long timeout (render, snapshot, field operations)
+# Commands that use long timeout (render, snapshot, field operations, batches)
 LONG_TIMEOUT_COMMANDS: List[str] = [
     "render_frame",
+    "render_frames",
     "render_preview",
     "snapshot_scene",
     "apply_mograph_fields",
+    "batch_commands",
+    "subscribe_scene",
+]
+
+# Commands that never modify the document; every other command clears the
+# server's scene cache when it completes
+READ_ONLY_COMMANDS: List[str] = [
+    "hello",
+    "scene_version",
+    "get_scene_info",
+    "list_objects",
+    "render_preview",
+    "snapshot_scene",
+    "subscribe_scene",
 ]
 
 
@@ -51,7 +95,31 @@ def _parse_port() -> int:
     return DEFAULT_PORT
 
 
-def _parse_timeout(env_key: str, default: int) -> int:
+def _parse_endpoints(host: str, port: int) -> List[Tuple[str, int]]:
+    """
+    Parse ``C4D_ENDPOINTS`` ("host:port,host:port"); a bare host uses ``port``.
+    Malformed entries are skipped; without any, ``host:port`` is the only one.
+    """
+    endpoints: List[Tuple[str, int]] = []
+    for entry in os.environ.get(_ENV_ENDPOINTS, "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, raw_port = entry.rpartition(":")
+        if not name:
+            name, raw_port = raw_port, str(port)
+        try:
+            value = int(raw_port)
+        except ValueError:
+            continue
+        if VALID_PORT_RANGE[0] <= value <= VALID_PORT_RANGE[1]:
+            endpoint = (name, value)
+            if endpoint not in endpoints:
+                endpoints.append(endpoint)
+    return endpoints or [(host, port)]
+
+
+def _parse_positive_int(env_key: str, default: int) -> int:
     raw = os.environ.get(env_key)
     if raw is None:
         return default
@@ -62,13 +130,43 @@ def _parse_timeout(env_key: str, default: int) -> int:
         return default
 
 
+def _parse_bool(env_key: str, default: bool) -> bool:
+    raw = os.environ.get(env_key)
+    if raw is None:
+        return default
+    return raw.strip().lower() not in ("0", "false", "no", "off", "")
+
+
+def _parse_transport() -> str:
+    raw = os.environ.get(_ENV_MCP_TRANSPORT, "").strip().lower()
+    return raw if raw in MCP_TRANSPORTS else MCP_TRANSPORTS[0]
+
+
 # Resolved configuration values
 C4D_HOST: str = os.environ.get(_ENV_HOST, DEFAULT_HOST)
 C4D_PORT: int = _parse_port()
-C4D_TIMEOUT_DEFAULT: int = _parse_timeout(_ENV_TIMEOUT_DEFAULT, DEFAULT_TIMEOUT)
-C4D_TIMEOUT_LONG: int = _parse_timeout(_ENV_TIMEOUT_LONG, LONG_OPERATION_TIMEOUT)
-C4D_TIMEOUT_CHECK: int = _parse_timeout(_ENV_TIMEOUT_CHECK, CONNECTION_CHECK_TIMEOUT)
+C4D_ENDPOINTS: List[Tuple[str, int]] = _parse_endpoints(C4D_HOST, C4D_PORT)
+C4D_TIMEOUT_DEFAULT: int = _parse_positive_int(_ENV_TIMEOUT_DEFAULT, DEFAULT_TIMEOUT)
+C4D_TIMEOUT_LONG: int = _parse_positive_int(_ENV_TIMEOUT_LONG, LONG_OPERATION_TIMEOUT)
+C4D_TIMEOUT_CHECK: int = _parse_positive_int(_ENV_TIMEOUT_CHECK, CONNECTION_CHECK_TIMEOUT)
 C4D_LOG_LEVEL: str = os.environ.get(_ENV_LOG_LEVEL, "DEBUG").upper()
+C4D_POOL_SIZE: int = _parse_positive_int(_ENV_POOL_SIZE, DEFAULT_POOL_SIZE)
+C4D_POOL_IDLE_TIMEOUT: int = _parse_positive_int(
+    _ENV_POOL_IDLE_TIMEOUT, DEFAULT_POOL_IDLE_TIMEOUT
+)
+C4D_MAX_FRAME_SIZE: int = _parse_positive_int(_ENV_MAX_FRAME_SIZE, DEFAULT_MAX_FRAME_SIZE)
+C4D_HEALTH_INTERVAL: int = _parse_positive_int(_ENV_HEALTH_INTERVAL, DEFAULT_HEALTH_INTERVAL)
+C4D_COMPRESS_THRESHOLD: int = _parse_positive_int(
+    _ENV_COMPRESS_THRESHOLD, DEFAULT_COMPRESS_THRESHOLD
+)
+C4D_JOB_TTL: int = _parse_positive_int(_ENV_JOB_TTL, DEFAULT_JOB_TTL)
+C4D_JOB_CONCURRENCY: int = _parse_positive_int(_ENV_JOB_CONCURRENCY, DEFAULT_JOB_CONCURRENCY)
+# Subscribe to scene events and keep a local mirror of the hierarchy. Off by
+# default: while subscribed, the plugin re-walks the whole document on the
+# Cinema 4D main thread after every change (up to 10 times a second)
+C4D_SCENE_MIRROR: bool = _parse_bool(_ENV_SCENE_MIRROR, False)
+# MCP transport; "sse" also serves the / status page and /metrics over HTTP
+C4D_MCP_TRANSPORT: str = _parse_transport()
 
 
 @dataclass(frozen=True)
@@ -81,6 +179,8 @@ class C4DConfig:
     timeout_long: int
     timeout_check: int
     long_timeout_commands: tuple
+    pool_size: int = DEFAULT_POOL_SIZE
+    pool_idle_timeout: int = DEFAULT_POOL_IDLE_TIMEOUT
 
     @classmethod
     def from_env(cls) -> "C4DConfig":
@@ -91,4 +191,6 @@ class C4DConfig:
             timeout_long=C4D_TIMEOUT_LONG,
             timeout_check=C4D_TIMEOUT_CHECK,
             long_timeout_commands=tuple(LONG_TIMEOUT_COMMANDS),
+            pool_size=C4D_POOL_SIZE,
+            pool_idle_timeout=C4D_POOL_IDLE_TIMEOUT,
         )
@@ -0,0 +1,202 @@
+"""Routing tool calls across several Cinema 4D plugin instances."""
+
+__all__ = ["Endpoint", "EndpointPool"]
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from .config import C4D_ENDPOINTS, C4D_JOB_CONCURRENCY, C4D_SCENE_MIRROR
+from .health import HealthMonitor
+from .mirror import SceneMirror
+from .pool import C4DConnectionPool
+from .transport import AsyncC4DConnection
+from .utils import logger
+
+
+class Endpoint:
+    """One plugin instance: its connection pool, health monitor and current load."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        health_interval: Optional[float] = None,
+        job_concurrency: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.pool = C4DConnectionPool(host=host, port=port)
+        self.health = HealthMonitor(host=host, port=port, interval=health_interval)
+        self.mirror = SceneMirror()
+        # Tool calls currently holding a connection to this instance
+        self.in_flight = 0
+        self.completed = 0
+        # Background jobs allowed to run at once; the rest are counted in jobs_queued
+        self.job_concurrency = (
+            job_concurrency if job_concurrency is not None else C4D_JOB_CONCURRENCY
+        )
+        self.jobs_queued = 0
+        self._job_slots: Optional[asyncio.Semaphore] = None
+        self._job_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def load(self) -> int:
+        return self.in_flight + self.jobs_queued
+
+    def job_slots(self) -> asyncio.Semaphore:
+        """The job semaphore, created on (and bound to) the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._job_slots is None or self._job_slots_loop is not loop:
+            self._job_slots = asyncio.Semaphore(self.job_concurrency)
+            self._job_slots_loop = loop
+        return self._job_slots
+
+    @property
+    def available(self) -> bool:
+        """Up, or not probed yet; only a failed probe takes an instance out."""
+        return self.health.up is not False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.name,
+            "in_flight": self.in_flight,
+            "jobs_queued": self.jobs_queued,
+            "completed": self.completed,
+            "health": self.health.snapshot(),
+            "mirror": self.mirror.snapshot(),
+        }
+
+
+class EndpointPool:
+    """
+    Pick a plugin instance per tool call.
+
+    Scene edits go to a sticky endpoint: the first call of an MCP session binds
+    it to the least-loaded instance and later calls keep targeting that one, so
+    a session sees one consistent document. The binding only moves when the
+    health monitor reports the instance down. Stateless heavy work, such as
+    rendering a saved scene file, goes to whichever available instance has the
+    fewest calls in flight or queued, ties broken by probe latency.
+    """
+
+    def __init__(
+        self,
+        endpoints: Optional[Sequence[Tuple[str, int]]] = None,
+        health_interval: Optional[float] = None,
+    ):
+        addresses = list(endpoints) if endpoints is not None else list(C4D_ENDPOINTS)
+        if not addresses:
+            raise ValueError("At least one Cinema 4D endpoint is required")
+        self.endpoints: List[Endpoint] = [
+            Endpoint(host, port, health_interval) for host, port in addresses
+        ]
+        # MCP session -> bound endpoint; sessions vanish with their client
+        self._sessions: "weakref.WeakKeyDictionary[Any, Endpoint]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Binding for calls without a session (stdio clients, tests)
+        self._default: Optional[Endpoint] = None
+
+    @property
+    def primary(self) -> Endpoint:
+        return self.endpoints[0]
+
+    @property
+    def up(self) -> Optional[bool]:
+        """True if any instance is up, None while none has been probed yet."""
+        states = [endpoint.health.up for endpoint in self.endpoints]
+        if any(states):
+            return True
+        return None if None in states else False
+
+    def least_loaded(self) -> Endpoint:
+        candidates = [e for e in self.endpoints if e.available] or self.endpoints
+        return min(
+            candidates,
+            key=lambda e: (
+                e.load,
+                e.health.last_rtt if e.health.last_rtt is not None else 0.0,
+            ),
+        )
+
+    def sticky(self, session: Any = None) -> Endpoint:
+        """Return the endpoint bound to ``session``, binding one if needed."""
+        if session is None:
+            endpoint = self._default
+        else:
+            try:
+                endpoint = self._sessions.get(session)
+            except TypeError:  # not weak-referenceable; share the default binding
+                session, endpoint = None, self._default
+        if endpoint is not None and endpoint.available:
+            return endpoint
+        replacement = self.least_loaded()
+        if endpoint is not None and replacement is not endpoint:
+            logger.warning(
+                "Cinema 4D at %s is down, moving session to %s",
+                endpoint.name,
+                replacement.name,
+            )
+        if session is None:
+            self._default = replacement
+        else:
+            self._sessions[session] = replacement
+        return replacement
+
+    @asynccontextmanager
+    async def connection(self, endpoint: Endpoint) -> AsyncIterator[AsyncC4DConnection]:
+        """Hold a pooled connection to ``endpoint``, counted as in flight."""
+        # Counted before connecting so concurrent calls spread out immediately
+        endpoint.in_flight += 1
+        connection = None
+        try:
+            connection = await endpoint.pool.acquire()
+            yield connection
+        finally:
+            if connection is not None:
+                endpoint.pool.release(connection)
+            endpoint.in_flight -= 1
+            endpoint.completed += 1
+
+    @asynccontextmanager
+    async def job_slot(self, endpoint: Endpoint) -> AsyncIterator[None]:
+        """Wait for one of ``endpoint``'s job slots; the wait counts as load."""
+        endpoint.jobs_queued += 1
+        slots = endpoint.job_slots()
+        try:
+            await slots.acquire()
+        finally:
+            endpoint.jobs_queued -= 1
+        try:
+            yield
+        finally:
+            slots.release()
+
+    def expect_scene_change(self) -> None:
+        """A tool may have edited a scene; mirrors wait for the plugin to report it."""
+        for endpoint in self.endpoints:
+            endpoint.mirror.expect_change()
+
+    def ensure_started(self) -> None:
+        for endpoint in self.endpoints:
+            endpoint.health.ensure_started()
+            if C4D_SCENE_MIRROR:
+                endpoint.mirror.ensure_started(endpoint.pool)
+
+    def stop(self) -> None:
+        for endpoint in self.endpoints:
+            endpoint.health.stop()
+            endpoint.mirror.stop()
+
+    def close(self) -> None:
+        for endpoint in self.endpoints:
+            endpoint.pool.close()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [endpoint.snapshot() for endpoint in self.endpoints]
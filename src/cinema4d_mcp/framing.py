@@ -0,0 +1,177 @@
+"""Newline-delimited frame codec shared by the MCP server and the C4D plugin.
+
+Text frames are terminated by ``\n``. A binary frame is announced by a
+``#BIN <length>\n`` line followed by exactly ``length`` raw bytes; JSON
+frames never start with ``#``, so the two cannot be confused. Binary frames
+carry attachments such as rendered images, which avoids base64 inside JSON.
+A message frame, ``#MSG <codec> <length>\n`` plus ``length`` bytes, carries a
+message in a negotiated binary codec (see ``codec``).
+
+This module only uses the standard library and has no package-relative
+imports: the Cinema 4D plugin loads it straight from its file path, outside
+of the ``cinema4d_mcp`` package.
+"""
+
+__all__ = [
+    "DEFAULT_MAX_FRAME_SIZE",
+    "BinaryPayload",
+    "FrameDecoder",
+    "FrameTooLargeError",
+    "MessagePayload",
+    "binary_frame_header",
+    "encode_binary_frame",
+    "encode_frame",
+    "message_frame_header",
+]
+
+from collections import deque
+from typing import Deque, Optional
+
+DELIMITER = b"\n"
+BINARY_MARKER = b"#BIN "
+MESSAGE_MARKER = b"#MSG "
+# Large enough for multi-MB base64 render previews, small enough to stop a
+# runaway peer from exhausting memory
+DEFAULT_MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+
+class FrameTooLargeError(ValueError):
+    """Raised when a frame exceeds the decoder's max_frame_size."""
+
+
+class BinaryPayload(bytes):
+    """A frame that arrived as a length-prefixed binary frame."""
+
+
+class MessagePayload(bytes):
+    """A length-prefixed message frame; ``codec`` names its encoding."""
+
+    def __new__(cls, data, codec):
+        payload = super().__new__(cls, data)
+        payload.codec = codec
+        return payload
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """Terminate a payload with the frame delimiter."""
+    return payload + DELIMITER
+
+
+def binary_frame_header(length: int) -> bytes:
+    """Header line announcing ``length`` raw bytes; send the payload right after it."""
+    return BINARY_MARKER + str(length).encode("ascii") + DELIMITER
+
+
+def encode_binary_frame(payload: bytes) -> bytes:
+    """Length-prefix raw bytes so they may contain the delimiter."""
+    return binary_frame_header(len(payload)) + payload
+
+
+def message_frame_header(codec: str, length: int) -> bytes:
+    """Header line for a ``codec``-encoded message of ``length`` bytes."""
+    return MESSAGE_MARKER + f"{codec} {length}".encode("ascii") + DELIMITER
+
+
+class FrameDecoder:
+    """
+    Incremental splitter for delimiter-terminated frames.
+
+    Received bytes are appended to one ``bytearray``; only bytes that arrived
+    since the last call are scanned for the delimiter, so decoding is linear
+    in the input size. Complete frames are queued in arrival order and bytes
+    after the last delimiter are kept for the next ``feed``. Frames are
+    returned as raw bytes, which keeps multi-byte UTF-8 sequences split across
+    reads intact; binary frames are returned as ``BinaryPayload`` and message
+    frames as ``MessagePayload``.
+    """
+
+    def __init__(self, max_frame_size: int = DEFAULT_MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        self._scanned = 0
+        # Length of the binary frame being collected, None while reading lines
+        self._binary_length: Optional[int] = None
+        # Codec of the message frame being collected, None for attachments
+        self._message_codec: Optional[str] = None
+        self._frames: Deque[bytes] = deque()
+
+    def feed(self, data: bytes) -> None:
+        """Add received bytes and queue every frame they complete."""
+        buffer = self._buffer
+        buffer += data
+        start = 0
+        while True:
+            if self._binary_length is not None:
+                end = start + self._binary_length
+                if end > len(buffer):
+                    break
+                if self._message_codec is None:
+                    self._frames.append(BinaryPayload(buffer[start:end]))
+                else:
+                    self._frames.append(
+                        MessagePayload(buffer[start:end], self._message_codec)
+                    )
+                    self._message_codec = None
+                self._binary_length = None
+                start = self._scanned = end
+                continue
+            end = buffer.find(DELIMITER, self._scanned)
+            if end < 0:
+                break
+            if end - start > self.max_frame_size:
+                raise FrameTooLargeError(
+                    f"Frame of {end - start} bytes exceeds limit of {self.max_frame_size}"
+                )
+            if buffer.startswith(BINARY_MARKER, start, end):
+                self._binary_length = self._parse_binary_length(
+                    buffer[start + len(BINARY_MARKER) : end]
+                )
+            elif buffer.startswith(MESSAGE_MARKER, start, end):
+                codec, _, length = (
+                    bytes(buffer[start + len(MESSAGE_MARKER) : end]).partition(b" ")
+                )
+                self._binary_length = self._parse_binary_length(length)
+                self._message_codec = codec.decode("ascii", errors="replace")
+            else:
+                self._frames.append(bytes(buffer[start:end]))
+            start = end + 1
+            self._scanned = start
+        if start:
+            # Deleting a prefix of a bytearray is O(1) in CPython
+            del buffer[:start]
+        self._scanned = len(buffer)
+        if self._binary_length is None and self._scanned > self.max_frame_size:
+            raise FrameTooLargeError(
+                f"Incomplete frame of {self._scanned} bytes exceeds limit of {self.max_frame_size}"
+            )
+
+    def _parse_binary_length(self, raw: bytearray) -> int:
+        try:
+            length = int(raw)
+        except ValueError:
+            raise ValueError(f"Malformed binary frame header: {bytes(raw)!r}")
+        if length < 0 or length > self.max_frame_size:
+            raise FrameTooLargeError(
+                f"Binary frame of {length} bytes exceeds limit of {self.max_frame_size}"
+            )
+        return length
+
+    def next_frame(self) -> Optional[bytes]:
+        """Pop the oldest complete frame, or None if none is ready."""
+        return self._frames.popleft() if self._frames else None
+
+    def __iter__(self):
+        while self._frames:
+            yield self._frames.popleft()
+
+    @property
+    def pending(self) -> bytes:
+        """Bytes received after the last complete frame."""
+        return bytes(self._buffer)
+
+    def clear(self) -> None:
+        self._buffer.clear()
+        self._scanned = 0
+        self._binary_length = None
+        self._message_codec = None
+        self._frames.clear()
@@ -0,0 +1,128 @@
+"""Background reachability monitor for the Cinema 4D plugin."""
+
+__all__ = ["HealthMonitor", "LATENCY_BUCKETS_MS"]
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from .config import C4D_HEALTH_INTERVAL, C4D_HOST, C4D_PORT, C4D_TIMEOUT_CHECK
+from .utils import logger
+
+# Upper bounds (ms) of the connect-latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class HealthMonitor:
+    """
+    Probe the plugin port on an interval and keep the result in memory.
+
+    Status endpoints read ``snapshot()`` instead of connecting themselves, so
+    they answer immediately even while Cinema 4D is down. Each probe is a TCP
+    connect; its round-trip time is kept for the last ``window`` probes.
+    ``up`` stays None until the first probe finished.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        window: int = 120,
+    ):
+        self.host = host if host is not None else C4D_HOST
+        self.port = port if port is not None else C4D_PORT
+        self.interval = interval if interval is not None else C4D_HEALTH_INTERVAL
+        self.timeout = timeout if timeout is not None else C4D_TIMEOUT_CHECK
+        self.up: Optional[bool] = None
+        self.last_rtt: Optional[float] = None
+        self.last_check: Optional[float] = None
+        self.last_change: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.probes = 0
+        self.failures = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def ensure_started(self) -> None:
+        """Start the probe loop on the running event loop unless it already runs."""
+        if self._task is not None and not self._task.done():
+            if self._task.get_loop() is asyncio.get_running_loop():
+                return
+            self._task.cancel()
+        self._task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    async def probe(self) -> bool:
+        """Connect once, record the outcome and return whether C4D is reachable."""
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            self._record(False, None, str(e) or type(e).__name__)
+            return False
+        rtt = time.perf_counter() - start
+        writer.close()
+        self._record(True, rtt, None)
+        return True
+
+    def _record(self, up: bool, rtt: Optional[float], error: Optional[str]) -> None:
+        now = time.time()
+        self.probes += 1
+        if up != self.up:
+            if self.up is not None:
+                logger.info(
+                    "Cinema 4D at %s:%s is %s", self.host, self.port, "up" if up else "down"
+                )
+            self.last_change = now
+        self.up = up
+        self.last_check = now
+        self.last_error = error
+        if up:
+            self.last_rtt = rtt
+            self._latencies.append(rtt)
+        else:
+            self.failures += 1
+
+    def histogram(self) -> Dict[str, int]:
+        """Cumulative bucket counts (``le`` in ms) over the rolling window."""
+        counts = {}
+        samples = [rtt * 1000 for rtt in self._latencies]
+        for bound in LATENCY_BUCKETS_MS:
+            counts[str(bound)] = sum(1 for ms in samples if ms <= bound)
+        counts["+Inf"] = len(samples)
+        return counts
+
+    def _percentile(self, fraction: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state as a JSON-serialisable dict."""
+        return {
+            "up": self.up,
+            "last_rtt_ms": None if self.last_rtt is None else self.last_rtt * 1000,
+            "last_check": self.last_check,
+            "last_change": self.last_change,
+            "last_error": self.last_error,
+            "probes": self.probes,
+            "failures": self.failures,
+            "p50_ms": self._percentile(0.5),
+            "p95_ms": self._percentile(0.95),
+            "latency_histogram_ms": self.histogram(),
+        }
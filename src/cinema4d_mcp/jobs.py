@@ -0,0 +1,130 @@
+"""In-memory table of background jobs started with the ``submit_job`` tool."""
+
+__all__ = ["Job", "JobTable"]
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .config import C4D_JOB_TTL
+from .utils import logger
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = (
+    "queued",
+    "running",
+    "succeeded",
+    "failed",
+    "cancelled",
+)
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+@dataclass
+class Job:
+    id: str
+    command: str
+    status: str = QUEUED
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    endpoint: Optional[str] = None
+    # Last progress frame the plugin sent for the job's command
+    progress: Optional[Dict[str, Any]] = None
+    result: Any = None
+    error: Optional[str] = None
+    task: Optional["asyncio.Task[None]"] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED
+
+    def mark_running(self, endpoint: str) -> None:
+        self.status = RUNNING
+        self.started = time.time()
+        self.endpoint = endpoint
+
+    def update_progress(self, frame: Dict[str, Any]) -> None:
+        self.progress = {key: frame.get(key) for key in ("progress", "total", "phase")}
+
+    def status_dict(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "job_id": self.id,
+            "command": self.command,
+            "status": self.status,
+            "endpoint": self.endpoint,
+            "progress": self.progress,
+            "queued_seconds": round((self.started or now) - self.created, 3),
+            "running_seconds": (
+                None
+                if self.started is None
+                else round((self.finished or now) - self.started, 3)
+            ),
+            "error": self.error,
+        }
+
+
+class JobTable:
+    """
+    Jobs by id, each running as an asyncio task on the server's loop.
+
+    ``run`` coroutines decide where and when the work happens (waiting for an
+    endpoint's job slot first); the table only records state. A string result
+    is the tools' error convention and marks the job failed. Finished jobs
+    are evicted ``ttl`` seconds after they finished, whether or not anyone
+    fetched the result; running jobs are never evicted.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else C4D_JOB_TTL
+        self._jobs: Dict[str, Job] = {}
+
+    def submit(self, command: str, run: Callable[[Job], Awaitable[Any]]) -> Job:
+        self.evict_expired()
+        job = Job(id=uuid.uuid4().hex[:16], command=command)
+        self._jobs[job.id] = job
+        job.task = asyncio.ensure_future(self._run(job, run))
+        return job
+
+    async def _run(self, job: Job, run: Callable[[Job], Awaitable[Any]]) -> None:
+        try:
+            result = await run(job)
+        except asyncio.CancelledError:
+            job.status, job.error = CANCELLED, "Cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.command}) failed: {e}")
+            job.status, job.error = FAILED, str(e) or type(e).__name__
+        else:
+            if isinstance(result, str):
+                job.status, job.error = FAILED, result
+            else:
+                job.status, job.result = SUCCEEDED, result
+        finally:
+            job.finished = time.time()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self.evict_expired()
+        return self._jobs.get(job_id)
+
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        cutoff = (now if now is not None else time.time()) - self.ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.done and job.finished is not None and job.finished < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    def close(self) -> None:
+        """Cancel every unfinished job."""
+        for job in self._jobs.values():
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
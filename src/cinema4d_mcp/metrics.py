@@ -0,0 +1,231 @@
+"""In-process metrics rendered in the Prometheus text exposition format."""
+
+__all__ = [
+    "BYTES_RECEIVED",
+    "BYTES_SENT",
+    "COMMANDS",
+    "COMMAND_CANCELLATIONS",
+    "COMMAND_CONNECTION_FAILURES",
+    "COMMAND_PHASE_SECONDS",
+    "COMMAND_TIMEOUTS",
+    "CONNECT_SECONDS",
+    "CONTENT_TYPE",
+    "REQUESTS_IN_FLIGHT",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+]
+
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans sub-millisecond queries up to the long render timeout
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Sample lines for every label set; called with ``_lock`` held."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        if not self._values and not self.label_names:
+            return [f"{self.name} 0"]
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """Value that may go up and down, such as requests in flight."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values -> (per-bucket counts, sum)
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                key, ([0] * len(self.buckets), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        names = self.label_names + ("le",)
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Ordered collection of metrics rendered together by ``/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+COMMANDS = REGISTRY.register(
+    Counter(
+        "c4d_mcp_commands_total",
+        "Commands sent to Cinema 4D by outcome (ok, error, timeout, connection_error).",
+        ("command", "outcome"),
+    )
+)
+COMMAND_PHASE_SECONDS = REGISTRY.register(
+    Histogram(
+        "c4d_mcp_command_phase_seconds",
+        "Time spent per command phase: send, wait (for the reply) and parse.",
+        ("command", "phase"),
+    )
+)
+COMMAND_TIMEOUTS = REGISTRY.register(
+    Counter(
+        "c4d_mcp_command_timeouts_total",
+        "Commands that got no reply within their timeout.",
+        ("command",),
+    )
+)
+COMMAND_CONNECTION_FAILURES = REGISTRY.register(
+    Counter(
+        "c4d_mcp_command_connection_failures_total",
+        "Commands that failed because Cinema 4D was unreachable or dropped the connection.",
+        ("command",),
+    )
+)
+COMMAND_CANCELLATIONS = REGISTRY.register(
+    Counter(
+        "c4d_mcp_command_cancellations_total",
+        "Cancel messages sent for timed-out or cancelled commands.",
+    )
+)
+CONNECT_SECONDS = REGISTRY.register(
+    Histogram(
+        "c4d_mcp_connect_seconds",
+        "Time to open and negotiate a new plugin connection, by outcome.",
+        ("outcome",),
+    )
+)
+BYTES_SENT = REGISTRY.register(
+    Counter("c4d_mcp_bytes_sent_total", "Bytes written to the plugin.")
+)
+BYTES_RECEIVED = REGISTRY.register(
+    Counter("c4d_mcp_bytes_received_total", "Bytes read from the plugin.")
+)
+REQUESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge("c4d_mcp_requests_in_flight", "Commands sent and not yet answered.")
+)
@@ -0,0 +1,256 @@
+"""Local mirror of the plugin's object hierarchy, kept current by pushed events."""
+
+__all__ = ["MIRROR_FIELDS", "SceneMirror"]
+
+import asyncio
+import fnmatch
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import C4D_HEALTH_INTERVAL
+from .transport import AsyncC4DConnection, send_command
+from .utils import logger
+
+# Keys a mirrored object can answer; list_objects asks the plugin for anything else
+MIRROR_FIELDS = (
+    "id",
+    "name",
+    "path",
+    "parent",
+    "type",
+    "type_id",
+    "level",
+    "position",
+    "rotation",
+    "scale",
+    "material",
+)
+# Keys kept per object; path and level follow from the parent links
+_RECORD_FIELDS = ("id", "name", "parent", "type", "type_id", "position", "rotation", "scale", "material")
+
+
+class SceneMirror:
+    """
+    Copy of the active document's hierarchy, updated from ``scene_event`` frames.
+
+    ``ensure_started(pool)`` runs a task that sends ``subscribe_scene`` over the
+    pool's shared connection, loads the snapshot in the reply and then applies
+    the events the plugin pushes: added, removed, renamed, moved, transform,
+    material and reset. Events can be read off the socket before the snapshot
+    reply is processed, so they are buffered until it is loaded.
+
+    Lookups are only trustworthy while ``synced`` and not ``pending``: a tool
+    that changed the scene marks the mirror pending until the next event
+    arrives, since C4D reports the change after the command already replied.
+    """
+
+    def __init__(self, retry_interval: Optional[float] = None):
+        self.retry_interval = (
+            retry_interval if retry_interval is not None else C4D_HEALTH_INTERVAL
+        )
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        # Parent id (None for top level) -> child ids in hierarchy order
+        self.children: Dict[Optional[str], List[str]] = {None: []}
+        self.scene_version: Optional[str] = None
+        self.synced = False
+        self.pending = False
+        self.events_applied = 0
+        self.last_event: Optional[float] = None
+        self._buffer: Optional[List[Dict[str, Any]]] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    # --- Hierarchy state -------------------------------------------------
+
+    def load(self, records: Iterable[Dict[str, Any]], version: Optional[str]) -> None:
+        """Replace the mirror with a full snapshot in hierarchy order."""
+        self.objects = {}
+        self.children = {None: []}
+        for record in records:
+            self._add(record)
+        self.scene_version = version
+
+    def _add(self, record: Dict[str, Any]) -> None:
+        obj = {key: record.get(key) for key in _RECORD_FIELDS}
+        if obj["id"] in self.objects:
+            self._remove(obj["id"])
+        parent = obj["parent"] if obj["parent"] in self.objects else None
+        obj["parent"] = parent
+        self.objects[obj["id"]] = obj
+        self.children.setdefault(parent, []).append(obj["id"])
+
+    def _remove(self, obj_id: str) -> None:
+        obj = self.objects.pop(obj_id, None)
+        if obj is None:
+            return
+        siblings = self.children.get(obj["parent"])
+        if siblings and obj_id in siblings:
+            siblings.remove(obj_id)
+        for child in self.children.pop(obj_id, []):
+            self._remove(child)
+
+    def _move(self, obj_id: str, parent: Optional[str]) -> None:
+        obj = self.objects[obj_id]
+        siblings = self.children.get(obj["parent"])
+        if siblings and obj_id in siblings:
+            siblings.remove(obj_id)
+        obj["parent"] = parent if parent in self.objects else None
+        self.children.setdefault(obj["parent"], []).append(obj_id)
+
+    def apply(self, frame: Dict[str, Any]) -> None:
+        """Apply one ``scene_event`` frame."""
+        for event in frame.get("events") or ():
+            kind = event.get("event")
+            obj_id = event.get("id")
+            if kind == "reset":
+                self.load(event.get("objects") or (), self.scene_version)
+            elif kind == "added":
+                self._add(event)
+            elif kind == "removed":
+                self._remove(obj_id)
+            elif obj_id not in self.objects:
+                logger.debug(f"Scene event {kind} for unknown object {obj_id}")
+            elif kind == "moved":
+                self._move(obj_id, event.get("parent"))
+            elif kind == "renamed":
+                self.objects[obj_id]["name"] = event.get("name")
+            elif kind == "transform":
+                for key in ("position", "rotation", "scale"):
+                    self.objects[obj_id][key] = event.get(key)
+            elif kind == "material":
+                self.objects[obj_id]["material"] = event.get("material")
+        self.scene_version = frame.get("scene_version", self.scene_version)
+        self.events_applied += 1
+        self.last_event = time.time()
+        self.pending = False
+
+    def expect_change(self) -> None:
+        """A command may have edited the scene; distrust lookups until it is reported."""
+        self.pending = True
+
+    @property
+    def fresh(self) -> bool:
+        return self.synced and not self.pending
+
+    def _find_path(self, path: str) -> Optional[str]:
+        """Resolve "Group/Sub" like the plugin's ``root`` option."""
+        found = None
+        for segment in [part for part in path.split("/") if part]:
+            found = next(
+                (c for c in self.children.get(found, ()) if self.objects[c]["name"] == segment),
+                None,
+            )
+            if found is None:
+                return None
+        return found
+
+    def query(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        root: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        types: Optional[Iterable[str]] = None,
+        name: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Rows like the plugin's list_objects with the same filters, or None if
+        ``root`` does not exist.
+        """
+        wanted = tuple(fields) if fields else MIRROR_FIELDS
+        type_filter = {str(t).lower() for t in types or ()}
+        start: Optional[str] = None
+        base_path = ""
+        if root:
+            start = self._find_path(root)
+            if start is None:
+                return None
+            base_path = root.strip("/")
+        rows: List[Dict[str, Any]] = []
+
+        def walk(parent: Optional[str], depth: int, parent_path: str) -> None:
+            for obj_id in self.children.get(parent, ()):
+                obj = self.objects[obj_id]
+                path = f"{parent_path}/{obj['name']}" if parent_path else obj["name"]
+                if (not name or fnmatch.fnmatchcase(obj["name"], name)) and (
+                    not type_filter
+                    or str(obj["type"]).lower() in type_filter
+                    or str(obj["type_id"]) in type_filter
+                ):
+                    row = dict(obj, path=path, level=depth)
+                    rows.append({key: row.get(key) for key in wanted})
+                if max_depth is None or depth < max_depth:
+                    walk(obj_id, depth + 1, path)
+
+        walk(start, 0, base_path)
+        return rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "synced": self.synced,
+            "pending": self.pending,
+            "objects": len(self.objects),
+            "scene_version": self.scene_version,
+            "events_applied": self.events_applied,
+            "last_event": self.last_event,
+        }
+
+    # --- Subscription ----------------------------------------------------
+
+    def ensure_started(self, pool: Any) -> None:
+        """Start the subscription loop on the running event loop unless it already runs."""
+        if self._task is not None and not self._task.done():
+            if self._task.get_loop() is asyncio.get_running_loop():
+                return
+            self._task.cancel()
+        self._task = asyncio.ensure_future(self._run(pool))
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.synced = False
+
+    def _on_event(self, frame: Dict[str, Any]) -> None:
+        if self._buffer is not None:
+            self._buffer.append(frame)
+        else:
+            self.apply(frame)
+
+    async def _run(self, pool: Any) -> None:
+        while True:
+            connection = await pool.acquire()
+            try:
+                if (
+                    connection.connected
+                    and connection.multiplexed
+                    and "scene_events" in connection.capabilities
+                ):
+                    await self._subscribe(connection)
+                    # Stays subscribed until the plugin drops the connection;
+                    # wait() does not cancel the reader task when we are cancelled
+                    await asyncio.wait({connection.reader_task})
+                    logger.info("Scene mirror lost its subscription")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Scene subscription failed: {e}")
+            finally:
+                self.synced = False
+                self._buffer = None
+                if connection.event_handler == self._on_event:
+                    connection.event_handler = None
+                pool.release(connection)
+            await asyncio.sleep(self.retry_interval)
+
+    async def _subscribe(self, connection: AsyncC4DConnection) -> None:
+        self._buffer = []
+        connection.event_handler = self._on_event
+        reply = await send_command(connection, {"command": "subscribe_scene"})
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        self.load(reply.get("objects") or (), reply.get("scene_version"))
+        buffered, self._buffer = self._buffer, None
+        for frame in buffered:
+            self.apply(frame)
+        self.synced = True
+        self.pending = False
+        logger.info(f"Scene mirror synced ({len(self.objects)} objects)")
@@ -0,0 +1,171 @@
+"""Pooled, long-lived asyncio connections to the Cinema 4D plugin."""
+
+__all__ = ["C4DConnectionPool"]
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from .config import (
+    C4D_HOST,
+    C4D_PORT,
+    C4D_POOL_IDLE_TIMEOUT,
+    C4D_POOL_SIZE,
+    C4D_TIMEOUT_CHECK,
+)
+from .metrics import CONNECT_SECONDS
+from .transport import AsyncC4DConnection, negotiate_protocol
+from .utils import logger
+
+
+class C4DConnectionPool:
+    """
+    Keep plugin connections open between tool calls.
+
+    A plugin that negotiates protocol 2 gets a single shared connection that
+    every caller multiplexes over. Older plugins handle one command at a time
+    per socket, so those connections are handed out exclusively and returned
+    once the exchange completed. Idle connections are health-checked before
+    reuse and evicted after ``idle_timeout`` seconds; at most ``max_idle`` are
+    kept. Connections are bound to the event loop that opened them.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        max_idle: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+    ):
+        self.host = host if host is not None else C4D_HOST
+        self.port = port if port is not None else C4D_PORT
+        self.max_idle = max_idle if max_idle is not None else C4D_POOL_SIZE
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None else C4D_POOL_IDLE_TIMEOUT
+        )
+        self.connect_timeout = (
+            connect_timeout if connect_timeout is not None else C4D_TIMEOUT_CHECK
+        )
+        # Only touched from the event loop thread, so no lock is needed
+        self._idle: Deque[AsyncC4DConnection] = deque()
+        self._shared: Optional[AsyncC4DConnection] = None
+
+    @staticmethod
+    def _is_healthy(connection: AsyncC4DConnection) -> bool:
+        """An idle connection must be open, bound to this loop and not at EOF."""
+        if not connection.connected or not connection.reader or not connection.writer:
+            return False
+        if connection.loop is not asyncio.get_running_loop():
+            return False
+        return not (connection.writer.is_closing() or connection.reader.at_eof())
+
+    @staticmethod
+    def _close(connection: AsyncC4DConnection) -> None:
+        if connection.reader_task and not connection.reader_task.done():
+            connection.reader_task.cancel()
+        if connection.writer:
+            try:
+                connection.writer.close()
+            except (OSError, RuntimeError):
+                # RuntimeError: the owning event loop is already closed
+                pass
+        connection.reader = None
+        connection.writer = None
+        connection.connected = False
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop idle connections older than idle_timeout."""
+        while self._idle and now - self._idle[0].last_used > self.idle_timeout:
+            self._close(self._idle.popleft())
+            logger.debug("Evicted idle Cinema 4D connection")
+
+    def _discard(self, connection: AsyncC4DConnection) -> None:
+        if connection is self._shared:
+            self._shared = None
+        self._close(connection)
+
+    async def acquire(self) -> AsyncC4DConnection:
+        """Return the shared or a healthy pooled connection, or open a new one."""
+        if self._shared is not None:
+            if self._is_healthy(self._shared):
+                self._shared.reused = True
+                return self._shared
+            self._discard(self._shared)
+        self._evict_expired(time.monotonic())
+        while self._idle:
+            candidate = self._idle.pop()
+            if self._is_healthy(candidate):
+                candidate.reused = True
+                candidate.stale = False
+                if candidate.multiplexed:
+                    self._shared = candidate
+                return candidate
+            logger.debug("Discarding unhealthy pooled Cinema 4D connection")
+            self._close(candidate)
+        connection = await self._connect()
+        if connection.multiplexed and self._shared is None:
+            self._shared = connection
+        return connection
+
+    async def _connect(self) -> AsyncC4DConnection:
+        connection = AsyncC4DConnection(pool=self)
+        start = time.perf_counter()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                self.connect_timeout,
+            )
+            connection.reader = reader
+            connection.writer = writer
+            connection.loop = asyncio.get_running_loop()
+            await negotiate_protocol(connection, self.connect_timeout)
+            connection.connected = True
+            logger.info(
+                "✅ Connected to Cinema 4D at %s:%s (protocol %s)",
+                self.host,
+                self.port,
+                connection.protocol,
+            )
+            CONNECT_SECONDS.observe(time.perf_counter() - start, outcome="ok")
+        except Exception as e:
+            CONNECT_SECONDS.observe(time.perf_counter() - start, outcome="error")
+            logger.error("❌ Failed to connect to Cinema 4D: %s", e)
+            self._close(connection)
+        return connection
+
+    def release(self, connection: AsyncC4DConnection) -> None:
+        """Return a connection to the pool, or close it if it is no longer usable."""
+        if not connection.connected or not connection.writer or connection.stale:
+            self._discard(connection)
+            return
+        if connection is self._shared:
+            return
+        connection.last_used = time.monotonic()
+        self._evict_expired(connection.last_used)
+        if len(self._idle) < self.max_idle:
+            self._idle.append(connection)
+            return
+        self._close(connection)
+        logger.info("🔌 Disconnected from Cinema 4D")
+
+    async def replace(self, connection: AsyncC4DConnection) -> AsyncC4DConnection:
+        """Drop a stale connection and acquire another one in its place."""
+        self._discard(connection)
+        return await self.acquire()
+
+    def close(self) -> None:
+        """Close the shared and every idle connection."""
+        if self._shared is not None:
+            self._discard(self._shared)
+        while self._idle:
+            self._close(self._idle.popleft())
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
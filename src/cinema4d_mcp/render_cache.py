@@ -0,0 +1,156 @@
+"""Bounded LRU cache for encoded render images, with an optional disk spill.
+
+Used by the Cinema 4D plugin to answer repeated previews of an unchanged
+scene without calling ``RenderDocument`` again. Like ``framing`` it only
+uses the standard library and is loaded by file path from the plugin.
+"""
+
+__all__ = ["RenderCache", "make_render_key"]
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+
+def make_render_key(**parts: Any) -> str:
+    """Stable digest of everything that affects the rendered pixels."""
+    encoded = json.dumps(parts, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class RenderCache:
+    """
+    Thread-safe LRU of ``key -> (image bytes, metadata)``.
+
+    At most ``max_entries`` images totalling ``max_bytes`` are kept in memory.
+    With ``spill_dir`` set, entries evicted from memory are written there
+    (``<key>.bin`` plus ``<key>.json``) and found again on a later miss; the
+    directory is trimmed oldest-first to ``max_disk_bytes``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_dir: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Return ``(data, metadata)`` and mark it most recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            entry = self._load_spilled(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._insert(key, entry)
+            return entry
+
+    def put(self, key: str, data: bytes, metadata: Optional[Dict[str, Any]] = None) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._insert(key, (bytes(data), dict(metadata or {})))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _insert(self, key: str, entry: Tuple[bytes, Dict[str, Any]]) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[0])
+        self._entries[key] = entry
+        self._bytes += len(entry[0])
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._bytes -= len(old_entry[0])
+            self._spill(old_key, old_entry)
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.spill_dir, key)
+        return base + ".bin", base + ".json"
+
+    def _spill(self, key: str, entry: Tuple[bytes, Dict[str, Any]]) -> None:
+        if not self.spill_dir:
+            return
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(entry[1], f)
+            with open(data_path, "wb") as f:
+                f.write(entry[0])
+            self._trim_disk()
+        except OSError:
+            # A full or read-only disk only costs a future re-render
+            pass
+
+    def _load_spilled(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        if not self.spill_dir:
+            return None
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+            with open(data_path, "rb") as f:
+                data = f.read()
+        except (OSError, ValueError):
+            return None
+        return data, metadata
+
+    def _trim_disk(self) -> None:
+        files = []
+        total = 0
+        for entry in os.scandir(self.spill_dir):
+            if entry.name.endswith(".bin"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        files.sort()
+        while files and total > self.max_disk_bytes:
+            _, size, path = files.pop(0)
+            for stale in (path, path[: -len(".bin")] + ".json"):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+            total -= size
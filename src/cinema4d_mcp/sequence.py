@@ -0,0 +1,189 @@
+"""Frame-range rendering split into chunks and spread across plugin instances."""
+
+__all__ = [
+    "MAX_CHUNK_FRAMES",
+    "SequenceReport",
+    "frame_path",
+    "plan_chunks",
+    "run_sequence",
+]
+
+import asyncio
+import math
+import os
+import re
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .utils import logger
+
+# Upper bound for the default chunk size: long enough to amortize the
+# per-command RenderData setup, short enough that retries and load balancing
+# still have something to work with
+MAX_CHUNK_FRAMES = 10
+
+# Renders ``frames`` and returns the endpoint that did the work plus, per
+# frame, None on success or an error message
+RenderChunk = Callable[[List[int]], Awaitable[Tuple[str, Dict[int, Optional[str]]]]]
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+_HASHES = re.compile(r"#+")
+
+
+def frame_path(pattern: str, frame: int) -> str:
+    """
+    Expand an output pattern for one frame.
+
+    Understands ``{frame}`` format fields (``render_{frame:04d}.png``), a run
+    of ``#`` padded to its length (``render_####.png``) and printf-style
+    ``%04d``. A pattern without a placeholder gets ``_0001`` before the
+    extension so frames never overwrite each other. Braces that are not a
+    ``{frame}`` field (``{name}``, ``{0}``) are left as they are.
+    """
+    if "{" in pattern:
+        try:
+            return pattern.format(frame=frame)
+        except (KeyError, IndexError, ValueError):
+            pass
+    hashes = list(_HASHES.finditer(pattern))
+    if hashes:
+        last = hashes[-1]
+        return (
+            pattern[: last.start()]
+            + str(frame).zfill(len(last.group()))
+            + pattern[last.end() :]
+        )
+    if "%" in pattern:
+        try:
+            return pattern % frame
+        except (TypeError, ValueError):
+            pass
+    root, ext = os.path.splitext(pattern)
+    return f"{root}_{frame:04d}{ext}"
+
+
+def plan_chunks(frames: Sequence[int], chunk_size: int) -> List[List[int]]:
+    size = max(1, chunk_size)
+    return [list(frames[i : i + size]) for i in range(0, len(frames), size)]
+
+
+@dataclass
+class SequenceReport:
+    total: int
+    rendered: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+    retried: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def frames_per_minute(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.rendered) * 60.0 / self.elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "success": not self.failed,
+            "total_frames": self.total,
+            "rendered": len(self.rendered),
+            "skipped": len(self.skipped),
+            "failed": {str(frame): error for frame, error in sorted(self.failed.items())},
+            "retried_frames": self.retried,
+            "chunks": self.chunks,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "frames_per_minute": round(self.frames_per_minute, 2),
+            "frames_by_endpoint": dict(self.by_endpoint),
+        }
+
+
+async def run_sequence(
+    frames: Sequence[int],
+    output_pattern: str,
+    render_chunk: RenderChunk,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    retries: int = 2,
+    overwrite: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+) -> SequenceReport:
+    """
+    Render ``frames`` in chunks with ``workers`` concurrent chunk calls.
+
+    Frames whose output file already exists are skipped unless ``overwrite``;
+    the check uses this machine's view of the path, so it only sees renders
+    on storage the server shares with Cinema 4D. Frames that fail are
+    retried as a new chunk, which the caller's routing may send to another
+    instance, up to ``retries`` more times.
+    """
+    report = SequenceReport(total=len(frames))
+    pending = []
+    for frame in frames:
+        if not overwrite and os.path.exists(frame_path(output_pattern, frame)):
+            report.skipped.append(frame)
+        else:
+            pending.append(frame)
+    workers = max(1, min(workers, len(pending) or 1))
+    if chunk_size is None:
+        chunk_size = min(MAX_CHUNK_FRAMES, math.ceil(len(pending) / (workers * 2)) or 1)
+    queue: Deque[Tuple[List[int], int]] = deque(
+        (chunk, 0) for chunk in plan_chunks(pending, chunk_size)
+    )
+    by_endpoint: Counter = Counter()
+    done = len(report.skipped)
+
+    def progress() -> None:
+        if on_progress is not None:
+            on_progress({"progress": done, "total": report.total, "phase": "render"})
+
+    async def worker() -> None:
+        nonlocal done
+        # A worker that re-queues failed frames keeps looping, so retries
+        # never wait on a worker that already left
+        while queue:
+            chunk, attempt = queue.popleft()
+            report.chunks += 1
+            try:
+                endpoint, results = await render_chunk(chunk)
+            except Exception as e:
+                endpoint, results = "", {frame: str(e) or type(e).__name__ for frame in chunk}
+            failed = []
+            for frame in chunk:
+                error = results.get(frame, "No result for frame")
+                if error is None:
+                    report.rendered.append(frame)
+                    by_endpoint[endpoint] += 1
+                    done += 1
+                else:
+                    failed.append((frame, error))
+            if failed and attempt < retries:
+                logger.info(f"Retrying {len(failed)} failed frames: {failed[0][1]}")
+                report.retried += len(failed)
+                queue.append(([frame for frame, _ in failed], attempt + 1))
+            else:
+                for frame, error in failed:
+                    report.failed[frame] = error
+                    done += 1
+            progress()
+
+    start = time.perf_counter()
+    progress()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    report.elapsed = time.perf_counter() - start
+    report.rendered.sort()
+    report.by_endpoint = dict(by_endpoint)
+    return report
@@ -1,185 +1,323 @@
 """Cinema 4D MCP Server."""
 
-import socket
+import asyncio
 import json
 import math
-import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+import os
+from typing import Any, Callable, Dict, List, Optional, Union
 from contextlib import asynccontextmanager
 
-from mcp.server.fastmcp import FastMCP, Context
-from starlette.routing import Route
-from starlette.responses import JSONResponse
+from mcp.server.fastmcp import FastMCP, Context, Image
 
-from .config import (
-    C4D_HOST,
-    C4D_PORT,
-    C4D_TIMEOUT_CHECK,
-    C4D_TIMEOUT_DEFAULT,
-    C4D_TIMEOUT_LONG,
-    LONG_TIMEOUT_COMMANDS,
-)
-from .utils import logger, check_c4d_connection
+from .cache import SceneCache
+from .config import C4D_MCP_TRANSPORT, READ_ONLY_COMMANDS
+from .endpoints import Endpoint, EndpointPool
+from .jobs import Job, JobTable
+from .metrics import COMMAND_CONNECTION_FAILURES, COMMANDS, CONTENT_TYPE, REGISTRY
+from .mirror import MIRROR_FIELDS, SceneMirror
+from .sequence import frame_path, run_sequence
+from .transport import AsyncC4DConnection, send_command
+from .transport import C4DConnection, send_to_c4d  # noqa: F401  (blocking API)
+from .utils import logger
 
 # Constants
 MSG_NOT_CONNECTED = "❌ Not connected to Cinema 4D"
-RECV_CHUNK_SIZE = 8192
+MSG_UNKNOWN_JOB = "Unknown or expired job id"
+# Protocol messages and per-connection state, not commands a job can run
+JOB_EXCLUDED_COMMANDS = ("hello", "cancel", "subscribe_scene", "unsubscribe_scene")
+IMAGE_TRANSPORTS = ("binary", "file", "base64")
 
 
-@dataclass
-class C4DConnection:
-    sock: Optional[socket.socket] = None
-    connected: bool = False
+# Every configured plugin instance, with its connection pool and health monitor
+_endpoints = EndpointPool()
+# get_scene_info / list_objects results, revalidated against the scene version
+_scene_cache = SceneCache()
+# Background jobs from submit_job, polled with job_status / job_result
+_jobs = JobTable()
 
 
-@asynccontextmanager
-async def c4d_connection_context():
-    """Asynchronous context manager for Cinema 4D connection."""
-    connection = C4DConnection()
+def _session_of(ctx: Optional[Context]) -> Any:
+    """The MCP session a tool call belongs to, or None outside a request."""
+    if ctx is None:
+        return None
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(C4D_TIMEOUT_CHECK)
-        sock.connect((C4D_HOST, C4D_PORT))
-        connection.sock = sock
-        connection.connected = True
-        logger.info("✅ Connected to Cinema 4D at %s:%s", C4D_HOST, C4D_PORT)
-        yield connection
-    except Exception as e:
-        logger.error("❌ Failed to connect to Cinema 4D: %s", e)
-        connection.connected = False
+        return ctx.request_context.session
+    except (AttributeError, LookupError, ValueError):
+        return None
+
+
+def _pick_endpoint(session: Any, stateless: bool) -> Endpoint:
+    """Scene edits use the session's instance, stateless work the least-loaded one."""
+    if stateless:
+        return _endpoints.least_loaded()
+    return _endpoints.sticky(session)
+
+
+@asynccontextmanager
+async def c4d_connection_context(ctx: Optional[Context] = None, stateless: bool = False):
+    """
+    Asynchronous context manager for a pooled Cinema 4D connection.
+
+    Scene edits use the instance bound to the caller's session; ``stateless``
+    work goes to the least-loaded instance instead.
+    """
+    endpoint = _pick_endpoint(_session_of(ctx), stateless)
+    async with _endpoints.connection(endpoint) as connection:
         yield connection
-    finally:
-        if connection.sock:
-            connection.sock.close()
-            logger.info("🔌 Disconnected from Cinema 4D")
 
 
-def _run_command(connection: C4DConnection, command: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
-    """Execute a command and return either an error string or the response dict."""
-    if not connection.connected or not connection.sock:
+def _progress_forwarder(ctx: Optional[Context]) -> Optional[Callable[[Dict[str, Any]], None]]:
+    """Relay plugin progress frames to the MCP client as progress notifications."""
+    if ctx is None:
+        return None
+
+    async def report(frame: Dict[str, Any]) -> None:
+        try:
+            await ctx.report_progress(frame.get("progress") or 0, frame.get("total"))
+        except Exception as e:
+            logger.debug(f"Could not forward progress: {e}")
+
+    def forward(frame: Dict[str, Any]) -> None:
+        if frame.get("phase"):
+            logger.debug(f"Progress: {frame.get('phase')} {frame.get('progress')}")
+        asyncio.ensure_future(report(frame))
+
+    return forward
+
+
+def _ignore_progress(frame: Dict[str, Any]) -> None:
+    """Progress callback that only keeps a command's deadline moving."""
+
+
+async def _run_command(
+    connection: AsyncC4DConnection,
+    command: Dict[str, Any],
+    ctx: Optional[Context] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Union[str, Dict[str, Any]]:
+    """
+    Execute a command and return either an error string or the response dict.
+    With ``ctx``, plugin progress frames are forwarded to the client;
+    ``on_progress`` receives them instead when given.
+    """
+    if not connection.connected:
+        COMMANDS.inc(command=command.get("command", ""), outcome="connection_error")
+        COMMAND_CONNECTION_FAILURES.inc(command=command.get("command", ""))
         return MSG_NOT_CONNECTED
-    response = send_to_c4d(connection, command)
+    if on_progress is None:
+        on_progress = _progress_forwarder(ctx)
+    response = await send_command(connection, command, on_progress)
+    if (
+        connection.stale
+        and connection.reused
+        and command.get("command") in READ_ONLY_COMMANDS
+    ):
+        # The plugin dropped a pooled socket (e.g. it was restarted) before
+        # replying. It may have run the command first, so only read-only
+        # commands are sent again, once, on a fresh connection.
+        logger.info("Pooled connection was stale, reconnecting to Cinema 4D")
+        pool = connection.pool
+        retry = await pool.replace(connection)
+        try:
+            if retry.connected:
+                response = await send_command(retry, command, on_progress)
+        finally:
+            pool.release(retry)
+    if command.get("command") not in READ_ONLY_COMMANDS:
+        _scene_cache.invalidate()
+        _endpoints.expect_scene_change()
     if "error" in response:
         return f"❌ Error: {response['error']}"
     return response
 
 
-def send_to_c4d(connection: C4DConnection, command: Dict[str, Any]) -> Dict[str, Any]:
-    """Send a command to Cinema 4D and get the response with improved timeout handling."""
-    if not connection.connected or not connection.sock:
-        return {"error": "Not connected to Cinema 4D"}
-
-    # Set appropriate timeout based on command type
-    command_type = command.get("command", "")
-
-    # Long-running operations use configurable long timeout
-    if command_type in LONG_TIMEOUT_COMMANDS:
-        timeout = C4D_TIMEOUT_LONG
-        logger.info(f"Using extended timeout ({timeout}s) for {command_type}")
-    else:
-        timeout = C4D_TIMEOUT_DEFAULT
+async def _run_cached_command(
+    connection: AsyncC4DConnection, command: Dict[str, Any]
+) -> Union[str, Dict[str, Any]]:
+    """
+    Execute a read-only command, answering from the scene cache when the
+    plugin reports the same scene version the cached result was taken at.
+    """
+    if "scene_version" not in connection.capabilities:
+        return await _run_command(connection, command)
+    # Instances may hold the same file, so results are kept per instance, and
+    # per set of options (list_objects filters and projections)
+    key = command["command"]
+    options = {name: value for name, value in command.items() if name != "command"}
+    if options:
+        key = f"{key}:{json.dumps(options, sort_keys=True)}"
+    if connection.pool is not None:
+        key = f"{connection.pool.address}/{key}"
+    if _scene_cache.version_of(key) is not None:
+        reply = await _run_command(connection, {"command": "scene_version"})
+        if isinstance(reply, dict):
+            cached = _scene_cache.get(key, reply.get("scene_version"))
+            if cached is not None:
+                logger.debug(f"Scene cache hit for {key}")
+                return cached
+    generation = _scene_cache.generation
+    result = await _run_command(connection, command)
+    if isinstance(result, dict):
+        _scene_cache.put(key, result.get("scene_version"), result, generation)
+    return result
+
+
+def _image_transport(
+    connection: AsyncC4DConnection, requested: Optional[str]
+) -> Optional[str]:
+    """Pick how the plugin should return images; None keeps the legacy base64."""
+    if requested:
+        return requested
+    if "attachments" in connection.capabilities:
+        return "binary"
+    return None
+
+
+def _check_image_transport(image_transport: Optional[str]) -> Optional[str]:
+    """Return an error message for an unknown image_transport value."""
+    if image_transport and image_transport not in IMAGE_TRANSPORTS:
+        return f"❌ Error: image_transport must be one of {', '.join(IMAGE_TRANSPORTS)}"
+    return None
+
+
+def _pop_image(info: Dict[str, Any]) -> Optional[Image]:
+    """
+    Take a binary or file-based render image out of a response section.
 
+    Raw bytes (an attachment) and files named by ``image_path`` become an
+    ``Image``; temporary files written by the plugin are deleted afterwards.
+    Base64 data URIs are left in place for legacy clients.
+    """
+    image_format = info.get("format") or "png"
+    data = info.get("image_data")
+    if isinstance(data, bytes):
+        del info["image_data"]
+        info["image_size"] = len(data)
+        return Image(data=data, format=image_format)
+    path = info.get("image_path")
+    if not path:
+        return None
     try:
-        # Convert command to JSON and send it
-        command_json = json.dumps(command) + "\n"  # Add newline as message delimiter
-        logger.debug(f"Sending command: {command_type}")
-        connection.sock.sendall(command_json.encode("utf-8"))
-
-        # Set socket timeout
-        connection.sock.settimeout(timeout)
-
-        # Receive response
-        response_data = b""
-        start_time = time.time()
-        max_time = start_time + timeout
-
-        # Log for long-running operations
-        if command_type in LONG_TIMEOUT_COMMANDS:
-            logger.info(
-                f"Waiting for response from {command_type} (timeout: {timeout}s)"
-            )
-
-        while time.time() < max_time:
-            try:
-                chunk = connection.sock.recv(RECV_CHUNK_SIZE)
-                if not chunk:
-                    # If we receive an empty chunk, the connection might be closed
-                    if not response_data:
-                        logger.error(
-                            f"Connection closed by Cinema 4D during {command_type}"
-                        )
-                        return {
-                            "error": f"Connection closed by Cinema 4D during {command_type}"
-                        }
-                    break
-
-                response_data += chunk
-
-                # For long operations, log progress on data receipt
-                elapsed = time.time() - start_time
-                if command_type in LONG_TIMEOUT_COMMANDS and elapsed > 5:
-                    logger.debug(
-                        f"Received partial data for {command_type} ({len(response_data)} bytes, {elapsed:.1f}s elapsed)"
-                    )
-
-                if b"\n" in chunk:  # Message complete when we see a newline
-                    logger.debug(f"Received complete response for {command_type}")
-                    break
-
-            except socket.timeout:
-                logger.error(f"Socket timeout while receiving data for {command_type}")
-                return {
-                    "error": f"Timeout waiting for response from Cinema 4D ({timeout}s) for {command_type}"
-                }
-
-        # Parse and return response
-        if not response_data:
-            logger.error(f"No response received from Cinema 4D for {command_type}")
-            return {"error": f"No response received from Cinema 4D for {command_type}"}
-
-        response_text = response_data.decode("utf-8").strip()
-
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        info["image_error"] = f"Could not read {path}: {e}"
+        return None
+    if info.pop("image_path_temporary", False):
+        del info["image_path"]
         try:
-            return json.loads(response_text)
-        except json.JSONDecodeError as e:
-            # If JSON parsing fails, log the exact response for debugging
-            logger.error(f"Failed to parse JSON response: {str(e)}")
-            logger.error(f"Raw response (first 200 chars): {response_text[:200]}...")
-            return {"error": f"Invalid response from Cinema 4D: {str(e)}"}
-
-    except socket.timeout:
-        logger.error(f"Socket timeout during {command_type} ({timeout}s)")
-        return {
-            "error": f"Timeout communicating with Cinema 4D ({timeout}s) for {command_type}"
-        }
-    except Exception as e:
-        logger.error(f"Communication error during {command_type}: {str(e)}")
-        return {"error": f"Communication error: {str(e)}"}
+            os.remove(path)
+        except OSError:
+            pass
+    info["image_size"] = len(data)
+    return Image(data=data, format=image_format)
+
+
+def _with_image(
+    result: Dict[str, Any], info: Dict[str, Any]
+) -> Union[Dict[str, Any], List[Any]]:
+    """Return ``[result, Image]`` when ``info`` carries a binary image, else ``result``."""
+    image = _pop_image(info)
+    if image is None:
+        return result
+    return [result, image]
 
 
 async def homepage(request):
     """Handle homepage requests to check if server is running."""
-    c4d_available = check_c4d_connection(C4D_HOST, C4D_PORT)
+    from starlette.responses import JSONResponse
+
+    _endpoints.ensure_started()
+    primary = _endpoints.primary
     return JSONResponse(
         {
             "status": "ok",
-            "cinema4d_connected": c4d_available,
-            "host": C4D_HOST,
-            "port": C4D_PORT,
+            "cinema4d_connected": _endpoints.up,
+            "host": primary.host,
+            "port": primary.port,
+            "health": primary.health.snapshot(),
+            "endpoints": _endpoints.snapshot(),
         }
     )
 
 
-# Initialize our FastMCP server
-mcp = FastMCP(title="Cinema4D", routes=[Route("/", endpoint=homepage)])
+async def metrics(request):
+    """Expose command counters and latency histograms for Prometheus."""
+    from starlette.responses import Response
+
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@asynccontextmanager
+async def lifespan(app: FastMCP):
+    """Run the health monitors for as long as the server is up."""
+    _endpoints.ensure_started()
+    yield {}
+
+
+def http_routes() -> list:
+    """Routes for ``/`` and ``/metrics``; starlette is only imported for HTTP transport."""
+    from starlette.routing import Route
+
+    return [Route("/", endpoint=homepage), Route("/metrics", endpoint=metrics)]
+
+
+def sse_app():
+    """The app ``FastMCP.run_sse_async`` builds, with ``http_routes()`` mounted."""
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.routing import Mount, Route
+
+    sse = SseServerTransport("/messages/")
+    server = mcp._mcp_server
+
+    async def handle_sse(request):
+        async with sse.connect_sse(
+            request.scope, request.receive, request._send
+        ) as streams:
+            await server.run(
+                streams[0], streams[1], server.create_initialization_options()
+            )
+
+    return Starlette(
+        debug=mcp.settings.debug,
+        routes=[
+            Route("/sse", endpoint=handle_sse),
+            Mount("/messages/", app=sse.handle_post_message),
+            *http_routes(),
+        ],
+    )
+
+
+async def run_sse_async() -> None:
+    """Serve ``sse_app()`` with uvicorn, like ``FastMCP.run_sse_async``."""
+    import uvicorn
+
+    config = uvicorn.Config(
+        sse_app(),
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        log_level=mcp.settings.log_level.lower(),
+    )
+    await uvicorn.Server(config).serve()
+
+
+# Initialize our FastMCP server. FastMCP 1.4 has no routes= argument, so
+# mcp.run("sse") is pointed at sse_app() to serve / and /metrics
+mcp = FastMCP(title="Cinema4D", lifespan=lifespan)
+mcp.run_sse_async = run_sse_async
+
+
+def run(transport: Optional[str] = None) -> None:
+    """Run the server over ``transport`` (``C4D_MCP_TRANSPORT``, default stdio)."""
+    mcp.run(transport or C4D_MCP_TRANSPORT)
 
 
 @mcp.tool()
 async def get_scene_info(ctx: Context) -> str:
     """Get information about the current Cinema 4D scene."""
-    async with c4d_connection_context() as connection:
-        result = _run_command(connection, {"command": "get_scene_info"})
+    async with c4d_connection_context(ctx) as connection:
+        result = await _run_cached_command(connection, {"command": "get_scene_info"})
         if isinstance(result, str):
             return result
         scene_info = result.get("scene_info", {})
@@ -219,8 +357,8 @@ async def add_primitive(
         command["position"] = position
     if size:
         command["size"] = size
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -234,21 +372,102 @@ async def modify_object(
         object_name: Name of the object to modify
         properties: Dictionary of properties to modify (position, rotation, scale, etc.)
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(
             connection,
             {"command": "modify_object", "object_name": object_name, "properties": properties},
         )
 
 
+def _mirror_objects(mirror: SceneMirror, command: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+    """Answer list_objects from the scene mirror without contacting Cinema 4D."""
+    rows = mirror.query(
+        command.get("fields"),
+        command.get("root"),
+        command.get("max_depth"),
+        command.get("types"),
+        command.get("name"),
+    )
+    if rows is None:
+        return f"❌ Error: Root object not found: {command.get('root')}"
+    return {"objects": rows, "scene_version": mirror.scene_version, "source": "mirror"}
+
+
+async def _stream_objects(
+    connection: AsyncC4DConnection, command: Dict[str, Any], path: str
+) -> Union[str, Dict[str, Any]]:
+    """Write list_objects rows to ``path`` as NDJSON while the plugin streams them."""
+    if "list_objects_stream" not in connection.capabilities:
+        return "❌ Error: The Cinema 4D plugin does not support streaming list_objects"
+    path = os.path.abspath(os.path.expanduser(path))
+    written = 0
+    with open(path, "w", encoding="utf-8") as out:
+
+        def write_rows(frame: Dict[str, Any]) -> None:
+            nonlocal written
+            if frame.get("type") != "rows":
+                return
+            out.writelines(json.dumps(row) + "\n" for row in frame.get("rows") or ())
+            written += len(frame.get("rows") or ())
+
+        result = await _run_command(
+            connection, dict(command, stream=True), on_progress=write_rows
+        )
+    if isinstance(result, dict):
+        result = dict(result, path=path, rows_written=written)
+    return result
+
+
 @mcp.tool()
-async def list_objects(ctx: Context) -> str:
-    """List all objects in the current Cinema 4D scene."""
-    async with c4d_connection_context() as connection:
-        result = _run_command(connection, {"command": "list_objects"})
-        if isinstance(result, str):
-            return result
-        return result
+async def list_objects(
+    fields: Optional[List[str]] = None,
+    root: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    types: Optional[List[str]] = None,
+    name: Optional[str] = None,
+    stream_to: Optional[str] = None,
+    ctx: Context = None,
+) -> Any:
+    """
+    List objects in the current Cinema 4D scene.
+
+    Args:
+        fields: Only return these keys per object, e.g. ["name", "path"]; available:
+            id, name, path, type, type_id, level, position, rotation, scale and
+            MoGraph details (cloner_mode, count, strength)
+        root: Only list descendants of this object, as a name path like "Set/Props"
+        max_depth: Do not descend below this level (0 = top level or root's children)
+        types: Only objects whose type name (e.g. "Cube", "Null") or type id matches
+        name: Only objects whose name matches this glob, e.g. "Light*"
+        stream_to: Write one JSON object per line to this file while the plugin
+            streams them, and return only the count (for very large scenes)
+    """
+    command: Dict[str, Any] = {"command": "list_objects"}
+    if fields:
+        command["fields"] = fields
+    if root:
+        command["root"] = root
+    if max_depth is not None:
+        command["max_depth"] = max_depth
+    if types:
+        command["types"] = types
+    if name:
+        command["name"] = name
+    mirror = _pick_endpoint(_session_of(ctx), False).mirror
+    mirrored = bool(fields) and set(fields) <= set(MIRROR_FIELDS) and not stream_to
+    if mirrored and mirror.fresh:
+        return _mirror_objects(mirror, command)
+    async with c4d_connection_context(ctx) as connection:
+        if stream_to:
+            return await _stream_objects(connection, command, stream_to)
+        if mirrored and mirror.synced:
+            # Edited since the last event: one cheap round trip tells whether
+            # the mirror already reflects the current scene
+            reply = await _run_command(connection, {"command": "scene_version"})
+            if isinstance(reply, dict) and reply.get("scene_version") == mirror.scene_version:
+                mirror.pending = False
+                return _mirror_objects(mirror, command)
+        return await _run_cached_command(connection, command)
 
 
 @mcp.tool()
@@ -271,8 +490,8 @@ async def create_material(
         command["color"] = color
     if properties:
         command["properties"] = properties
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -284,8 +503,8 @@ async def apply_material(material_name: str, object_name: str, ctx: Context) ->
         material_name: Name of the material to apply
         object_name: Name of the object to apply the material to
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(
             connection,
             {"command": "apply_material", "material_name": material_name, "object_name": object_name},
         )
@@ -296,8 +515,11 @@ async def render_frame(
     output_path: Optional[str] = None,
     width: Optional[int] = None,
     height: Optional[int] = None,
+    image_transport: Optional[str] = None,
+    frame: Optional[int] = None,
+    scene_file: Optional[str] = None,
     ctx: Context = None,
-) -> str:
+) -> Any:
     """
     Render the current frame.
 
@@ -305,7 +527,15 @@ async def render_frame(
         output_path: Optional path to save the rendered image
         width: Optional render width in pixels
         height: Optional render height in pixels
+        image_transport: Also return the rendered image: "binary" (raw frame),
+            "file" (read from output_path) or "base64" (inline data URI)
+        frame: Optional frame number to render instead of the current one
+        scene_file: Optional saved scene to render instead of the open document;
+            runs on the least-loaded Cinema 4D instance
     """
+    error = _check_image_transport(image_transport)
+    if error:
+        return error
     command = {"command": "render_frame"}
     if output_path:
         command["output_path"] = output_path
@@ -313,8 +543,92 @@ async def render_frame(
         command["width"] = width
     if height:
         command["height"] = height
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    if image_transport:
+        command["image_transport"] = image_transport
+    if frame is not None:
+        command["frame"] = frame
+    if scene_file:
+        command["scene_file"] = scene_file
+    async with c4d_connection_context(ctx, stateless=bool(scene_file)) as connection:
+        result = await _run_command(connection, command, ctx)
+    if isinstance(result, str) or not isinstance(result.get("render_info"), dict):
+        return result
+    return _with_image(result, result["render_info"])
+
+
+@mcp.tool()
+async def render_sequence(
+    start: int,
+    end: int,
+    step: int,
+    output_pattern: str,
+    scene_file: Optional[str] = None,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    retries: int = 2,
+    overwrite: bool = False,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Render an animation range to numbered image files.
+
+    Args:
+        start: First frame
+        end: Last frame (inclusive)
+        step: Frame increment
+        output_pattern: Output path per frame, e.g. "/renders/shot_####.png" or
+            "/renders/shot_{frame:04d}.png"
+        scene_file: Optional saved scene to render instead of the open document;
+            chunks are then spread over every available Cinema 4D instance
+        width: Optional render width in pixels
+        height: Optional render height in pixels
+        chunk_size: Frames per plugin call (default: split evenly, at most 10)
+        retries: How often a failed frame is retried
+        overwrite: Re-render frames whose output file already exists
+    """
+    if step < 1 or end < start:
+        return {"error": "Frame range needs start <= end and step >= 1"}
+    frames = list(range(start, end + 1, step))
+    # The open document lives on the session's instance; saved scenes can go anywhere
+    stateless = bool(scene_file)
+    workers = (
+        sum(1 for endpoint in _endpoints.endpoints if endpoint.available) if stateless else 1
+    )
+
+    async def render_chunk(chunk: List[int]):
+        command = {
+            "command": "render_frames",
+            "frames": chunk,
+            "output_paths": [frame_path(output_pattern, frame) for frame in chunk],
+        }
+        if scene_file:
+            command["scene_file"] = scene_file
+        if width:
+            command["width"] = width
+        if height:
+            command["height"] = height
+        async with c4d_connection_context(ctx, stateless=stateless) as connection:
+            # A chunk can take several long timeouts; the plugin's per-frame
+            # progress and heartbeats keep extending its deadline. run_sequence
+            # reports progress to the client by frames done instead.
+            result = await _run_command(connection, command, on_progress=_ignore_progress)
+            address = connection.pool.address if connection.pool else ""
+        if isinstance(result, str):
+            return address, {frame: result for frame in chunk}
+        return address, {item["frame"]: item.get("error") for item in result.get("frames", [])}
+
+    report = await run_sequence(
+        frames,
+        output_pattern,
+        render_chunk,
+        workers=workers,
+        chunk_size=chunk_size,
+        retries=max(0, retries),
+        overwrite=overwrite,
+        on_progress=_progress_forwarder(ctx),
+    )
+    return report.as_dict()
 
 
 @mcp.tool()
@@ -330,8 +644,8 @@ async def set_keyframe(
         value: Value to set at the keyframe
         frame: Frame number to set the keyframe at
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(
             connection,
             {
                 "command": "set_keyframe",
@@ -354,8 +668,8 @@ async def save_scene(file_path: Optional[str] = None, ctx: Context = None) -> st
     command = {"command": "save_scene"}
     if file_path:
         command["file_path"] = file_path
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -366,8 +680,8 @@ async def load_scene(file_path: str, ctx: Context) -> str:
     Args:
         file_path: Path to the scene file to load
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, {"command": "load_scene", "file_path": file_path})
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, {"command": "load_scene", "file_path": file_path})
 
 
 @mcp.tool()
@@ -384,8 +698,8 @@ async def create_mograph_cloner(
     command = {"command": "create_mograph_cloner", "mode": cloner_type}
     if name:
         command["cloner_name"] = name
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -408,8 +722,8 @@ async def add_effector(
         command["effector_name"] = name
     if target:
         command["cloner_name"] = target
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -437,8 +751,8 @@ async def apply_mograph_fields(
     if parameters:
         command["parameters"] = parameters
     logger.debug("Sending apply_mograph_fields: %s", command)
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command, ctx)
 
 
 @mcp.tool()
@@ -449,8 +763,8 @@ async def create_soft_body(object_name: str, ctx: Context = None) -> str:
     Args:
         object_name: Name of the object to convert to a soft body
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(
             connection, {"command": "create_soft_body", "object_name": object_name}
         )
 
@@ -466,8 +780,8 @@ async def apply_dynamics(
         object_name: Name of the object to apply dynamics to
         dynamics_type: Type of dynamics to apply (rigid, soft)
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(
             connection,
             {"command": "apply_dynamics", "object_name": object_name, "type": dynamics_type},
         )
@@ -487,8 +801,8 @@ async def create_abstract_shape(
     command = {"command": "create_abstract_shape", "shape_type": shape_type}
     if name:
         command["object_name"] = name
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -513,8 +827,8 @@ async def create_camera(
         command["position"] = position
     if properties:
         command["properties"] = properties
-    async with c4d_connection_context() as connection:
-        result = _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        result = await _run_command(connection, command)
         if isinstance(result, str):
             return {"error": result}
         return result
@@ -534,8 +848,8 @@ async def create_light(
     command = {"command": "create_light", "type": light_type}
     if name:
         command["object_name"] = name
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -558,8 +872,8 @@ async def apply_shader(
         command["material_name"] = material_name
     if object_name:
         command["object_name"] = object_name
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -595,8 +909,8 @@ async def animate_camera(
             orbit_frames.append(i * 10)
         command["positions"] = orbit_positions
         command["frames"] = orbit_frames
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -607,8 +921,8 @@ async def execute_python_script(script: str, ctx: Context) -> str:
     Args:
         script: Python code to execute in Cinema 4D
     """
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, {"command": "execute_python", "script": script})
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, {"command": "execute_python", "script": script})
 
 
 @mcp.tool()
@@ -625,8 +939,8 @@ async def group_objects(
     command = {"command": "group_objects", "object_names": object_names}
     if group_name:
         command["group_name"] = group_name
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        return await _run_command(connection, command)
 
 
 @mcp.tool()
@@ -634,16 +948,22 @@ async def render_preview(
     width: Optional[int] = None,
     height: Optional[int] = None,
     frame: Optional[int] = None,
+    image_transport: Optional[str] = None,
     ctx: Context = None,
-) -> str:
+) -> Any:
     """
-    Render the current view and return a base64-encoded preview image.
+    Render the current view and return a preview image.
 
     Args:
         width: Optional preview width in pixels
         height: Optional preview height in pixels
         frame: Optional frame number to render
+        image_transport: "binary" (default when the plugin supports it), "file"
+            (shared temp file, same machine only) or "base64" (inline data URI)
     """
+    error = _check_image_transport(image_transport)
+    if error:
+        return error
     command = {"command": "render_preview"}
     if width:
         command["width"] = width
@@ -651,31 +971,156 @@ async def render_preview(
         command["height"] = height
     if frame is not None:
         command["frame"] = frame
-    async with c4d_connection_context() as connection:
-        result = _run_command(connection, command)
-        if isinstance(result, str):
-            return result
-        if "image_data" not in result:
-            return "❌ Error: No image data returned from Cinema 4D"
+    async with c4d_connection_context(ctx) as connection:
+        transport = _image_transport(connection, image_transport)
+        if transport:
+            command["image_transport"] = transport
+        result = await _run_command(connection, command, ctx)
+    if isinstance(result, str):
         return result
+    if "image_data" not in result and "image_path" not in result:
+        return "❌ Error: No image data returned from Cinema 4D"
+    return _with_image(result, result)
 
 
 @mcp.tool()
 async def snapshot_scene(
-    file_path: Optional[str] = None, include_assets: bool = False, ctx: Context = None
-) -> str:
+    file_path: Optional[str] = None,
+    include_assets: bool = False,
+    image_transport: Optional[str] = None,
+    ctx: Context = None,
+) -> Any:
     """
     Create a snapshot of the current scene state.
 
     Args:
         file_path: Optional path to save the snapshot
         include_assets: Whether to include external assets in the snapshot
+        image_transport: How to return the preview render: "binary" (default
+            when the plugin supports it), "file" or "base64"
     """
+    error = _check_image_transport(image_transport)
+    if error:
+        return error
     command = {"command": "snapshot_scene", "include_assets": include_assets}
     if file_path:
         command["file_path"] = file_path
-    async with c4d_connection_context() as connection:
-        return _run_command(connection, command)
+    async with c4d_connection_context(ctx) as connection:
+        transport = _image_transport(connection, image_transport)
+        if transport:
+            command["image_transport"] = transport
+        result = await _run_command(connection, command, ctx)
+    if isinstance(result, str) or not isinstance(result.get("render"), dict):
+        return result
+    return _with_image(result, result["render"])
+
+
+@mcp.tool()
+async def batch_commands(
+    commands: List[Dict[str, Any]], stop_on_error: bool = False, ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Run several plugin commands in one round trip and one undo step.
+
+    Args:
+        commands: Ordered list of plugin commands, each a dict with a "command" key
+            and that command's fields, e.g.
+            {"command": "add_primitive", "type": "cube", "object_name": "Box"},
+            {"command": "modify_object", "object_name": "Box", "properties": {"position": [0, 100, 0]}},
+            {"command": "apply_material", "material_name": "Red", "object_name": "Box"}
+        stop_on_error: Stop at the first command that returns an error
+    """
+    for index, item in enumerate(commands):
+        if not isinstance(item, dict) or not item.get("command"):
+            return {"error": f"Batch item {index} must be an object with a 'command' key"}
+    command = {
+        "command": "batch_commands",
+        "commands": commands,
+        "stop_on_error": stop_on_error,
+    }
+    async with c4d_connection_context(ctx) as connection:
+        result = await _run_command(connection, command, ctx)
+        if isinstance(result, str):
+            return {"error": result}
+        return result
+
+
+def _job_output(result: Dict[str, Any]) -> Union[Dict[str, Any], List[Any]]:
+    """Turn a binary or file image in a job's response into an MCP image."""
+    for section in ("render_info", "render"):
+        if isinstance(result.get(section), dict):
+            return _with_image(result, result[section])
+    return _with_image(result, result)
+
+
+@mcp.tool()
+async def submit_job(
+    command: str, args: Optional[Dict[str, Any]] = None, ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Start a plugin command in the background and return its job id at once.
+
+    Poll with job_status and fetch the outcome with job_result. Jobs queue
+    per Cinema 4D instance, so heavy work runs a few at a time instead of
+    piling onto the main thread. Finished jobs are kept for a limited time.
+
+    Args:
+        command: Plugin command to run, e.g. "render_frame" or "snapshot_scene"
+        args: That command's fields, e.g. {"output_path": "/tmp/f.png", "width": 1920};
+            with "scene_file" the job may run on any instance
+    """
+    if not command or command in JOB_EXCLUDED_COMMANDS:
+        return {"error": f"Cannot run '{command}' as a job"}
+    payload = dict(args or {}, command=command)
+    session = _session_of(ctx)
+    stateless = bool(payload.get("scene_file"))
+
+    async def run(job: Job) -> Any:
+        endpoint = _pick_endpoint(session, stateless)
+        async with _endpoints.job_slot(endpoint):
+            job.mark_running(endpoint.name)
+            async with _endpoints.connection(endpoint) as connection:
+                result = await _run_command(
+                    connection, payload, on_progress=job.update_progress
+                )
+        if isinstance(result, dict):
+            return _job_output(result)
+        return result
+
+    job = _jobs.submit(command, run)
+    return job.status_dict()
+
+
+@mcp.tool()
+async def job_status(job_id: str, ctx: Context = None) -> Dict[str, Any]:
+    """
+    Report a background job's state: queued, running, succeeded, failed or cancelled.
+
+    Args:
+        job_id: Id returned by submit_job
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        return {"error": MSG_UNKNOWN_JOB, "job_id": job_id}
+    return job.status_dict()
+
+
+@mcp.tool()
+async def job_result(job_id: str, ctx: Context = None) -> Any:
+    """
+    Return a finished job's result, or its status while it is still running.
+
+    Args:
+        job_id: Id returned by submit_job
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        return {"error": MSG_UNKNOWN_JOB, "job_id": job_id}
+    if not job.done:
+        return job.status_dict()
+    if job.error is not None:
+        return {"error": job.error, "job_id": job_id, "status": job.status}
+    return job.result
 
 
 @mcp.resource("c4d://primitives")
@@ -736,21 +1181,40 @@ def get_material_types() -> str:
 
 
 @mcp.resource("c4d://status")
-def get_connection_status() -> str:
+async def get_connection_status() -> str:
     """Get the current connection status to Cinema 4D."""
-    is_connected = check_c4d_connection(C4D_HOST, C4D_PORT)
-    status = (
-        "✅ Connected to Cinema 4D" if is_connected else "❌ Not connected to Cinema 4D"
-    )
+    _endpoints.ensure_started()
+    up = _endpoints.up
+    if up is None:
+        status = "⏳ Checking connection to Cinema 4D"
+    elif up:
+        status = "✅ Connected to Cinema 4D"
+    else:
+        status = "❌ Not connected to Cinema 4D"
+
+    sections = []
+    for endpoint in _endpoints.endpoints:
+        health = endpoint.health.snapshot()
+        state = {None: "checking", True: "up", False: "down"}[health["up"]]
+        last_rtt = health["last_rtt_ms"]
+        p95 = health["p95_ms"]
+        sections.append(
+            f"""
+## {endpoint.name} ({state})
+- **Host**: {endpoint.host}
+- **Port**: {endpoint.port}
+- **In flight**: {endpoint.in_flight}
+- **Last RTT**: {"n/a" if last_rtt is None else f"{last_rtt:.1f} ms"}
+- **p95 RTT**: {"n/a" if p95 is None else f"{p95:.1f} ms"}
+- **Probes / failures**: {health["probes"]} / {health["failures"]}
+- **Scene mirror**: {"synced" if endpoint.mirror.synced else "not synced"}, {len(endpoint.mirror.objects)} objects
+"""
+        )
 
     return f"""
 # Cinema 4D Connection Status
 {status}
-
-## Connection Details
-- **Host**: {C4D_HOST}
-- **Port**: {C4D_PORT}
-"""
+{"".join(sections)}"""
 
 
 mcp_app = mcp
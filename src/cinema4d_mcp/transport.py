@@ -0,0 +1,547 @@
+"""Wire transport between the MCP server and the Cinema 4D plugin.
+
+Commands are newline-delimited JSON objects; each command gets exactly one
+newline-delimited JSON response. Protocol 1 is strict lockstep per socket.
+Protocol 2, negotiated with a ``hello`` command, tags every command and
+response with an ``id`` so many commands can be in flight on one connection
+and answered out of order. Plugins that predate the handshake reply with an
+"Unknown command" error and the connection stays on protocol 1.
+
+A response may list ``attachments`` (``[{"field": "image_data", "length": N,
+"mime": "image/png"}]``); each is sent right after the JSON header as a binary
+frame and is stored as ``bytes`` under its (dotted) field name. Plugins
+advertise this with the ``attachments`` capability in their ``hello`` reply.
+
+While a protocol 2 command runs, plugins with the ``progress`` capability may
+send ``{"id": N, "type": "progress", "progress": 42.0, "total": 100,
+"phase": "render"}`` frames when the command asked for them with
+``"progress": true``. They go to the caller's ``on_progress`` callback and
+push the response deadline out, so a render that keeps reporting is not
+timed out. Streaming commands send their results the same way as
+``{"id": N, "type": "rows", "rows": [...]}`` frames before the final
+response, so neither side holds the whole result.
+
+A connection that sent ``subscribe_scene`` to a plugin with the
+``scene_events`` capability also receives unsolicited ``{"type":
+"scene_event", "events": [...], "scene_version": ...}`` frames without an
+id; they go to the connection's ``event_handler`` (see ``mirror``).
+
+The ``hello`` command also offers codecs (``msgpack`` when installed, then
+``json``) and a compression threshold; the plugin answers with the codec it
+picked. Messages in a binary codec or zlib-compressed travel as ``#MSG``
+frames, so either side decodes any frame by its header (see ``codec``).
+
+When a multiplexed command times out or its caller is cancelled, the server
+sends ``{"command": "cancel", "target": N}`` (no id, no reply) to plugins with
+the ``cancel`` capability; the plugin drops the command if it has not started
+and breaks a running render.
+
+``send_command`` is the asyncio client used by the tools. ``send_to_c4d`` is
+the blocking protocol 1 equivalent for plain sockets.
+"""
+
+__all__ = [
+    "AsyncC4DConnection",
+    "C4DConnection",
+    "PROTOCOL_VERSION",
+    "command_timeout",
+    "negotiate_protocol",
+    "send_command",
+    "send_to_c4d",
+]
+
+import asyncio
+import itertools
+import json
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional, Tuple
+
+from .config import (
+    C4D_COMPRESS_THRESHOLD,
+    C4D_MAX_FRAME_SIZE,
+    C4D_TIMEOUT_DEFAULT,
+    C4D_TIMEOUT_LONG,
+    LONG_TIMEOUT_COMMANDS,
+)
+from .codec import (
+    CodecError,
+    available_codecs,
+    choose_codec,
+    decode_message,
+    encode_message,
+)
+from .framing import BinaryPayload, FrameDecoder
+from .metrics import (
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    COMMANDS,
+    COMMAND_CANCELLATIONS,
+    COMMAND_CONNECTION_FAILURES,
+    COMMAND_PHASE_SECONDS,
+    COMMAND_TIMEOUTS,
+    REQUESTS_IN_FLIGHT,
+)
+from .utils import logger
+
+RECV_CHUNK_SIZE = 65536
+ProgressCallback = Callable[[Dict[str, Any]], None]
+# Frames sent while a command runs; they carry the request id but are not its reply
+INTERIM_FRAME_TYPES = ("progress", "rows")
+# Highest protocol this server speaks
+PROTOCOL_VERSION = 2
+
+
+def _new_decoder() -> FrameDecoder:
+    return FrameDecoder(max_frame_size=C4D_MAX_FRAME_SIZE)
+
+
+@dataclass
+class C4DConnection:
+    sock: Optional[socket.socket] = None
+    connected: bool = False
+    decoder: FrameDecoder = field(default_factory=_new_decoder)
+
+
+@dataclass
+class AsyncC4DConnection:
+    reader: Optional[asyncio.StreamReader] = None
+    writer: Optional[asyncio.StreamWriter] = None
+    connected: bool = False
+    # Set when the connection came out of the pool rather than a fresh connect
+    reused: bool = False
+    # Set when the peer vanished before any reply byte arrived
+    stale: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    # C4DConnectionPool that opened the connection; stale retries go through it
+    pool: Optional[Any] = None
+    # Negotiated protocol; 2 means shared, multiplexed by request id
+    protocol: int = 1
+    capabilities: FrozenSet[str] = frozenset()
+    # Negotiated message codec and the size above which messages are zlibbed
+    codec: str = "json"
+    compress_threshold: Optional[int] = None
+    # Request id -> future resolved with (response, parse seconds)
+    pending: Dict[int, "asyncio.Future[Tuple[Dict[str, Any], float]]"] = field(
+        default_factory=dict
+    )
+    # Request id -> callback for interim progress frames
+    progress_handlers: Dict[int, ProgressCallback] = field(default_factory=dict)
+    # Receives pushed scene_event frames once subscribed
+    event_handler: Optional[ProgressCallback] = None
+    request_ids: Iterator[int] = field(default_factory=lambda: itertools.count(1))
+    reader_task: Optional["asyncio.Task[None]"] = None
+    write_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    decoder: FrameDecoder = field(default_factory=_new_decoder)
+
+    @property
+    def multiplexed(self) -> bool:
+        return self.protocol >= 2
+
+
+def command_timeout(command_type: str) -> int:
+    """Return the response timeout in seconds for a command."""
+    if command_type in LONG_TIMEOUT_COMMANDS:
+        logger.info(f"Using extended timeout ({C4D_TIMEOUT_LONG}s) for {command_type}")
+        return C4D_TIMEOUT_LONG
+    return C4D_TIMEOUT_DEFAULT
+
+
+def _encode_command(
+    command: Dict[str, Any], connection: Optional[AsyncC4DConnection] = None
+) -> bytes:
+    """Frame a command in the connection's negotiated codec (JSON by default)."""
+    if connection is None:
+        payload = encode_message(command)
+    else:
+        payload = encode_message(
+            command, connection.codec, connection.compress_threshold
+        )
+    BYTES_SENT.inc(len(payload))
+    return payload
+
+
+def _decode_response(response_data: bytes) -> Dict[str, Any]:
+    """
+    Parse one response frame in whatever codec it declares; raises
+    json.JSONDecodeError or CodecError on garbage.
+    """
+    try:
+        return decode_message(response_data)
+    except (json.JSONDecodeError, CodecError):
+        # If parsing fails, log the exact response for debugging
+        raw = bytes(response_data[:200]).decode("utf-8", errors="replace")
+        logger.error(f"Raw response (first 200 chars): {raw}...")
+        raise
+
+
+async def negotiate_protocol(connection: AsyncC4DConnection, timeout: float) -> int:
+    """
+    Ask the plugin for the highest common protocol and start the response
+    reader for multiplexed connections. Raises on timeout or disconnect.
+    """
+    connection.writer.write(
+        _encode_command(
+            {
+                "command": "hello",
+                "protocol": PROTOCOL_VERSION,
+                "id": 0,
+                "codecs": available_codecs(),
+                "compress_threshold": C4D_COMPRESS_THRESHOLD,
+            }
+        )
+    )
+    await asyncio.wait_for(connection.writer.drain(), timeout)
+    reply, _ = await asyncio.wait_for(_read_response(connection), timeout)
+    # Old plugins answer {"error": "Unknown command: hello"}
+    connection.protocol = int(reply.get("protocol", 1)) if "error" not in reply else 1
+    connection.capabilities = frozenset(reply.get("capabilities", ()))
+    if "codec" in reply:
+        connection.codec = choose_codec([reply["codec"]])
+        connection.compress_threshold = reply.get("compress_threshold")
+    if connection.multiplexed:
+        connection.reader_task = asyncio.ensure_future(_read_responses(connection))
+    logger.debug(
+        f"Negotiated protocol {connection.protocol} ({connection.codec}) with Cinema 4D"
+    )
+    return connection.protocol
+
+
+async def _read_frame(connection: AsyncC4DConnection) -> bytes:
+    """Return the next complete frame, reading from the stream as needed."""
+    while True:
+        frame = connection.decoder.next_frame()
+        if frame is not None:
+            return frame
+        data = await connection.reader.read(RECV_CHUNK_SIZE)
+        if not data:
+            raise asyncio.IncompleteReadError(connection.decoder.pending, None)
+        BYTES_RECEIVED.inc(len(data))
+        connection.decoder.feed(data)
+
+
+def _set_field(response: Dict[str, Any], path: str, value: Any) -> None:
+    """Assign ``value`` at a dotted path such as ``render.image_data``."""
+    *parents, leaf = path.split(".")
+    target = response
+    for key in parents:
+        target = target.setdefault(key, {})
+    target[leaf] = value
+
+
+async def _read_response(
+    connection: AsyncC4DConnection,
+) -> Tuple[Dict[str, Any], float]:
+    """
+    Read one JSON response frame plus the binary attachment frames it
+    announces. Returns the response and the seconds spent parsing the JSON.
+    """
+    frame = await _read_frame(connection)
+    start = time.perf_counter()
+    response = _decode_response(frame)
+    parse_seconds = time.perf_counter() - start
+    for attachment in response.pop("attachments", None) or ():
+        payload = await _read_frame(connection)
+        if not isinstance(payload, BinaryPayload):
+            raise ValueError(f"Expected binary frame for {attachment.get('field')}")
+        _set_field(response, attachment["field"], payload)
+    return response, parse_seconds
+
+
+async def _read_responses(connection: AsyncC4DConnection) -> None:
+    """Route multiplexed responses to their waiting requests by id."""
+    error: Exception = ConnectionResetError("Connection closed by Cinema 4D")
+    try:
+        while True:
+            response, parse_seconds = await _read_response(connection)
+            if response.get("type") == "scene_event":
+                if connection.event_handler is not None:
+                    connection.event_handler(response)
+                continue
+            if response.get("type") in INTERIM_FRAME_TYPES:
+                handler = connection.progress_handlers.get(response.get("id"))
+                if handler is not None:
+                    handler(response)
+                continue
+            future = connection.pending.pop(response.pop("id", None), None)
+            if future is None:
+                # Reply to a request that already timed out
+                logger.debug("Dropping response for an abandoned request")
+            elif not future.done():
+                future.set_result((response, parse_seconds))
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        if not isinstance(e, asyncio.IncompleteReadError):
+            error = e
+    finally:
+        connection.connected = False
+        for future in connection.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        connection.pending.clear()
+
+
+async def send_command(
+    connection: AsyncC4DConnection,
+    command: Dict[str, Any],
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    """
+    Send a command over an asyncio stream and await the response without
+    blocking the loop. ``on_progress`` receives the plugin's progress frames
+    when the connection supports them.
+    """
+    if not connection.connected or not connection.writer:
+        return {"error": "Not connected to Cinema 4D"}
+
+    command_type = command.get("command", "")
+    timeout = command_timeout(command_type)
+    if command_type in LONG_TIMEOUT_COMMANDS:
+        logger.info(f"Waiting for response from {command_type} (timeout: {timeout}s)")
+    logger.debug(f"Sending command: {command_type}")
+    REQUESTS_IN_FLIGHT.inc()
+    try:
+        if connection.multiplexed:
+            if "progress" not in connection.capabilities:
+                on_progress = None
+            response = await _exchange_multiplexed(
+                connection, command, timeout, on_progress
+            )
+        else:
+            response = await _exchange_lockstep(connection, command, timeout)
+        logger.debug(f"Received complete response for {command_type}")
+        COMMANDS.inc(
+            command=command_type, outcome="error" if "error" in response else "ok"
+        )
+        return response
+
+    except asyncio.CancelledError:
+        if not connection.multiplexed:
+            # The abandoned reply is still on its way, as after a timeout
+            connection.connected = False
+        raise
+    except asyncio.TimeoutError:
+        if not connection.multiplexed:
+            # A late reply would desync the stream, so never reuse this connection
+            connection.connected = False
+        COMMANDS.inc(command=command_type, outcome="timeout")
+        COMMAND_TIMEOUTS.inc(command=command_type)
+        logger.error(f"Timeout waiting for {command_type} ({timeout}s)")
+        return {
+            "error": f"Timeout waiting for response from Cinema 4D ({timeout}s) for {command_type}"
+        }
+    except asyncio.IncompleteReadError as e:
+        connection.connected = False
+        if not e.partial:
+            connection.stale = True
+            _count_connection_failure(command_type)
+            logger.error(f"Connection closed by Cinema 4D during {command_type}")
+            return {"error": f"Connection closed by Cinema 4D during {command_type}"}
+        COMMANDS.inc(command=command_type, outcome="error")
+        try:
+            return _decode_response(e.partial)
+        except (json.JSONDecodeError, CodecError) as decode_error:
+            return {"error": f"Invalid response from Cinema 4D: {str(decode_error)}"}
+    except (json.JSONDecodeError, CodecError) as e:
+        connection.connected = False
+        COMMANDS.inc(command=command_type, outcome="error")
+        logger.error(f"Failed to parse JSON response: {str(e)}")
+        return {"error": f"Invalid response from Cinema 4D: {str(e)}"}
+    except Exception as e:
+        connection.connected = False
+        if isinstance(e, (BrokenPipeError, ConnectionResetError)):
+            connection.stale = True
+        _count_connection_failure(command_type)
+        logger.error(f"Communication error during {command_type}: {str(e)}")
+        return {"error": f"Communication error: {str(e)}"}
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+
+
+def _count_connection_failure(command_type: str) -> None:
+    COMMANDS.inc(command=command_type, outcome="connection_error")
+    COMMAND_CONNECTION_FAILURES.inc(command=command_type)
+
+
+def _observe_phases(
+    command_type: str, send: float, wait: float, parse: float
+) -> None:
+    COMMAND_PHASE_SECONDS.observe(send, command=command_type, phase="send")
+    COMMAND_PHASE_SECONDS.observe(wait, command=command_type, phase="wait")
+    COMMAND_PHASE_SECONDS.observe(parse, command=command_type, phase="parse")
+
+
+async def _exchange_lockstep(
+    connection: AsyncC4DConnection, command: Dict[str, Any], timeout: float
+) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + timeout
+    connection.writer.write(_encode_command(command, connection))
+    await asyncio.wait_for(connection.writer.drain(), timeout)
+    sent = loop.time()
+    response, parse_seconds = await asyncio.wait_for(
+        _read_response(connection), max(0.0, deadline - sent)
+    )
+    _observe_phases(
+        command.get("command", ""),
+        sent - start,
+        loop.time() - sent - parse_seconds,
+        parse_seconds,
+    )
+    return response
+
+
+async def _exchange_multiplexed(
+    connection: AsyncC4DConnection,
+    command: Dict[str, Any],
+    timeout: float,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + timeout
+    request_id = next(connection.request_ids)
+    future = loop.create_future()
+    connection.pending[request_id] = future
+    last_progress = start
+    if on_progress is not None:
+        command = dict(command, progress=True)
+
+        def handle_progress(frame: Dict[str, Any]) -> None:
+            nonlocal last_progress
+            last_progress = loop.time()
+            on_progress(frame)
+
+        connection.progress_handlers[request_id] = handle_progress
+    try:
+        async with connection.write_lock:
+            connection.writer.write(
+                _encode_command(dict(command, id=request_id), connection)
+            )
+            await asyncio.wait_for(connection.writer.drain(), timeout)
+        sent = loop.time()
+        while True:
+            try:
+                # shield: a timeout here must not cancel the future we retry on
+                response, parse_seconds = await asyncio.wait_for(
+                    asyncio.shield(future), max(0.0, deadline - loop.time())
+                )
+                break
+            except asyncio.TimeoutError:
+                if last_progress + timeout <= loop.time():
+                    raise
+                # Still reporting progress: allow another full timeout of silence
+                deadline = last_progress + timeout
+        _observe_phases(
+            command.get("command", ""),
+            sent - start,
+            loop.time() - sent - parse_seconds,
+            parse_seconds,
+        )
+        return response
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        _send_cancel(connection, request_id)
+        raise
+    finally:
+        connection.pending.pop(request_id, None)
+        connection.progress_handlers.pop(request_id, None)
+
+
+def _send_cancel(connection: AsyncC4DConnection, request_id: int) -> None:
+    """Tell the plugin to abandon a request; no reply is expected."""
+    if "cancel" not in connection.capabilities or not connection.connected:
+        return
+    try:
+        # One buffered write cannot interleave with another frame, and a
+        # cancelled task must not await the drain
+        connection.writer.write(
+            _encode_command({"command": "cancel", "target": request_id}, connection)
+        )
+        COMMAND_CANCELLATIONS.inc()
+        logger.info(f"Sent cancel for request {request_id}")
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Could not send cancel for request {request_id}: {e}")
+
+
+def send_to_c4d(connection: C4DConnection, command: Dict[str, Any]) -> Dict[str, Any]:
+    """Blocking counterpart of ``send_command`` for a plain socket connection."""
+    if not connection.connected or not connection.sock:
+        return {"error": "Not connected to Cinema 4D"}
+
+    command_type = command.get("command", "")
+    timeout = command_timeout(command_type)
+
+    REQUESTS_IN_FLIGHT.inc()
+    try:
+        logger.debug(f"Sending command: {command_type}")
+        start = time.perf_counter()
+        connection.sock.sendall(_encode_command(command))
+        sent = time.perf_counter()
+        connection.sock.settimeout(timeout)
+
+        decoder = connection.decoder
+        response_data = decoder.next_frame()
+        max_time = time.time() + timeout
+        while response_data is None and time.time() < max_time:
+            try:
+                chunk = connection.sock.recv(RECV_CHUNK_SIZE)
+            except socket.timeout:
+                COMMANDS.inc(command=command_type, outcome="timeout")
+                COMMAND_TIMEOUTS.inc(command=command_type)
+                logger.error(f"Socket timeout while receiving data for {command_type}")
+                return {
+                    "error": f"Timeout waiting for response from Cinema 4D ({timeout}s) for {command_type}"
+                }
+            if not chunk:
+                # Peer closed; a final unterminated frame is still parsed
+                response_data = decoder.pending
+                decoder.clear()
+                if not response_data:
+                    _count_connection_failure(command_type)
+                    logger.error(f"Connection closed by Cinema 4D during {command_type}")
+                    return {
+                        "error": f"Connection closed by Cinema 4D during {command_type}"
+                    }
+                break
+            BYTES_RECEIVED.inc(len(chunk))
+            decoder.feed(chunk)
+            response_data = decoder.next_frame()
+
+        if not response_data:
+            COMMANDS.inc(command=command_type, outcome="timeout")
+            COMMAND_TIMEOUTS.inc(command=command_type)
+            logger.error(f"No response received from Cinema 4D for {command_type}")
+            return {"error": f"No response received from Cinema 4D for {command_type}"}
+
+        received = time.perf_counter()
+        try:
+            response = _decode_response(response_data)
+        except (json.JSONDecodeError, CodecError) as e:
+            COMMANDS.inc(command=command_type, outcome="error")
+            logger.error(f"Failed to parse JSON response: {str(e)}")
+            return {"error": f"Invalid response from Cinema 4D: {str(e)}"}
+        _observe_phases(
+            command_type, sent - start, received - sent, time.perf_counter() - received
+        )
+        COMMANDS.inc(
+            command=command_type, outcome="error" if "error" in response else "ok"
+        )
+        return response
+
+    except socket.timeout:
+        COMMANDS.inc(command=command_type, outcome="timeout")
+        COMMAND_TIMEOUTS.inc(command=command_type)
+        logger.error(f"Socket timeout during {command_type} ({timeout}s)")
+        return {
+            "error": f"Timeout communicating with Cinema 4D ({timeout}s) for {command_type}"
+        }
+    except Exception as e:
+        _count_connection_failure(command_type)
+        logger.error(f"Communication error during {command_type}: {str(e)}")
+        return {"error": f"Communication error: {str(e)}"}
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
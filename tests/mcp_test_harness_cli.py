@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+"""
+Headless MCP test harness: record and replay plugin traffic.
+
+``record`` runs a proxy between the MCP server and the Cinema 4D plugin. Point
+the server at the proxy (``C4D_PORT``) and every command it forwards is
+appended to a JSONL file in the ``mcp_test_harness.jsonl`` format, plus
+underscore-prefixed keys the plugin never sees:
+
+    {"command": "add_primitive", "type": "cube", "object_name": "Box",
+     "_session": 0, "_ts": 1.2345, "_elapsed_ms": 12.3, "_response": {...}}
+
+``_ts`` is when the command was sent, in seconds since recording started,
+``_session`` numbers the server's connections and ``_response`` is the reply
+with long strings reduced to a length and checksum and binary
+attachments to their size.
+
+``replay`` sends a recording (or a hand-written harness file) to a plugin,
+one connection per recorded session, and prints a timing report per
+command. ``--speed original`` keeps the recorded gaps between commands,
+``--speed max`` sends each command as soon as the previous reply arrived and
+a number scales the gaps (``2`` is twice as fast). ``--sessions N`` replays
+every recorded session N times in parallel. Responses are compared with the
+recorded ones, ignoring values that change between runs (GUIDs, scene
+versions, timings, image data); GUIDs and names from earlier replies are
+substituted into later commands like the GUI harness does. The exit status
+is 1 when a response differs or a command got slower than
+``--max-slowdown`` times its recorded median.
+
+Run from the repository root:
+
+    python tests/mcp_test_harness_cli.py record session.jsonl --listen 5556 --target 127.0.0.1:5555
+    python tests/mcp_test_harness_cli.py replay session.jsonl [--target 127.0.0.1:5555] \\
+        [--speed original|max|2] [--sessions 4] [--max-slowdown 1.5] [--json]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import socket
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Dict, IO, Iterable, List, Optional, Sequence, Tuple
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_root, "src"))
+
+from cinema4d_mcp.codec import decode_message  # noqa: E402
+from cinema4d_mcp.config import C4D_HOST, C4D_PORT  # noqa: E402
+from cinema4d_mcp.framing import BinaryPayload, FrameDecoder  # noqa: E402
+from cinema4d_mcp.pool import C4DConnectionPool  # noqa: E402
+from cinema4d_mcp.transport import send_command  # noqa: E402
+
+# Keys that differ between otherwise identical runs
+VOLATILE_KEYS = frozenset(
+    {
+        "guid",
+        "scene_version",
+        "render_time",
+        "time",
+        "timestamp",
+        "image_data",
+        "image_base64",
+        "traceback",
+        "main_thread",
+    }
+)
+# Protocol fields the transport adds; never part of a recorded command
+TRANSPORT_KEYS = ("id", "progress")
+# Response keys holding the object a command created (see mcp_test_harness_gui.py)
+CONTEXT_KEYS = (
+    "object",
+    "light",
+    "camera",
+    "material",
+    "cloner",
+    "effector",
+    "field",
+    "shape",
+    "group",
+)
+# Strings longer than this are recorded as a length and checksum
+MAX_RECORDED_STRING = 256
+# Differences listed per response before the rest are summarized
+MAX_LISTED_DIFFS = 5
+
+
+def summarize(value: Any) -> Any:
+    """Copy a response with long strings and bytes reduced to their size."""
+    if isinstance(value, dict):
+        return {key: summarize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [summarize(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        # Recordings never see attachment bytes, only their announced length
+        return f"<{len(value)} bytes>"
+    if isinstance(value, str) and len(value) > MAX_RECORDED_STRING:
+        return f"<{len(value)} chars {zlib.crc32(value.encode('utf-8')):08x}>"
+    return value
+
+
+def normalize(value: Any) -> Any:
+    """Summarize a response and drop its volatile keys, for comparison."""
+    if isinstance(value, dict):
+        return {
+            key: normalize(item)
+            for key, item in value.items()
+            if key not in VOLATILE_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    return summarize(value)
+
+
+def diff(recorded: Any, replayed: Any, path: str = "") -> List[str]:
+    """List the paths where two normalized responses differ."""
+    where = path or "<response>"
+    if isinstance(recorded, dict) and isinstance(replayed, dict):
+        changes = []
+        for key in sorted(set(recorded) | set(replayed), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in replayed:
+                changes.append(f"{child}: missing")
+            elif key not in recorded:
+                changes.append(f"{child}: unexpected {json.dumps(replayed[key])[:80]}")
+            else:
+                changes.extend(diff(recorded[key], replayed[key], child))
+        return changes
+    if isinstance(recorded, list) and isinstance(replayed, list):
+        if len(recorded) != len(replayed):
+            return [f"{where}: {len(recorded)} items, now {len(replayed)}"]
+        changes = []
+        for index, (old, new) in enumerate(zip(recorded, replayed)):
+            changes.extend(diff(old, new, f"{path}[{index}]"))
+        return changes
+    if recorded != replayed:
+        return [f"{where}: {json.dumps(recorded)[:80]} -> {json.dumps(replayed)[:80]}"]
+    return []
+
+
+def split_entry(entry: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Separate the command sent to the plugin from the recording's metadata."""
+    command = {key: value for key, value in entry.items() if not key.startswith("_")}
+    meta = {key: value for key, value in entry.items() if key.startswith("_")}
+    return command, meta
+
+
+def load_script(path: str) -> List[Dict[str, Any]]:
+    """Read a harness or recording file, skipping blank lines."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class GuidMap:
+    """
+    Names and recorded GUIDs that stand for objects of the current run.
+
+    Hand-written harness files refer to objects by requested name, which is
+    mapped to the GUID of the object created for it. Recordings carry the
+    GUIDs the plugin handed out back then; each is mapped to the GUID found at
+    the same place in the replayed reply.
+    """
+
+    def __init__(self):
+        self.mapping: Dict[str, str] = {}
+
+    def substitute(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: self.substitute(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self.substitute(item) for item in data]
+        if isinstance(data, str):
+            return self.mapping.get(data, data)
+        return data
+
+    def capture(self, response: Any, recorded: Any = None) -> None:
+        if not isinstance(response, dict):
+            return
+        if recorded is not None:
+            # Recorded commands already say what the server sent; only GUIDs move
+            self._capture_recorded(response, recorded)
+            return
+        for key in CONTEXT_KEYS:
+            info = response.get(key)
+            if not isinstance(info, dict):
+                continue
+            guid = info.get("guid")
+            requested, actual = info.get("requested_name"), info.get("actual_name")
+            if guid and requested:
+                self.mapping[requested] = guid
+                if actual and actual != requested:
+                    self.mapping.setdefault(actual, guid)
+            break
+
+    def _capture_recorded(self, response: Any, recorded: Any) -> None:
+        # Same path in both replies: the old GUID now names the new object
+        if isinstance(response, dict) and isinstance(recorded, dict):
+            old, new = recorded.get("guid"), response.get("guid")
+            if isinstance(old, str) and isinstance(new, str) and old != new:
+                self.mapping[old] = new
+            for key, value in response.items():
+                if key in recorded:
+                    self._capture_recorded(value, recorded[key])
+        elif isinstance(response, list) and isinstance(recorded, list):
+            for new, old in zip(response, recorded):
+                self._capture_recorded(new, old)
+
+
+# --- Recording ---------------------------------------------------------------
+
+
+class _Exchange:
+    """Pairs the commands of one proxied connection with their replies."""
+
+    def __init__(self, proxy: "RecordingProxy", session: int):
+        self.proxy = proxy
+        self.session = session
+        # Protocol 2 commands by request id; lockstep commands in order
+        self.by_id: Dict[Any, Tuple[Optional[Dict[str, Any]], float]] = {}
+        self.in_order: deque = deque()
+        self.lock = threading.Lock()
+
+    def on_command(self, message: Dict[str, Any]) -> None:
+        name = message.get("command")
+        if name == "cancel":
+            return
+        started = time.perf_counter()
+        # The handshake is replayed by the transport itself
+        entry = None
+        if name != "hello":
+            entry = {k: v for k, v in message.items() if k not in TRANSPORT_KEYS}
+        with self.lock:
+            if "id" in message:
+                self.by_id[message["id"]] = (entry, started)
+            else:
+                self.in_order.append((entry, started))
+
+    def on_reply(self, message: Dict[str, Any]) -> None:
+        if message.get("type") in ("scene_event", "progress", "rows"):
+            return
+        request_id = message.pop("id", None)
+        with self.lock:
+            if request_id in self.by_id:
+                pending = self.by_id.pop(request_id)
+            elif self.in_order:
+                pending = self.in_order.popleft()
+            elif self.by_id:
+                # Plugins without ids answer the handshake without one
+                pending = self.by_id.pop(next(iter(self.by_id)))
+            else:
+                return
+        entry, started = pending
+        if entry is not None:
+            self.proxy.write(self.session, entry, started, message)
+
+
+class RecordingProxy:
+    """
+    TCP proxy that forwards bytes unchanged in both directions and records
+    every command with its reply to ``out``. Frames are decoded on the side,
+    so codecs, compression and attachments pass through untouched.
+    """
+
+    def __init__(
+        self,
+        target: Tuple[str, int],
+        out: IO[str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.target = target
+        self.out = out
+        self.host = host
+        self.port = port
+        self.recorded = 0
+        self._sessions = itertools.count()
+        self._write_lock = threading.Lock()
+        self._listener: Optional[socket.socket] = None
+        self._sockets: List[socket.socket] = []
+        self._running = False
+        self._t0 = time.perf_counter()
+
+    def start(self) -> "RecordingProxy":
+        self._listener = socket.create_server((self.host, self.port))
+        self.port = self._listener.getsockname()[1]
+        self._running = True
+        self._t0 = time.perf_counter()
+        threading.Thread(target=self._accept, name="harness-proxy", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._running = False
+        if self._listener is not None:
+            self._listener.close()
+        for sock in list(self._sockets):
+            self._close(sock)
+
+    def __enter__(self) -> "RecordingProxy":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @staticmethod
+    def _close(sock: socket.socket) -> None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+    def _accept(self) -> None:
+        while self._running:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                break
+            try:
+                upstream = socket.create_connection(self.target)
+            except OSError as e:
+                print(f"Cannot reach {self.target[0]}:{self.target[1]}: {e}", file=sys.stderr)
+                self._close(client)
+                continue
+            for sock in (client, upstream):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._sockets.append(sock)
+            exchange = _Exchange(self, next(self._sessions))
+            for src, dst, handle in (
+                (client, upstream, exchange.on_command),
+                (upstream, client, exchange.on_reply),
+            ):
+                threading.Thread(
+                    target=self._pump, args=(src, dst, handle), daemon=True
+                ).start()
+
+    def _pump(self, src: socket.socket, dst: socket.socket, handle) -> None:
+        decoder: Optional[FrameDecoder] = FrameDecoder()
+        try:
+            while True:
+                data = src.recv(65536)
+                if not data:
+                    break
+                if decoder is not None:
+                    # Before forwarding: a command must be registered before
+                    # its reply can come back on the other pump
+                    decoder = self._observe(decoder, data, handle)
+                dst.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (src, dst):
+                self._close(sock)
+                if sock in self._sockets:
+                    self._sockets.remove(sock)
+
+    @staticmethod
+    def _observe(decoder: FrameDecoder, data: bytes, handle) -> Optional[FrameDecoder]:
+        """Pass every message ``data`` completes to ``handle``."""
+        try:
+            decoder.feed(data)
+        except ValueError:
+            # Oversized frame: keep forwarding, stop recording this side
+            return None
+        for frame in decoder:
+            if isinstance(frame, BinaryPayload):
+                continue
+            try:
+                message = decode_message(frame)
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                handle(message)
+        return decoder
+
+    def write(
+        self, session: int, entry: Dict[str, Any], started: float, response: Dict[str, Any]
+    ) -> None:
+        response = dict(response)
+        # Attachment frames were skipped; keep their size where the data would be
+        for attachment in response.pop("attachments", None) or ():
+            response[attachment.get("field", "attachment")] = (
+                f"<{attachment.get('length', 0)} bytes>"
+            )
+        record = dict(entry)
+        record["_session"] = session
+        record["_ts"] = round(started - self._t0, 4)
+        record["_elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        record["_response"] = summarize(response)
+        line = json.dumps(record, default=str)
+        with self._write_lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+            self.recorded += 1
+
+
+# --- Replay ------------------------------------------------------------------
+
+
+def sessions_of(entries: Iterable[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """Group entries by recorded session, each in the order it was sent."""
+    sessions: Dict[Any, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        sessions.setdefault(entry.get("_session", 0), []).append(entry)
+    for session in sessions.values():
+        session.sort(key=lambda entry: entry.get("_ts", 0.0))
+    return sessions
+
+
+async def replay_session(
+    label: str,
+    entries: Sequence[Dict[str, Any]],
+    target: Tuple[str, int],
+    speed: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Send one session's commands in order over its own connection. With a
+    ``speed`` a command is not sent before its recorded offset divided by
+    ``speed``; each still waits for the previous reply.
+    """
+    pool = C4DConnectionPool(host=target[0], port=target[1])
+    guids = GuidMap()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    first_ts = entries[0].get("_ts", 0.0) if entries else 0.0
+    results = []
+    try:
+        for entry in entries:
+            command, meta = split_entry(entry)
+            if speed and "_ts" in meta:
+                delay = (meta["_ts"] - first_ts) / speed - (loop.time() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            command = guids.substitute(command)
+            connection = await pool.acquire()
+            began = time.perf_counter()
+            response = await send_command(connection, command)
+            elapsed = time.perf_counter() - began
+            pool.release(connection)
+            recorded = meta.get("_response")
+            guids.capture(response, recorded)
+            changes = (
+                diff(normalize(recorded), normalize(response))
+                if recorded is not None
+                else []
+            )
+            results.append(
+                {
+                    "session": label,
+                    "command": command.get("command", ""),
+                    "elapsed_ms": round(elapsed * 1000, 3),
+                    "recorded_ms": meta.get("_elapsed_ms"),
+                    "error": response.get("error"),
+                    "diff": changes,
+                }
+            )
+    finally:
+        pool.close()
+    return results
+
+
+async def replay(
+    entries: Sequence[Dict[str, Any]],
+    target: Tuple[str, int],
+    speed: Optional[float] = None,
+    copies: int = 1,
+) -> List[Dict[str, Any]]:
+    """Replay every recorded session ``copies`` times, all in parallel."""
+    runs = [
+        replay_session(f"{session}.{copy}" if copies > 1 else str(session), items, target, speed)
+        for session, items in sessions_of(entries).items()
+        for copy in range(copies)
+    ]
+    return [result for batch in await asyncio.gather(*runs) for result in batch]
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def timing_report(
+    results: Sequence[Dict[str, Any]], max_slowdown: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """One row per command: latency percentiles against the recording."""
+    by_command: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        by_command.setdefault(result["command"], []).append(result)
+    rows = []
+    for command, items in by_command.items():
+        latencies = sorted(item["elapsed_ms"] for item in items)
+        recorded = sorted(
+            item["recorded_ms"] for item in items if item["recorded_ms"] is not None
+        )
+        p50, recorded_p50 = percentile(latencies, 50), percentile(recorded, 50)
+        ratio = round(p50 / recorded_p50, 2) if recorded_p50 else None
+        rows.append(
+            {
+                "command": command,
+                "calls": len(items),
+                "errors": sum(1 for item in items if item["error"]),
+                "diffs": sum(1 for item in items if item["diff"]),
+                "p50_ms": p50,
+                "p95_ms": percentile(latencies, 95),
+                "max_ms": latencies[-1],
+                "recorded_p50_ms": recorded_p50,
+                "ratio": ratio,
+                "regressed": bool(max_slowdown and ratio and ratio > max_slowdown),
+            }
+        )
+    return rows
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def print_report(results: Sequence[Dict[str, Any]], rows: Sequence[Dict[str, Any]]) -> None:
+    print(
+        f"{'command':<28} {'calls':>6} {'errors':>6} {'diffs':>6} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'max ms':>9} {'rec p50':>9} {'ratio':>6}"
+    )
+    for r in rows:
+        flag = "  SLOWER" if r["regressed"] else ""
+        print(
+            f"{r['command']:<28} {r['calls']:>6} {r['errors']:>6} {r['diffs']:>6} "
+            f"{_fmt(r['p50_ms']):>9} {_fmt(r['p95_ms']):>9} {_fmt(r['max_ms']):>9} "
+            f"{_fmt(r['recorded_p50_ms']):>9} {_fmt(r['ratio']):>6}{flag}"
+        )
+    for result in results:
+        if not result["diff"]:
+            continue
+        print(f"\n{result['command']} (session {result['session']}) differs:")
+        for change in result["diff"][:MAX_LISTED_DIFFS]:
+            print(f"    {change}")
+        hidden = len(result["diff"]) - MAX_LISTED_DIFFS
+        if hidden > 0:
+            print(f"    ... {hidden} more")
+
+
+def _parse_address(text: str, default_host: str) -> Tuple[str, int]:
+    host, _, port = text.rpartition(":")
+    return host or default_host, int(port)
+
+
+def _parse_speed(text: str) -> Optional[float]:
+    if text == "max":
+        return None
+    if text == "original":
+        return 1.0
+    speed = float(text)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive")
+    return speed
+
+
+def _record(args: argparse.Namespace) -> int:
+    target = _parse_address(args.target, C4D_HOST)
+    host, port = _parse_address(args.listen, "127.0.0.1")
+    with open(args.file, "a", encoding="utf-8") as out:
+        proxy = RecordingProxy(target, out, host, port).start()
+        print(
+            f"Recording {proxy.host}:{proxy.port} -> {target[0]}:{target[1]} "
+            f"into {args.file}; Ctrl+C to stop",
+            file=sys.stderr,
+        )
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            proxy.stop()
+    print(f"Recorded {proxy.recorded} commands", file=sys.stderr)
+    return 0
+
+
+def _replay(args: argparse.Namespace) -> int:
+    entries = load_script(args.file)
+    target = _parse_address(args.target, C4D_HOST)
+    results = asyncio.run(replay(entries, target, args.speed, args.sessions))
+    rows = timing_report(results, args.max_slowdown)
+    if args.json:
+        print(json.dumps({"commands": rows, "results": results}, indent=2))
+    else:
+        print_report(results, rows)
+    failed = any(r["diffs"] or r["regressed"] for r in rows)
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="mode", required=True)
+
+    record = commands.add_parser("record", help="proxy the server to the plugin and record")
+    record.add_argument("file", help="JSONL file to append to")
+    record.add_argument("--listen", default="5556", help="[host:]port for the server to connect to")
+    record.add_argument("--target", default=f"{C4D_HOST}:{C4D_PORT}", help="plugin host:port")
+    record.set_defaults(run=_record)
+
+    play = commands.add_parser("replay", help="replay a recording or harness file")
+    play.add_argument("file")
+    play.add_argument("--target", default=f"{C4D_HOST}:{C4D_PORT}", help="plugin host:port")
+    play.add_argument(
+        "--speed",
+        type=_parse_speed,
+        default="original",
+        help="original, max, or a factor applied to the recorded gaps",
+    )
+    play.add_argument("--sessions", type=int, default=1, help="parallel copies of each session")
+    play.add_argument(
+        "--max-slowdown",
+        type=float,
+        help="fail when a command's p50 exceeds this multiple of the recorded p50",
+    )
+    play.add_argument("--json", action="store_true", help="print the report as JSON")
+    play.set_defaults(run=_replay)
+
+    args = parser.parse_args()
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Stand-in plugin shared by the transport and tool tests.
+
+Importing this module puts ``src`` on ``sys.path``. ``StubPlugin`` listens
+on a free local port and hands every command it decodes to a ``respond``
+coroutine; ``PluginTestCase`` starts stub plugins around each test, answered
+by the test case's own ``respond``.
+
+For a full simulated plugin (latency and failure injection, synthetic
+scenes) use benchmarks/fake_plugin.py instead.
+"""
+
+import asyncio
+import os
+import string
+import sys
+import unittest
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+SRC = os.path.join(os.path.dirname(_tests_dir), "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from cinema4d_mcp.codec import decode_message, encode_message  # noqa: E402
+from cinema4d_mcp.framing import FrameDecoder  # noqa: E402
+from cinema4d_mcp.pool import C4DConnectionPool  # noqa: E402
+
+HOST = "127.0.0.1"
+
+
+def reply(command: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """A response to ``command``, carrying its request id when it has one."""
+    if "id" in command:
+        fields["id"] = command["id"]
+    return fields
+
+
+def hello(command: Dict[str, Any], *capabilities: str) -> Dict[str, Any]:
+    """The ``hello`` reply of a protocol 2 plugin."""
+    return reply(command, protocol=2, capabilities=list(capabilities))
+
+
+class StubClient:
+    """One connection to a ``StubPlugin``."""
+
+    def __init__(self, plugin: "StubPlugin", writer: asyncio.StreamWriter):
+        self.plugin = plugin
+        self.writer = writer
+        # Set after a hello that negotiated them; replies are plain JSON until then
+        self.codec = "json"
+        self.threshold: Optional[int] = None
+
+    def send(self, message: Union[Dict[str, Any], bytes]) -> None:
+        """Write a message in the connection's codec, or an already encoded frame."""
+        if not isinstance(message, bytes):
+            message = encode_message(message, self.codec, self.threshold)
+        self.writer.write(message)
+
+
+Respond = Callable[[Dict[str, Any], StubClient], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class StubPlugin:
+    """
+    Minimal plugin on a free local port.
+
+    ``respond(command, client)`` returns the reply to send, or None to send
+    nothing; it can ``client.send`` progress, rows or event frames first.
+    Commands on one connection are answered in order unless ``concurrent``,
+    in which case each runs as its own task. ``received`` keeps every
+    command and ``connections`` counts accepted sockets.
+    """
+
+    def __init__(self, respond: Respond, name: str = "a", concurrent: bool = False):
+        self.respond = respond
+        self.name = name
+        self.concurrent = concurrent
+        self.received: List[Dict[str, Any]] = []
+        self.clients: List[StubClient] = []
+        self.connections = 0
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def commands(self) -> List[str]:
+        """Names of the received commands, in order."""
+        return [command.get("command") for command in self.received]
+
+    async def start(self) -> "StubPlugin":
+        self._server = await asyncio.start_server(self._handle, HOST, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        self.drop_clients()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_clients(self) -> None:
+        """Close every open connection, as a plugin restart would."""
+        for client in self.clients:
+            client.writer.close()
+
+    async def _handle(self, reader, writer):
+        client = StubClient(self, writer)
+        self.clients.append(client)
+        self.connections += 1
+        decoder = FrameDecoder()
+        tasks = []
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                decoder.feed(data)
+                for frame in decoder:
+                    command = decode_message(frame)
+                    self.received.append(command)
+                    if self.concurrent:
+                        tasks.append(asyncio.ensure_future(self._answer(client, command)))
+                    else:
+                        await self._answer(client, command)
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _answer(self, client: StubClient, command: Dict[str, Any]) -> None:
+        response = await self.respond(command, client)
+        if response is not None:
+            client.send(response)
+        await client.writer.drain()
+
+
+class PluginTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Runs ``plugin_count`` stub plugins, answered by ``respond``, around each test.
+
+    ``self.plugin`` is the first of ``self.plugins`` and ``self.pool`` a
+    connection pool to it (built with ``pool_options``). With ``route`` set,
+    ``server._endpoints`` points at all of them for the test's duration, so
+    the tools themselves can be called.
+    """
+
+    plugin_count = 1
+    concurrent = False
+    route = False
+    pool_options: Dict[str, Any] = {}
+
+    async def asyncSetUp(self):
+        self.plugins = [
+            await StubPlugin(self.respond, name, self.concurrent).start()
+            for name in string.ascii_lowercase[: self.plugin_count]
+        ]
+        self.plugin = self.plugins[0]
+        self.pool = C4DConnectionPool(host=HOST, port=self.plugin.port, **self.pool_options)
+        if self.route:
+            from cinema4d_mcp import server
+            from cinema4d_mcp.endpoints import EndpointPool
+
+            self.endpoints = EndpointPool([(HOST, plugin.port) for plugin in self.plugins])
+            self._original_endpoints, server._endpoints = server._endpoints, self.endpoints
+            server._scene_cache.invalidate()
+
+    async def asyncTearDown(self):
+        self.pool.close()
+        if self.route:
+            from cinema4d_mcp import server
+
+            server._endpoints = self._original_endpoints
+            self.endpoints.stop()
+            self.endpoints.close()
+        for plugin in self.plugins:
+            await plugin.stop()
+
+    async def respond(self, command: Dict[str, Any], client: StubClient) -> Optional[Dict[str, Any]]:
+        """Answer ``hello`` as a protocol 2 plugin and everything else with success."""
+        if command["command"] == "hello":
+            return hello(command)
+        return reply(command, success=True)
@@ -0,0 +1,78 @@
+"""Tests for the scene-version validated result cache."""
+
+import unittest
+
+from plugin_stub import PluginTestCase, hello, reply
+
+from cinema4d_mcp import server
+from cinema4d_mcp.cache import SceneCache
+
+
+class TestSceneCache(unittest.TestCase):
+    def test_hit_requires_matching_version(self):
+        cache = SceneCache()
+        cache.put("list_objects", "doc:1", {"objects": []}, cache.generation)
+        self.assertEqual(cache.get("list_objects", "doc:1"), {"objects": []})
+        self.assertIsNone(cache.get("list_objects", "doc:2"))
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+
+    def test_put_after_invalidate_is_dropped(self):
+        cache = SceneCache()
+        generation = cache.generation
+        cache.invalidate()
+        cache.put("list_objects", "doc:1", {"objects": []}, generation)
+        self.assertIsNone(cache.version_of("list_objects"))
+
+
+class TestCachedCommands(PluginTestCase):
+    """A fake protocol 2 plugin whose dirty counter bumps on every edit."""
+
+    async def asyncSetUp(self):
+        self.dirty = 1
+        await super().asyncSetUp()
+        server._scene_cache.invalidate()
+
+    async def respond(self, command, client):
+        name = command["command"]
+        if name == "hello":
+            return hello(command, "scene_version")
+        if name == "list_objects":
+            return reply(command, objects=[], scene_version=f"doc:{self.dirty}")
+        if name == "scene_version":
+            return reply(command, scene_version=f"doc:{self.dirty}")
+        self.dirty += 1
+        return reply(command, success=True)
+
+    async def test_unchanged_scene_is_served_from_cache(self):
+        connection = await self.pool.acquire()
+        list_objects = {"command": "list_objects"}
+        first = await server._run_cached_command(connection, list_objects)
+        second = await server._run_cached_command(connection, list_objects)
+        self.assertEqual(first, second)
+        self.assertEqual(self.plugin.commands[1:], ["list_objects", "scene_version"])
+
+    async def test_external_edit_is_detected_by_version(self):
+        connection = await self.pool.acquire()
+        list_objects = {"command": "list_objects"}
+        await server._run_cached_command(connection, list_objects)
+        self.dirty += 1  # edited in the Cinema 4D UI
+        result = await server._run_cached_command(connection, list_objects)
+        self.assertEqual(result["scene_version"], f"doc:{self.dirty}")
+        self.assertEqual(
+            self.plugin.commands[1:], ["list_objects", "scene_version", "list_objects"]
+        )
+
+    async def test_mutating_command_invalidates(self):
+        connection = await self.pool.acquire()
+        list_objects = {"command": "list_objects"}
+        await server._run_cached_command(connection, list_objects)
+        await server._run_command(connection, {"command": "add_primitive"})
+        await server._run_cached_command(connection, list_objects)
+        self.assertEqual(
+            self.plugin.commands[1:], ["list_objects", "add_primitive", "list_objects"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
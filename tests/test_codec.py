@@ -0,0 +1,84 @@
+"""Tests for codec negotiation and message frames."""
+
+import importlib.util
+import json
+import os
+import unittest
+
+from plugin_stub import SRC, PluginTestCase
+
+from cinema4d_mcp import codec
+from cinema4d_mcp.codec import CodecError, choose_codec, decode_message, encode_message
+from cinema4d_mcp.framing import FrameDecoder
+from cinema4d_mcp.transport import send_command
+
+OBJECTS = {"objects": [{"name": f"Cube.{i}", "position": [i * 1.5, 0.0, -2.25]} for i in range(200)]}
+
+
+def _round_trip(message, **options):
+    decoder = FrameDecoder()
+    decoder.feed(encode_message(message, **options))
+    return decode_message(decoder.next_frame())
+
+
+class TestCodec(unittest.TestCase):
+    def test_plain_json_stays_a_text_frame(self):
+        self.assertEqual(encode_message({"a": 1}), b'{"a": 1}\n')
+
+    def test_zlib_above_threshold(self):
+        frame = encode_message(OBJECTS, compress_threshold=1024)
+        self.assertTrue(frame.startswith(b"#MSG json+zlib "))
+        self.assertLess(len(frame), len(json.dumps(OBJECTS)))
+        self.assertEqual(_round_trip(OBJECTS, compress_threshold=1024), OBJECTS)
+
+    @unittest.skipIf(codec.msgpack is None, "msgpack not installed")
+    def test_msgpack_round_trip(self):
+        self.assertEqual(_round_trip(OBJECTS, codec="msgpack"), OBJECTS)
+        self.assertEqual(
+            _round_trip(OBJECTS, codec="msgpack", compress_threshold=1024), OBJECTS
+        )
+
+    def test_choose_codec_falls_back_to_json(self):
+        self.assertEqual(choose_codec(["cbor"]), "json")
+        self.assertEqual(choose_codec(None), "json")
+        self.assertEqual(choose_codec(codec.available_codecs()), codec.available_codecs()[0])
+
+    def test_corrupt_frame_raises_codec_error(self):
+        decoder = FrameDecoder()
+        decoder.feed(b"#MSG json+zlib 3\nabc")
+        with self.assertRaises(CodecError):
+            decode_message(decoder.next_frame())
+
+    def test_loads_by_path_like_the_plugin(self):
+        path = os.path.join(SRC, "cinema4d_mcp", "codec.py")
+        spec = importlib.util.spec_from_file_location("c4d_mcp_codec", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self.assertEqual(decode_message(module.encode_message({"a": 1})), {"a": 1})
+
+
+class TestCodecNegotiation(PluginTestCase):
+    """A plugin that answers in whatever codec the server offered first."""
+
+    async def respond(self, command, client):
+        if command["command"] != "hello":
+            return dict(OBJECTS, id=command["id"])
+        response = {
+            "id": command["id"],
+            "protocol": 2,
+            "codec": choose_codec(command["codecs"]),
+            "compress_threshold": 1024,
+        }
+        client.send(response)
+        client.codec, client.threshold = response["codec"], 1024
+        return None
+
+    async def test_large_reply_uses_negotiated_codec(self):
+        connection = await self.pool.acquire()
+        self.assertEqual(connection.codec, codec.available_codecs()[0])
+        result = await send_command(connection, {"command": "list_objects"})
+        self.assertEqual(result, OBJECTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for routing across several plugin instances."""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from plugin_stub import PluginTestCase, reply
+
+from cinema4d_mcp import config, server
+from cinema4d_mcp.endpoints import EndpointPool
+
+
+class Session:
+    """Stands in for an MCP ServerSession; only identity matters."""
+
+
+class TestEndpointSelection(unittest.TestCase):
+    def setUp(self):
+        self.endpoints = EndpointPool([("127.0.0.1", 5555), ("127.0.0.1", 5556)])
+        self.first, self.second = self.endpoints.endpoints
+
+    def test_parse_endpoints(self):
+        with patch.dict(os.environ, {"C4D_ENDPOINTS": "a:1, b , a:1, c:x, d:70000"}):
+            self.assertEqual(
+                config._parse_endpoints("h", 5555), [("a", 1), ("b", 5555)]
+            )
+        with patch.dict(os.environ, {"C4D_ENDPOINTS": ""}):
+            self.assertEqual(config._parse_endpoints("h", 5555), [("h", 5555)])
+
+    def test_least_loaded_skips_busy_and_down_instances(self):
+        self.first.in_flight = 2
+        self.assertIs(self.endpoints.least_loaded(), self.second)
+        self.second.health.up = False
+        self.assertIs(self.endpoints.least_loaded(), self.first)
+
+    def test_sessions_stay_on_their_instance(self):
+        a, b = Session(), Session()
+        bound = self.endpoints.sticky(a)
+        bound.in_flight += 1
+        other = self.endpoints.sticky(b)
+        self.assertIsNot(bound, other)
+        other.in_flight += 5
+        self.assertIs(self.endpoints.sticky(a), bound)
+
+    def test_session_moves_when_its_instance_is_down(self):
+        session = Session()
+        bound = self.endpoints.sticky(session)
+        bound.health.up = False
+        self.assertIsNot(self.endpoints.sticky(session), bound)
+
+    def test_up_reflects_any_instance(self):
+        self.assertIsNone(self.endpoints.up)
+        self.first.health.up = False
+        self.second.health.up = True
+        self.assertTrue(self.endpoints.up)
+
+
+class TestEndpointRouting(PluginTestCase):
+    """Two fake protocol 2 plugins that report which instance answered."""
+
+    plugin_count = 2
+    route = True
+
+    async def asyncSetUp(self):
+        self.release = asyncio.Event()
+        await super().asyncSetUp()
+
+    async def respond(self, command, client):
+        response = reply(command, instance=client.plugin.name)
+        if command["command"] == "hello":
+            response["protocol"] = 2
+        elif command["command"] == "render_frame":
+            await self.release.wait()
+        return response
+
+    async def _instance(self, **options):
+        async with server.c4d_connection_context(**options) as connection:
+            command = "render_frame" if options.get("stateless") else "add_primitive"
+            result = await server._run_command(connection, {"command": command})
+            return result["instance"]
+
+    async def test_stateless_work_spreads_across_instances(self):
+        renders = [
+            asyncio.ensure_future(self._instance(stateless=True)) for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        self.assertEqual([e.in_flight for e in self.endpoints.endpoints], [1, 1])
+        self.release.set()
+        self.assertEqual(sorted(await asyncio.gather(*renders)), ["a", "b"])
+        self.assertEqual([e.in_flight for e in self.endpoints.endpoints], [0, 0])
+
+    async def test_scene_edits_are_sticky(self):
+        first = await self._instance()
+        self.endpoints.endpoints[0 if first == "a" else 1].in_flight += 3
+        self.assertEqual(await self._instance(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
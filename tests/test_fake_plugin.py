@@ -0,0 +1,101 @@
+"""Transport tests against benchmarks/fake_plugin.py and a bench_load smoke run."""
+
+import importlib.util
+import os
+import socket
+import sys
+import time
+import unittest
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.dirname(_tests_dir)
+_src = os.path.join(_root, "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+sys.path.insert(0, os.path.join(_root, "benchmarks"))
+
+from cinema4d_mcp import server
+from cinema4d_mcp.endpoints import EndpointPool
+from cinema4d_mcp.transport import C4DConnection, send_to_c4d
+from fake_plugin import FakePlugin, parse_seconds, parse_spec
+
+_spec = importlib.util.spec_from_file_location(
+    "bench_load", os.path.join(_root, "benchmarks", "bench_load.py")
+)
+bench_load = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_load)
+
+
+class TestBlockingClient(unittest.TestCase):
+    def test_send_to_c4d_speaks_protocol_1(self):
+        with FakePlugin(objects=3) as plugin:
+            sock = socket.create_connection((plugin.host, plugin.port))
+            connection = C4DConnection(sock=sock, connected=True)
+            try:
+                result = send_to_c4d(connection, {"command": "list_objects"})
+                self.assertEqual([o["name"] for o in result["objects"]], ["Cube.0", "Cube.1", "Cube.2"])
+                self.assertTrue(send_to_c4d(connection, {"command": "add_primitive"})["success"])
+                self.assertEqual(send_to_c4d(connection, {"command": "scene_version"})["scene_version"], "fake:2")
+            finally:
+                sock.close()
+
+    def test_parse_spec(self):
+        self.assertEqual(
+            parse_spec("*=2ms, render_preview=0.1..0.3s", parse_seconds),
+            {"*": 0.002, "render_preview": (0.1, 0.3)},
+        )
+
+
+class TestToolsAgainstFakePlugin(unittest.IsolatedAsyncioTestCase):
+    def _use(self, plugin):
+        plugin.start()
+        self.addCleanup(plugin.stop)
+        self.endpoints = EndpointPool([(plugin.host, plugin.port)])
+        self.original, server._endpoints = server._endpoints, self.endpoints
+        server._scene_cache.invalidate()
+        return plugin
+
+    async def asyncTearDown(self):
+        if hasattr(self, "endpoints"):
+            server._endpoints = self.original
+            self.endpoints.stop()
+            self.endpoints.close()
+
+    async def test_latency_and_payload_injection(self):
+        plugin = self._use(
+            FakePlugin(latency={"render_preview": 0.1}, payload_bytes={"render_preview": 50000})
+        )
+        start = time.perf_counter()
+        result, image = await server.render_preview(width=64, height=64)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+        self.assertEqual(result["image_size"], 50000)
+        self.assertEqual(plugin.received["hello"], 1)
+
+    async def test_injected_errors_reach_the_tool(self):
+        self._use(FakePlugin(failure_rate={"add_primitive": 1.0}))
+        result = await server.add_primitive("cube")
+        self.assertIn("Injected failure", str(result))
+
+    async def test_dropped_connection_is_reported_and_replaced(self):
+        plugin = self._use(FakePlugin(failure_rate={"add_primitive": 1.0}, failure_mode="drop"))
+        self.assertTrue(str(await server.add_primitive("cube")).startswith("❌"))
+        # The pool reconnects for the next command
+        self.assertIn("Cinema 4D Scene Information", await server.get_scene_info(None))
+        self.assertGreaterEqual(plugin.connections, 2)
+
+    async def test_load_run_reports_percentiles(self):
+        plugin = FakePlugin(objects=50).start()
+        self.addCleanup(plugin.stop)
+        results = await bench_load.run_benchmark(
+            (plugin.host, plugin.port), [1, 4], 20, bench_load.DEFAULT_TOOLS, warmup=2
+        )
+        self.assertEqual([r["calls"] for r in results], [20, 20])
+        for r in results:
+            self.assertEqual(r["errors"], 0)
+            self.assertLessEqual(r["p50_ms"], r["p95_ms"])
+            self.assertLessEqual(r["p95_ms"], r["p99_ms"])
+            self.assertGreater(r["calls_per_s"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
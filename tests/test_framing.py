@@ -0,0 +1,74 @@
+"""Tests for the shared newline frame codec."""
+
+import os
+import sys
+import unittest
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+_src = os.path.join(os.path.dirname(_tests_dir), "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from cinema4d_mcp.framing import (
+    BinaryPayload,
+    FrameDecoder,
+    FrameTooLargeError,
+    encode_binary_frame,
+    encode_frame,
+)
+
+
+class TestFrameDecoder(unittest.TestCase):
+    def test_frames_split_across_feeds(self):
+        decoder = FrameDecoder()
+        decoder.feed(b'{"a": ')
+        self.assertIsNone(decoder.next_frame())
+        decoder.feed(b"1}\n")
+        self.assertEqual(decoder.next_frame(), b'{"a": 1}')
+
+    def test_pipelined_frames_and_leftover_are_kept(self):
+        decoder = FrameDecoder()
+        decoder.feed(b"one\ntwo\nthr")
+        self.assertEqual(list(decoder), [b"one", b"two"])
+        self.assertEqual(decoder.pending, b"thr")
+        decoder.feed(b"ee\n")
+        self.assertEqual(decoder.next_frame(), b"three")
+        self.assertEqual(decoder.pending, b"")
+
+    def test_multibyte_utf8_split_across_feeds(self):
+        payload = encode_frame('{"name": "Würfel"}'.encode("utf-8"))
+        split = payload.index(b"\xc3") + 1  # between the two bytes of "ü"
+        decoder = FrameDecoder()
+        decoder.feed(payload[:split])
+        decoder.feed(payload[split:])
+        self.assertEqual(decoder.next_frame().decode("utf-8"), '{"name": "Würfel"}')
+
+    def test_max_frame_size_is_enforced(self):
+        decoder = FrameDecoder(max_frame_size=8)
+        decoder.feed(b"12345678\n")
+        self.assertEqual(decoder.next_frame(), b"12345678")
+        with self.assertRaises(FrameTooLargeError):
+            decoder.feed(b"123456789")
+        with self.assertRaises(FrameTooLargeError):
+            FrameDecoder(max_frame_size=8).feed(b"123456789\n")
+
+    def test_binary_frames_may_contain_delimiters(self):
+        image = b"\x89PNG\r\n\x1a\n\x00"
+        stream = encode_frame(b'{"ok": 1}') + encode_binary_frame(image) + b"next\n"
+        decoder = FrameDecoder()
+        for i in range(len(stream)):
+            decoder.feed(stream[i : i + 1])
+        header, payload, text = list(decoder)
+        self.assertEqual(header, b'{"ok": 1}')
+        self.assertIsInstance(payload, BinaryPayload)
+        self.assertEqual(payload, image)
+        self.assertNotIsInstance(text, BinaryPayload)
+        self.assertEqual(text, b"next")
+
+    def test_oversized_binary_frame_is_rejected(self):
+        with self.assertRaises(FrameTooLargeError):
+            FrameDecoder(max_frame_size=8).feed(b"#BIN 9\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Record/replay harness (tests/mcp_test_harness_cli.py) against benchmarks/fake_plugin.py."""
+
+import asyncio
+import io
+import json
+import os
+import sys
+import time
+import unittest
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.dirname(_tests_dir)
+sys.path.insert(0, os.path.join(_root, "benchmarks"))
+sys.path.insert(0, _tests_dir)
+
+import mcp_test_harness_cli as harness
+from cinema4d_mcp.pool import C4DConnectionPool
+from cinema4d_mcp.transport import send_command
+from fake_plugin import FakePlugin
+
+
+class RecordingFakePlugin(FakePlugin):
+    """Keeps every command it answered, to check what a replay sent."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.commands = []
+
+    def respond(self, command, client=None, send_lock=None, session=None):
+        self.commands.append(dict(command))
+        return super().respond(command, client, send_lock, session)
+
+
+async def _drive(port, commands):
+    """Send commands like the MCP server would, feeding GUIDs forward."""
+    pool = C4DConnectionPool(host="127.0.0.1", port=port)
+    guid = None
+    try:
+        for command in commands:
+            if guid and command.get("object_name") == "$guid":
+                command = dict(command, object_name=guid)
+            connection = await pool.acquire()
+            response = await send_command(connection, command)
+            pool.release(connection)
+            guid = response.get("object", {}).get("guid", guid)
+    finally:
+        pool.close()
+
+
+SESSION = [
+    {"command": "add_primitive", "type": "cube", "object_name": "Box"},
+    {"command": "modify_object", "object_name": "$guid", "properties": {"position": [0, 1, 0]}},
+    {"command": "render_preview", "width": 64, "height": 64, "image_transport": "binary"},
+    {"command": "get_scene_info"},
+]
+
+
+class TestRecordReplay(unittest.TestCase):
+    def record(self):
+        out = io.StringIO()
+        with FakePlugin(payload_bytes={"render_preview": 4096}) as plugin:
+            with harness.RecordingProxy((plugin.host, plugin.port), out) as proxy:
+                asyncio.run(_drive(proxy.port, [dict(c) for c in SESSION]))
+                deadline = time.monotonic() + 2
+                while proxy.recorded < len(SESSION) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_records_commands_with_timings_and_responses(self):
+        entries = self.record()
+        self.assertEqual([e["command"] for e in entries], [c["command"] for c in SESSION])
+        self.assertTrue(all(e["_session"] == 0 and e["_elapsed_ms"] >= 0 for e in entries))
+        self.assertEqual([e["_ts"] for e in entries], sorted(e["_ts"] for e in entries))
+        # Transport fields stay out; the attachment is reduced to its size
+        self.assertNotIn("id", entries[0])
+        self.assertEqual(entries[2]["_response"]["image_data"], "<4096 bytes>")
+        self.assertEqual(entries[0]["_response"]["object"]["requested_name"], "Box")
+
+    def test_replay_maps_recorded_guids_and_matches(self):
+        entries = self.record()
+        old_guid = entries[0]["_response"]["object"]["guid"]
+        with RecordingFakePlugin(payload_bytes={"render_preview": 4096}) as plugin:
+            results = asyncio.run(harness.replay(entries, (plugin.host, plugin.port)))
+        modify = next(c for c in plugin.commands if c["command"] == "modify_object")
+        self.assertNotEqual(modify["object_name"], old_guid)
+        self.assertTrue(modify["object_name"].isdigit())
+        self.assertEqual([r["diff"] for r in results], [[]] * len(SESSION))
+        rows = harness.timing_report(results)
+        self.assertEqual({r["command"] for r in rows}, {c["command"] for c in SESSION})
+        self.assertTrue(all(r["recorded_p50_ms"] is not None for r in rows))
+
+    def test_replay_reports_changed_responses(self):
+        entries = self.record()
+        entries[3]["_response"]["scene_info"]["object_count"] = 1
+        with FakePlugin(payload_bytes={"render_preview": 4096}) as plugin:
+            results = asyncio.run(harness.replay(entries, (plugin.host, plugin.port)))
+        self.assertEqual(results[3]["diff"], ["scene_info.object_count: 1 -> 101"])
+        rows = {r["command"]: r for r in harness.timing_report(results)}
+        self.assertEqual(rows["get_scene_info"]["diffs"], 1)
+        self.assertEqual(rows["add_primitive"]["diffs"], 0)
+
+    def test_harness_file_names_become_guids(self):
+        script = [
+            {"command": "add_primitive", "type": "pyramid", "name": "Test_Pyramid"},
+            {"command": "apply_material", "guid": "Test_Pyramid", "material_name": "M"},
+        ]
+        with RecordingFakePlugin() as plugin:
+            results = asyncio.run(harness.replay(script, (plugin.host, plugin.port)))
+        applied = plugin.commands[1]
+        self.assertTrue(applied["guid"].isdigit())
+        self.assertEqual([r["diff"] for r in results], [[], []])
+
+    def test_speed_and_parallel_sessions(self):
+        script = [
+            {"command": "scene_version", "_session": 0, "_ts": 0.0},
+            {"command": "scene_version", "_session": 0, "_ts": 0.3},
+            {"command": "get_scene_info", "_session": 1, "_ts": 0.1},
+        ]
+        with FakePlugin() as plugin:
+            target = (plugin.host, plugin.port)
+            start = time.perf_counter()
+            results = asyncio.run(harness.replay(script, target, speed=None, copies=3))
+            fast = time.perf_counter() - start
+            start = time.perf_counter()
+            asyncio.run(harness.replay(script, target, speed=1.0))
+            paced = time.perf_counter() - start
+            connections = plugin.connections
+        self.assertEqual(len(results), 9)
+        self.assertEqual(
+            sorted({r["session"] for r in results}),
+            ["0.0", "0.1", "0.2", "1.0", "1.1", "1.2"],
+        )
+        self.assertEqual(connections, 8)
+        self.assertLess(fast, 0.3)
+        self.assertGreaterEqual(paced, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for the background Cinema 4D health monitor."""
+
+import asyncio
+import socket
+import unittest
+
+from plugin_stub import PluginTestCase
+
+from cinema4d_mcp import server
+from cinema4d_mcp.health import HealthMonitor
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestHealthMonitor(PluginTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.port = self.plugin.port
+
+    async def test_probe_records_rtt(self):
+        monitor = HealthMonitor(host="127.0.0.1", port=self.port)
+        self.assertIsNone(monitor.snapshot()["up"])
+        self.assertTrue(await monitor.probe())
+        snapshot = monitor.snapshot()
+        self.assertTrue(snapshot["up"])
+        self.assertIsNotNone(snapshot["last_rtt_ms"])
+        self.assertEqual(snapshot["latency_histogram_ms"]["+Inf"], 1)
+
+    async def test_probe_records_failure(self):
+        monitor = HealthMonitor(host="127.0.0.1", port=_unused_port(), timeout=1)
+        self.assertFalse(await monitor.probe())
+        snapshot = monitor.snapshot()
+        self.assertFalse(snapshot["up"])
+        self.assertEqual(snapshot["failures"], 1)
+        self.assertIsNotNone(snapshot["last_error"])
+
+    async def test_background_loop_runs_once(self):
+        monitor = HealthMonitor(host="127.0.0.1", port=self.port, interval=60)
+        monitor.ensure_started()
+        task = monitor._task
+        monitor.ensure_started()
+        self.assertIs(monitor._task, task)
+        await asyncio.sleep(0.1)
+        monitor.stop()
+        self.assertEqual(monitor.probes, 1)
+
+    async def test_status_resource_does_not_block(self):
+        health = server._endpoints.primary.health
+        server._endpoints.stop()
+        health.host, health.port = "127.0.0.1", self.port
+        health.interval = 60
+        status = await asyncio.wait_for(server.get_connection_status(), 0.5)
+        self.assertIn("Cinema 4D Connection Status", status)
+        server._endpoints.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the background job API."""
+
+import asyncio
+import unittest
+
+from plugin_stub import PluginTestCase, hello, reply
+
+from cinema4d_mcp import server
+from cinema4d_mcp.jobs import JobTable
+
+
+class TestJobTable(unittest.IsolatedAsyncioTestCase):
+    async def test_outcomes(self):
+        table = JobTable(ttl=60)
+
+        async def fail(job):
+            raise RuntimeError("boom")
+
+        async def error(job):
+            return "❌ Error: no document"
+
+        async def ok(job):
+            return {"success": True}
+
+        jobs = [table.submit("x", run) for run in (fail, error, ok)]
+        await asyncio.gather(*(job.task for job in jobs))
+        self.assertEqual([job.status for job in jobs], ["failed", "failed", "succeeded"])
+        self.assertEqual(jobs[0].error, "boom")
+        self.assertEqual(jobs[2].result, {"success": True})
+
+    async def test_finished_jobs_expire(self):
+        table = JobTable(ttl=10)
+        blocker = asyncio.Event()
+
+        async def done(job):
+            return {}
+
+        async def waiting(job):
+            await blocker.wait()
+
+        finished = table.submit("x", done)
+        running = table.submit("x", waiting)
+        await finished.task
+        self.assertEqual(table.evict_expired(finished.finished + 11), 1)
+        self.assertIsNone(table.get(finished.id))
+        self.assertIs(table.get(running.id), running)
+        table.close()
+
+
+class TestJobTools(PluginTestCase):
+    """A fake plugin whose renders block until released."""
+
+    concurrent = True
+    route = True
+
+    async def asyncSetUp(self):
+        self.release = asyncio.Event()
+        self.started = 0
+        await super().asyncSetUp()
+        self.original_jobs, server._jobs = server._jobs, JobTable()
+
+    async def asyncTearDown(self):
+        server._jobs.close()
+        server._jobs = self.original_jobs
+        await super().asyncTearDown()
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "progress")
+        self.started += 1
+        client.send(reply(command, type="progress", progress=50, total=100))
+        await self.release.wait()
+        return reply(command, render_info={"success": True, "frame": command.get("frame")})
+
+    async def test_jobs_queue_per_endpoint_and_return_results(self):
+        first = await server.submit_job("render_frame", {"frame": 1})
+        second = await server.submit_job("render_frame", {"frame": 2})
+        self.assertEqual(first["status"], "queued")
+        await asyncio.sleep(0.1)
+
+        # One job slot per instance by default: the second job waits
+        status = await server.job_status(first["job_id"])
+        self.assertEqual(status["status"], "running")
+        self.assertEqual(status["progress"]["progress"], 50)
+        self.assertEqual((await server.job_status(second["job_id"]))["status"], "queued")
+        self.assertEqual(self.started, 1)
+        self.assertEqual((await server.job_result(first["job_id"]))["status"], "running")
+
+        self.release.set()
+        await asyncio.gather(*(job.task for job in server._jobs.jobs()))
+        result = await server.job_result(second["job_id"])
+        self.assertEqual(result["render_info"]["frame"], 2)
+
+    async def test_unknown_job_and_protocol_commands(self):
+        self.assertIn("error", await server.job_status("nope"))
+        for command in ("hello", "cancel", "subscribe_scene", "unsubscribe_scene"):
+            self.assertIn("error", await server.submit_job(command))
+        self.assertEqual(self.plugin.commands.count("subscribe_scene"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
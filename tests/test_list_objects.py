@@ -0,0 +1,59 @@
+"""Tests for filtered and streamed list_objects."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from plugin_stub import PluginTestCase, hello, reply
+
+from cinema4d_mcp import server
+
+ROWS = [{"name": f"Cube.{i}"} for i in range(600)]
+
+
+class TestListObjects(PluginTestCase):
+    """A fake plugin that streams rows in batches when asked to."""
+
+    route = True
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "progress", "scene_version", "list_objects_stream")
+        if command["command"] == "scene_version":
+            return reply(command, scene_version="doc:1")
+        if command.get("stream"):
+            for start in range(0, len(ROWS), 256):
+                client.send(reply(command, type="rows", rows=ROWS[start : start + 256]))
+            return reply(command, count=len(ROWS), streamed=True, scene_version="doc:1")
+        return reply(command, objects=ROWS[:1], scene_version="doc:1")
+
+    async def test_stream_writes_ndjson(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "objects.ndjson")
+            result = await server.list_objects(fields=["name"], stream_to=path)
+            with open(path, encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+        self.assertEqual(rows, ROWS)
+        self.assertEqual(result["count"], 600)
+        self.assertEqual(result["rows_written"], 600)
+        sent = self.plugin.received[-1]
+        self.assertTrue(sent["stream"] and sent["progress"])
+        self.assertEqual(sent["fields"], ["name"])
+
+    async def test_filters_are_forwarded_and_cached_separately(self):
+        await server.list_objects(root="Set/Props", max_depth=1, types=["Cube"], name="C*")
+        sent = self.plugin.received[-1]
+        self.assertEqual(
+            {k: sent[k] for k in ("root", "max_depth", "types", "name")},
+            {"root": "Set/Props", "max_depth": 1, "types": ["Cube"], "name": "C*"},
+        )
+        await server.list_objects(name="C*")
+        # A different filter is not answered from the first filter's cache entry
+        self.assertEqual(self.plugin.commands[-1], "list_objects")
+        await server.list_objects(name="C*")
+        self.assertEqual(self.plugin.commands[-1], "scene_version")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for the Prometheus-style metrics."""
+
+import unittest
+
+from plugin_stub import PluginTestCase
+from starlette.testclient import TestClient
+
+from cinema4d_mcp import server
+from cinema4d_mcp.metrics import (
+    BYTES_SENT,
+    COMMAND_PHASE_SECONDS,
+    COMMANDS,
+    Counter,
+    Histogram,
+    REQUESTS_IN_FLIGHT,
+)
+from cinema4d_mcp.transport import send_command
+
+
+class TestMetricTypes(unittest.TestCase):
+    def test_counter_renders_labels(self):
+        counter = Counter("calls_total", "Calls.", ("command",))
+        counter.inc(command="list_objects")
+        counter.inc(2, command="list_objects")
+        self.assertIn('calls_total{command="list_objects"} 3', counter.render())
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", ("phase",), buckets=(0.1, 1))
+        histogram.observe(0.05, phase="wait")
+        histogram.observe(0.5, phase="wait")
+        histogram.observe(5, phase="wait")
+        lines = histogram.render()
+        self.assertIn('latency_seconds_bucket{phase="wait",le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{phase="wait",le="1"} 2', lines)
+        self.assertIn('latency_seconds_bucket{phase="wait",le="+Inf"} 3', lines)
+        self.assertIn('latency_seconds_count{phase="wait"} 3', lines)
+
+
+class TestCommandMetrics(PluginTestCase):
+    async def test_send_command_records_phases_and_bytes(self):
+        connection = await self.pool.acquire()
+        ok_before = COMMANDS.value(command="metrics_probe", outcome="ok")
+        sent_before = BYTES_SENT.value()
+        await send_command(connection, {"command": "metrics_probe"})
+        self.assertEqual(COMMANDS.value(command="metrics_probe", outcome="ok"), ok_before + 1)
+        self.assertGreater(BYTES_SENT.value(), sent_before)
+        for phase in ("send", "wait", "parse"):
+            self.assertGreaterEqual(
+                COMMAND_PHASE_SECONDS.count(command="metrics_probe", phase=phase), 1
+            )
+        self.assertEqual(REQUESTS_IN_FLIGHT.value(), 0)
+
+    async def test_metrics_route_renders_text_format(self):
+        response = await server.metrics(None)
+        body = response.body.decode()
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn("# TYPE c4d_mcp_command_phase_seconds histogram", body)
+        self.assertIn("c4d_mcp_requests_in_flight", body)
+
+
+class TestMetricsRoute(unittest.TestCase):
+    def test_sse_app_serves_metrics(self):
+        response = TestClient(server.sse_app()).get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn("# TYPE c4d_mcp_commands_total counter", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests for the event-fed scene mirror."""
+
+import asyncio
+import unittest
+
+from plugin_stub import PluginTestCase, hello, reply
+
+from cinema4d_mcp import server
+from cinema4d_mcp.mirror import SceneMirror
+
+
+def record(obj_id, name, parent=None, type_name="Null"):
+    return {
+        "id": obj_id,
+        "name": name,
+        "parent": parent,
+        "type": type_name,
+        "type_id": 5140,
+        "position": [0, 0, 0],
+        "rotation": [0, 0, 0],
+        "scale": [1, 1, 1],
+        "material": None,
+    }
+
+
+SCENE = [
+    record("1", "Set"),
+    record("2", "Props", "1"),
+    record("3", "Cube.1", "2", "Cube"),
+    record("4", "Light", "1", "Light"),
+]
+
+
+class TestSceneMirror(unittest.TestCase):
+    def setUp(self):
+        self.mirror = SceneMirror()
+        self.mirror.load(SCENE, "doc:1")
+
+    def test_query_filters_like_the_plugin(self):
+        self.assertEqual(
+            self.mirror.query(["path"]),
+            [{"path": "Set"}, {"path": "Set/Props"}, {"path": "Set/Props/Cube.1"}, {"path": "Set/Light"}],
+        )
+        self.assertEqual(
+            self.mirror.query(["name", "level"], root="Set", max_depth=0),
+            [{"name": "Props", "level": 0}, {"name": "Light", "level": 0}],
+        )
+        self.assertEqual(self.mirror.query(["name"], types=["cube"]), [{"name": "Cube.1"}])
+        self.assertEqual(self.mirror.query(["name"], name="L*"), [{"name": "Light"}])
+        self.assertIsNone(self.mirror.query(["name"], root="Missing"))
+
+    def test_events(self):
+        self.mirror.apply(
+            {
+                "scene_version": "doc:2",
+                "events": [
+                    {"event": "renamed", "id": "4", "name": "Key"},
+                    {"event": "moved", "id": "4", "parent": "2"},
+                    {"event": "transform", "id": "3", "position": [1, 2, 3], "rotation": [0, 0, 0], "scale": [2, 2, 2]},
+                    {"event": "material", "id": "3", "material": "Red"},
+                    dict(record("5", "Sphere", "1", "Sphere"), event="added"),
+                ],
+            }
+        )
+        self.assertEqual(self.mirror.scene_version, "doc:2")
+        self.assertEqual(
+            self.mirror.query(["path", "material"], root="Set/Props"),
+            [{"path": "Set/Props/Cube.1", "material": "Red"}, {"path": "Set/Props/Key", "material": None}],
+        )
+        self.assertEqual(self.mirror.objects["3"]["position"], [1, 2, 3])
+
+        # Removing a parent drops its subtree
+        self.mirror.apply({"events": [{"event": "removed", "id": "2"}]})
+        self.assertEqual(sorted(self.mirror.objects), ["1", "5"])
+
+        self.mirror.apply({"events": [{"event": "reset", "objects": [record("9", "Other")]}]})
+        self.assertEqual(self.mirror.query(["name"]), [{"name": "Other"}])
+
+
+class TestMirrorSubscription(PluginTestCase):
+    """A plugin that answers subscribe_scene and pushes an event right behind it."""
+
+    route = True
+
+    async def asyncSetUp(self):
+        self.version = "doc:2"
+        await super().asyncSetUp()
+        self.mirror = self.endpoints.primary.mirror
+        self.mirror.retry_interval = 60
+        self.mirror.ensure_started(self.endpoints.primary.pool)
+        for _ in range(100):
+            if self.mirror.synced and self.mirror.events_applied:
+                break
+            await asyncio.sleep(0.01)
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "scene_events")
+        if command["command"] == "subscribe_scene":
+            client.send(reply(command, subscribed=True, objects=SCENE, scene_version="doc:1"))
+            return {
+                "type": "scene_event",
+                "scene_version": "doc:2",
+                "events": [{"event": "renamed", "id": "3", "name": "Box"}],
+            }
+        if command["command"] == "scene_version":
+            return reply(command, scene_version=self.version)
+        return reply(command, success=True)
+
+    async def test_lookups_are_answered_locally(self):
+        self.assertTrue(self.mirror.synced)
+        before = len(self.plugin.received)
+        result = await server.list_objects(fields=["name", "path"], name="Box")
+        self.assertEqual(result["source"], "mirror")
+        self.assertEqual(result["objects"], [{"name": "Box", "path": "Set/Props/Box"}])
+        self.assertEqual(len(self.plugin.received), before)
+
+    async def test_edits_revalidate_before_answering(self):
+        await server.add_primitive("cube")
+        self.assertTrue(self.mirror.pending)
+        result = await server.list_objects(fields=["name"], name="Box")
+        # The scene version still matches the last event, so the mirror answers
+        self.assertEqual(self.plugin.commands[-1], "scene_version")
+        self.assertEqual(result["source"], "mirror")
+        self.assertFalse(self.mirror.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,317 @@
+"""Plugin scene handlers run against the fake c4d module (benchmarks/fake_c4d.py)."""
+
+import logging
+import os
+import queue
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(_tests_dir), "benchmarks"))
+sys.path.insert(0, os.path.join(os.path.dirname(_tests_dir), "src"))
+
+import fake_c4d
+from synthetic_scenes import build_scene
+
+from cinema4d_mcp.mirror import MIRROR_FIELDS, SceneMirror
+
+plugin = fake_c4d.load_plugin()
+
+
+class TestPluginHandlers(unittest.TestCase):
+    def setUp(self):
+        self.server = plugin.C4DSocketServer(fake_c4d.NullQueue())
+
+    def use(self, doc):
+        fake_c4d.documents.SetActiveDocument(doc)
+        return doc
+
+    def test_list_objects_walks_every_level(self):
+        doc = self.use(build_scene(500, "wide", depth=3))
+        rows = self.server.handle_list_objects({})["objects"]
+        self.assertEqual(len(rows), 500)
+        self.assertEqual({row["level"] for row in rows}, {0, 1, 2})
+
+        top = doc.GetFirstObject().GetName()
+        child = doc.GetFirstObject().GetDown().GetName()
+        rows = self.server.handle_list_objects(
+            {"root": top, "max_depth": 0, "fields": ["name", "path"]}
+        )["objects"]
+        self.assertEqual(rows[0], {"name": child, "path": f"{top}/{child}"})
+        self.assertTrue(all(row["path"].count("/") == 1 for row in rows))
+
+    def test_mirror_rows_match_list_objects(self):
+        doc = self.use(build_scene(60, "wide", depth=3, tag_every=5))
+        top = doc.GetFirstObject()
+        cloner = fake_c4d.BaseObject(fake_c4d.Omgcloner)
+        cloner.SetName("Cloner")
+        doc.InsertObject(cloner, top)
+        for type_id, name in ((fake_c4d.Omgrandom, "Random"), (1039385, "Box Field")):
+            child = fake_c4d.BaseObject(type_id)
+            child.SetName(name)
+            doc.InsertObject(child, cloner)
+        mirror = SceneMirror()
+        mirror.load(self.server._scene_state(doc).values(), self.server.scene_version(doc))
+
+        for query in (
+            {"fields": list(MIRROR_FIELDS)},
+            {"fields": ["name", "parent", "material"], "root": top.GetName(), "max_depth": 1},
+            {"fields": ["path", "type"], "types": ["MoGraph Cloner", "1039385"]},
+        ):
+            rows = self.server.handle_list_objects(query)["objects"]
+            self.assertEqual(mirror.query(**query), rows)
+            if query["fields"] == list(MIRROR_FIELDS):
+                self.assertTrue(any(row["material"] for row in rows))
+                self.assertTrue(any(row["parent"] for row in rows))
+        self.assertEqual([row["type"] for row in rows], ["MoGraph Cloner", "Box Field"])
+
+
+        doc = self.use(build_scene(50, "flat"))
+        before = self.server.handle_get_scene_info()
+        self.assertEqual(before["scene_info"]["object_count"], 50)
+        doc.GetFirstObject().SetName("Renamed")
+        self.assertNotEqual(self.server.scene_version(), before["scene_version"])
+
+    def test_preview_render_keeps_scene_version(self):
+        doc = self.use(build_scene(10, "flat"))
+        version = self.server.scene_version()
+        dirty = doc.GetDirty()
+        doc.SetChanged()  # as inserting and removing the RenderData clone does
+        self.server._discount_render_dirty(doc, dirty)
+        self.assertEqual(self.server.scene_version(), version)
+        doc.GetFirstObject().SetName("Renamed")
+        self.assertNotEqual(self.server.scene_version(), version)
+
+    def test_render_progress_restarts_for_each_pass(self):
+        frames = []
+        self.server._send_response = lambda client, lock, frame, request_id: frames.append(frame)
+        progress = plugin.ProgressReporter(self.server, client=object(), request_id=1)
+        gi = plugin.c4d.RENDERPROGRESSTYPE_GLOBALILLUMINATION
+        render = plugin.c4d.RENDERPROGRESSTYPE_DURINGRENDERING
+        progress.render_callback(1.0, gi)
+        progress.render_callback(0.0, render)
+        progress.render_callback(0.5, render)
+        self.assertEqual([frame["phase"] for frame in frames], ["global illumination", "render"])
+        self.assertEqual(frames[0]["progress"], 20.0)
+        self.assertEqual(frames[1]["progress"], 20.0)
+        self.assertEqual(progress.progress, 57.5)
+        progress.render_callback(1.0, plugin.c4d.RENDERPROGRESSTYPE_AFTERRENDERING)
+        self.assertEqual(
+            frames[-1], {"type": "progress", "progress": 100.0, "total": 100, "phase": "finish"}
+        )
+
+    def test_find_object_by_name_strategies(self):
+        # Over the recursion limit if siblings were visited recursively
+        doc = self.use(build_scene(3000, "flat", tag_every=100))
+        last = doc.GetFirstObject()
+        while last.GetNext():
+            last = last.GetNext()
+        find = self.server.find_object_by_name
+        self.assertIs(find(doc, last.GetName()), last)
+        self.assertIs(find(doc, str(last.GetGUID()), use_guid=True), last)
+        # A comment tag and user data hold names of objects the plugin created
+        self.assertEqual(find(doc, "requested_2900").GetName().split(".")[1], "2900")
+        self.assertEqual(find(doc, "original_1200").GetName().split(".")[1], "1200")
+
+    def test_deep_hierarchies(self):
+        doc = self.use(build_scene(400, "deep", depth=200))
+        rows = self.server.handle_list_objects({"fields": ["level"]})["objects"]
+        self.assertEqual(max(row["level"] for row in rows), 199)
+        self.assertEqual(len(self.server._scene_state(doc)), 400)
+
+
+class TestMainThreadHandoff(unittest.TestCase):
+    """execute_on_main_thread from a worker, with a simulated C4D main thread."""
+
+    def setUp(self):
+        self.dialog = plugin.SocketServerDialog()
+        self.server = plugin.C4DSocketServer(
+            self.dialog.msg_queue, log_buffer=self.dialog.log_buffer
+        )
+        self.main = fake_c4d.MainThread(self.dialog, plugin.PLUGIN_ID).start()
+
+    def tearDown(self):
+        self.main.stop()
+
+    def on_worker(self, func, cancel_event=None):
+        """Run func on a worker thread like a protocol 2 command; (result, seconds)."""
+        outcome = {}
+
+        def worker():
+            if cancel_event is not None:
+                self.server._request_state.cancel = cancel_event
+            start = time.perf_counter()
+            outcome["result"] = func()
+            outcome["seconds"] = time.perf_counter() - start
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        return thread, outcome
+
+    def test_result_wakes_the_worker_without_polling(self):
+        ran_on = []
+
+        def task():
+            ran_on.append(threading.current_thread())
+            return {"value": 42}
+
+        samples = []
+        for _ in range(20):
+            thread, outcome = self.on_worker(lambda: self.server.execute_on_main_thread(task))
+            thread.join()
+            self.assertEqual(outcome["result"], {"value": 42})
+            samples.append(outcome["seconds"])
+        self.assertEqual(set(ran_on), {self.main.thread})
+        # The old handoff slept in 10 ms steps
+        self.assertLess(sorted(samples)[len(samples) // 2], 0.005)
+
+    def test_timeout_is_enforced(self):
+        thread, outcome = self.on_worker(
+            lambda: self.server.execute_on_main_thread(lambda: time.sleep(0.5), _timeout=0.1)
+        )
+        thread.join()
+        self.assertIn("timed out after 0.1s", outcome["result"]["error"])
+        self.assertLess(outcome["seconds"], 0.4)
+
+    def test_cancel_interrupts_the_wait(self):
+        cancel = plugin.CancelEvent()
+        thread, outcome = self.on_worker(
+            lambda: self.server.execute_on_main_thread(lambda: time.sleep(0.5)), cancel
+        )
+        time.sleep(0.05)
+        cancel.set()
+        thread.join()
+        self.assertEqual(outcome["result"], {"error": "Cancelled by client"})
+        self.assertLess(outcome["seconds"], 0.3)
+
+
+class TestMainThreadScheduler(unittest.TestCase):
+    def job(self, ran, name, priority, waited=0.0, seconds=0.0):
+        def work():
+            ran.append(name)
+            if seconds:
+                time.sleep(seconds)
+
+        job = plugin.MainThreadJob(work, priority)
+        job.enqueued -= waited
+        return job
+
+    def test_most_urgent_class_first_and_starved_jobs_ahead(self):
+        scheduler = plugin.MainThreadScheduler(budget=10, max_wait=1.0)
+        ran = []
+        scheduler.push(self.job(ran, "old edit", plugin.PRIORITY_EDIT, waited=2))
+        scheduler.push(self.job(ran, "old render", plugin.PRIORITY_RENDER, waited=5))
+        scheduler.push(self.job(ran, "render", plugin.PRIORITY_RENDER))
+        scheduler.push(self.job(ran, "edit", plugin.PRIORITY_EDIT))
+        scheduler.push(self.job(ran, "query", plugin.PRIORITY_QUERY))
+        self.assertEqual(scheduler.depths(), {"query": 1, "edit": 2, "render": 2})
+        self.assertEqual(scheduler.run(), 5)
+        # Jobs past max_wait go first, longest waiting first; then by class
+        self.assertEqual(ran, ["old render", "old edit", "query", "edit", "render"])
+
+    def test_budget_yields_back_to_cinema4d(self):
+        dialog = plugin.SocketServerDialog()
+        dialog.scheduler.budget = 0.05
+        ran = []
+        for i in range(5):
+            dialog.msg_queue.put(("EXEC", self.job(ran, i, plugin.PRIORITY_EDIT, seconds=0.03)))
+        for i in range(1000):
+            dialog.msg_queue.put(("LOG", f"line {i}"))
+        dialog.CoreMessage(plugin.PLUGIN_ID, None)
+        self.assertEqual(ran, [0, 1])
+        self.assertEqual(len(dialog.scheduler), 3)
+        self.assertEqual(dialog.log_buffer.written, 1000)
+        dialog.Timer(None)
+        dialog.Timer(None)
+        self.assertEqual(ran, [0, 1, 2, 3, 4])
+
+    def test_response_reports_queue_metadata(self):
+        dialog = plugin.SocketServerDialog()
+        server = plugin.C4DSocketServer(dialog.msg_queue)
+        client, peer = socket.socketpair()
+        try:
+            with fake_c4d.MainThread(dialog, plugin.PLUGIN_ID):
+                worker = threading.Thread(
+                    target=server._process_command,
+                    args=(client, threading.Lock(), {"command": "execute_python", "code": "x = 1", "id": 3}),
+                )
+                worker.start()
+                worker.join()
+            response = plugin.codec.decode_message(peer.recv(65536))
+        finally:
+            client.close()
+            peer.close()
+        self.assertTrue(response["success"])
+        meta = response["main_thread"]
+        self.assertEqual((meta["class"], meta["jobs"], meta["queue_depth"]), ("edit", 1, 0))
+        self.assertGreaterEqual(meta["wait_ms"], 0)
+
+
+class TestPluginLog(unittest.TestCase):
+    def test_levels_truncation_and_ring_bound(self):
+        log = plugin.PluginLog(capacity=3, level="INFO", max_message=20, path=None)
+        log.log("[C4D] Queueing", logging.DEBUG)
+        log.log("[C4D] ## Warning ##: odd")
+        log.log("x" * 50)
+        log.log("[**ERROR**] boom")
+        log.log("last")
+        written, text = log.text()
+        self.assertEqual(written, 4)
+        self.assertEqual(text.split("\n"), ["x" * 20 + "... [30 more chars]", "[**ERROR**] boom", "last"])
+        self.assertEqual(plugin.PluginLog.level_of("[**ERROR**] boom"), logging.ERROR)
+        self.assertEqual(plugin.PluginLog.level_of("a ## Warning ## b"), logging.WARNING)
+
+    def test_server_log_skips_the_queue_and_raw_payloads(self):
+        messages = queue.Queue()
+        server = plugin.C4DSocketServer(messages, log_buffer=plugin.PluginLog(level="DEBUG"))
+        client, peer = socket.socketpair()
+        server.running = True
+        try:
+            worker = threading.Thread(target=server.handle_client, args=(client,))
+            worker.start()
+            script = "x = 1  # " + "padding " * 100000
+            peer.sendall(plugin.codec.encode_message({"command": "execute_python", "code": script}))
+            peer.recv(65536)
+            peer.close()
+            worker.join()
+        finally:
+            peer.close()
+        self.assertTrue(messages.empty())
+        _, text = server.log_buffer.text()
+        self.assertIn("[C4D] Received: execute_python (", text)
+        self.assertNotIn("padding padding", text)
+        self.assertLess(max(len(line) for line in text.split("\n")), 1100)
+
+    def test_timer_flushes_only_new_lines(self):
+        dialog = plugin.SocketServerDialog()
+        calls = []
+        set_string = dialog.SetString
+        dialog.SetString = lambda gadget, value: calls.append(gadget) or set_string(gadget, value)
+        for i in range(5000):
+            dialog.log_buffer.log(f"line {i}")
+        dialog.Timer(None)
+        dialog.Timer(None)
+        self.assertEqual(calls.count(1004), 1)
+        shown = dialog.GetString(1004).split("\n")
+        self.assertEqual(len(shown), plugin.LOG_BUFFER_LINES)
+        self.assertEqual(shown[-1], "line 4999")
+
+    def test_rotating_file_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "plugin.log")
+            log = plugin.PluginLog(level="WARNING", path=path)
+            log.log("[C4D] chatty")
+            log.log("[**ERROR**] kept")
+            log.close()
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        self.assertIn("[ERROR] [**ERROR**] kept", content)
+        self.assertNotIn("chatty", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+"""Tests for the pooled asyncio Cinema 4D connection and transport."""
+
+import asyncio
+import time
+import unittest
+
+from plugin_stub import PluginTestCase, StubPlugin, hello, reply
+
+from cinema4d_mcp import server
+from cinema4d_mcp.framing import encode_binary_frame
+from cinema4d_mcp.pool import C4DConnectionPool
+from cinema4d_mcp.transport import _exchange_multiplexed, send_command
+
+
+class TestConnectionPool(PluginTestCase):
+    pool_options = {"max_idle": 2, "idle_timeout": 60}
+
+    async def respond(self, command, client):
+        """Answer every command with {"echo": <command>} like a minimal plugin."""
+        if command["command"] == "slow":
+            await asyncio.sleep(0.1)
+        return {"echo": command["command"]}
+
+    async def test_released_connection_is_reused(self):
+        first = await self.pool.acquire()
+        self.assertTrue(first.connected)
+        self.assertFalse(first.reused)
+        writer = first.writer
+        self.pool.release(first)
+
+        second = await self.pool.acquire()
+        self.assertIs(second.writer, writer)
+        self.assertTrue(second.reused)
+
+    async def test_peer_closed_connection_is_not_reused(self):
+        first = await self.pool.acquire()
+        writer = first.writer
+        self.pool.release(first)
+        await asyncio.sleep(0.05)
+        self.plugin.drop_clients()
+        await asyncio.sleep(0.05)
+
+        second = await self.pool.acquire()
+        self.assertTrue(second.connected)
+        self.assertIsNot(second.writer, writer)
+        self.assertFalse(second.reused)
+
+    async def test_idle_connections_are_evicted(self):
+        self.pool.idle_timeout = 0
+        connection = await self.pool.acquire()
+        self.pool.release(connection)
+        time.sleep(0.01)
+        await self.pool.acquire()
+        self.assertEqual(self.pool.idle_count, 0)
+
+    async def test_failed_connection_is_not_pooled(self):
+        connection = await self.pool.acquire()
+        connection.connected = False
+        self.pool.release(connection)
+        self.assertEqual(self.pool.idle_count, 0)
+        self.assertIsNone(connection.writer)
+
+    async def test_pool_size_is_bounded(self):
+        connections = [await self.pool.acquire() for _ in range(4)]
+        for connection in connections:
+            self.pool.release(connection)
+        self.assertEqual(self.pool.idle_count, 2)
+
+    async def test_send_command_round_trip(self):
+        connection = await self.pool.acquire()
+        first = await send_command(connection, {"command": "get_scene_info"})
+        second = await send_command(connection, {"command": "list_objects"})
+        self.assertEqual(first, {"echo": "get_scene_info"})
+        self.assertEqual(second, {"echo": "list_objects"})
+
+    async def test_send_command_marks_closed_connection_stale(self):
+        connection = await self.pool.acquire()
+        await asyncio.sleep(0.05)
+        self.plugin.drop_clients()
+        result = await send_command(connection, {"command": "get_scene_info"})
+        self.assertIn("error", result)
+        self.assertTrue(connection.stale)
+        self.assertFalse(connection.connected)
+
+    async def test_cancelled_lockstep_connection_is_not_reused(self):
+        connection = await self.pool.acquire()
+        writer = connection.writer
+        task = asyncio.ensure_future(send_command(connection, {"command": "slow"}))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertFalse(connection.connected)
+        self.pool.release(connection)
+
+        connection = await self.pool.acquire()
+        self.assertIsNot(connection.writer, writer)
+        result = await send_command(connection, {"command": "get_scene_info"})
+        self.assertEqual(result, {"echo": "get_scene_info"})
+
+
+
+class TestMultiplexedProtocol(PluginTestCase):
+    """A protocol 2 plugin: replies carry the request id and may be reordered."""
+
+    async def asyncSetUp(self):
+        self.held = []
+        await super().asyncSetUp()
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "attachments")
+        if command["command"] == "snapshot_scene":
+            client.send(
+                reply(
+                    command,
+                    render={"format": "png"},
+                    attachments=[{"field": "render.image_data", "length": 4}],
+                )
+            )
+            return encode_binary_frame(b"\x89P\nG")
+        if command["command"] == "render_frame":
+            # Answer the slow command only after the next one
+            self.held.append(command)
+            return None
+        client.send(reply(command, echo=command["command"]))
+        for slow in self.held:
+            client.send(reply(slow, echo=slow["command"]))
+        self.held.clear()
+        return None
+
+    async def test_out_of_order_responses_on_shared_connection(self):
+        first = await self.pool.acquire()
+        second = await self.pool.acquire()
+        self.assertIs(first, second)
+        self.assertEqual(first.protocol, 2)
+
+        render, info = await asyncio.gather(
+            send_command(first, {"command": "render_frame"}),
+            send_command(second, {"command": "get_scene_info"}),
+        )
+        self.assertEqual(render, {"echo": "render_frame"})
+        self.assertEqual(info, {"echo": "get_scene_info"})
+        self.assertEqual(self.plugin.connections, 1)
+
+    async def test_attachments_are_read_as_bytes(self):
+        connection = await self.pool.acquire()
+        self.assertIn("attachments", connection.capabilities)
+        result, info = await asyncio.gather(
+            send_command(connection, {"command": "snapshot_scene"}),
+            send_command(connection, {"command": "get_scene_info"}),
+        )
+        self.assertEqual(result["render"]["image_data"], b"\x89P\nG")
+        self.assertEqual(result["render"]["format"], "png")
+        self.assertEqual(info, {"echo": "get_scene_info"})
+
+    async def test_old_plugin_falls_back_to_lockstep(self):
+        async def old_plugin(command, client):
+            name = command["command"]
+            if name == "hello":
+                return {"error": f"Unknown command: {name}"}
+            return {"echo": name}
+
+        plugin = await StubPlugin(old_plugin).start()
+        pool = C4DConnectionPool(host="127.0.0.1", port=plugin.port)
+        try:
+            connection = await pool.acquire()
+            self.assertEqual(connection.protocol, 1)
+            result = await send_command(connection, {"command": "list_objects"})
+            self.assertEqual(result, {"echo": "list_objects"})
+            pool.release(connection)
+        finally:
+            pool.close()
+            await plugin.stop()
+
+
+class TestStaleRetry(PluginTestCase):
+    """A plugin that runs a command and then drops the connection unanswered."""
+
+    async def asyncSetUp(self):
+        self.drop = False
+        await super().asyncSetUp()
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command)
+        if self.drop:
+            self.drop = False
+            client.writer.close()
+            return None
+        return reply(command, success=True)
+
+    async def _run_on_dropped_connection(self, name):
+        connection = await self.pool.acquire()
+        self.pool.release(connection)
+        connection = await self.pool.acquire()
+        self.assertTrue(connection.reused)
+        self.drop = True
+        try:
+            return await server._run_command(connection, {"command": name})
+        finally:
+            self.pool.release(connection)
+
+    async def test_read_only_command_is_retried(self):
+        result = await self._run_on_dropped_connection("get_scene_info")
+        self.assertEqual(result, {"success": True})
+        self.assertEqual(self.plugin.commands.count("get_scene_info"), 2)
+
+    async def test_edit_is_not_sent_twice(self):
+        result = await self._run_on_dropped_connection("add_primitive")
+        self.assertTrue(result.startswith("❌"))
+        self.assertEqual(self.plugin.commands.count("add_primitive"), 1)
+
+
+class TestProgressFrames(PluginTestCase):
+    """A plugin that reports progress every 50 ms before answering."""
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "progress")
+        for step in range(1, 7):
+            await asyncio.sleep(0.05)
+            if command.get("progress"):
+                client.send(reply(command, type="progress", progress=step * 10, total=100))
+                await client.writer.drain()
+        return reply(command, done=True)
+
+    async def test_progress_is_forwarded_and_extends_deadline(self):
+        connection = await self.pool.acquire()
+        frames = []
+        # 0.3 s of work against a 0.12 s timeout: only progress keeps it alive
+        result = await _exchange_multiplexed(
+            connection, {"command": "render_frame"}, 0.12, frames.append
+        )
+        self.assertEqual(result, {"done": True})
+        self.assertEqual([frame["progress"] for frame in frames], [10, 20, 30, 40, 50, 60])
+        self.assertEqual(connection.progress_handlers, {})
+
+    async def test_silent_command_still_times_out(self):
+        connection = await self.pool.acquire()
+        with self.assertRaises(asyncio.TimeoutError):
+            await _exchange_multiplexed(connection, {"command": "render_frame"}, 0.12)
+        self.assertEqual(connection.pending, {})
+
+
+class TestCancellation(PluginTestCase):
+    """A plugin that never answers render_frame and records cancel messages."""
+
+    async def asyncSetUp(self):
+        self.cancelled = asyncio.Queue()
+        await super().asyncSetUp()
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "cancel")
+        if command["command"] == "cancel":
+            self.assertNotIn("id", command)
+            await self.cancelled.put(command["target"])
+        return None
+
+    async def test_timeout_sends_cancel(self):
+        connection = await self.pool.acquire()
+        with self.assertRaises(asyncio.TimeoutError):
+            await _exchange_multiplexed(connection, {"command": "render_frame"}, 0.05)
+        target = await asyncio.wait_for(self.cancelled.get(), 1)
+        self.assertIsInstance(target, int)
+        self.assertTrue(connection.connected)
+
+    async def test_cancelled_call_sends_cancel(self):
+        connection = await self.pool.acquire()
+        task = asyncio.ensure_future(send_command(connection, {"command": "render_frame"}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.wait_for(self.cancelled.get(), 1)
+        self.assertEqual(connection.pending, {})
+
+    async def test_cancelled_lockstep_call_does_not_block_later_commands(self):
+        async def old_plugin(command, client):
+            name = command["command"]
+            if name == "hello":
+                return {"error": f"Unknown command: {name}"}
+            if name == "render_frame":
+                await asyncio.sleep(0.2)
+            return {"answer_to": name}
+
+        plugin = await StubPlugin(old_plugin).start()
+        pool = C4DConnectionPool(host="127.0.0.1", port=plugin.port)
+        try:
+            connection = await pool.acquire()
+            task = asyncio.ensure_future(send_command(connection, {"command": "render_frame"}))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            pool.release(connection)
+
+            connection = await pool.acquire()
+            result = await asyncio.wait_for(
+                send_command(connection, {"command": "get_scene_info"}), 0.1
+            )
+            self.assertEqual(result, {"answer_to": "get_scene_info"})
+            pool.release(connection)
+        finally:
+            pool.close()
+            await plugin.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
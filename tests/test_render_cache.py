@@ -0,0 +1,57 @@
+"""Tests for the plugin's render image cache."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+_src = os.path.join(os.path.dirname(_tests_dir), "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from cinema4d_mcp.render_cache import RenderCache, make_render_key
+
+
+class TestRenderCache(unittest.TestCase):
+    def test_key_covers_every_part(self):
+        key = make_render_key(scene="doc:1", frame=0, width=640, height=360)
+        self.assertEqual(key, make_render_key(height=360, width=640, frame=0, scene="doc:1"))
+        self.assertNotEqual(key, make_render_key(scene="doc:1", frame=1, width=640, height=360))
+
+    def test_hit_and_miss_are_counted(self):
+        cache = RenderCache()
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", b"png", {"frame": 0})
+        self.assertEqual(cache.get("a"), (b"png", {"frame": 0}))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = RenderCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+    def test_byte_budget_is_enforced(self):
+        cache = RenderCache(max_bytes=4)
+        cache.put("a", b"12")
+        cache.put("b", b"345")
+        self.assertEqual(cache.stats()["entries"], 1)
+        cache.put("huge", b"123456")
+        self.assertIsNone(cache.get("huge"))
+
+    def test_evicted_entries_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            cache = RenderCache(max_entries=1, spill_dir=spill_dir)
+            cache.put("a", b"first", {"frame": 1})
+            cache.put("b", b"second")
+            self.assertEqual(cache.get("a"), (b"first", {"frame": 1}))
+            self.assertEqual(cache.stats()["disk_hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
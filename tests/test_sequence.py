@@ -0,0 +1,136 @@
+"""Tests for frame-range rendering."""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from plugin_stub import PluginTestCase, hello, reply
+
+from cinema4d_mcp import server
+from cinema4d_mcp.sequence import frame_path, plan_chunks, run_sequence
+
+
+class TestFramePath(unittest.TestCase):
+    def test_placeholders(self):
+        self.assertEqual(frame_path("r/shot_####.png", 7), "r/shot_0007.png")
+        self.assertEqual(frame_path("r/v2_#_##.png", 7), "r/v2_#_07.png")
+        self.assertEqual(frame_path("r/shot_{frame:03d}.png", 7), "r/shot_007.png")
+        self.assertEqual(frame_path("r/shot_%05d.png", 7), "r/shot_00007.png")
+        self.assertEqual(frame_path("r/shot.png", 7), "r/shot_0007.png")
+        self.assertEqual(frame_path("r/{name}/shot_##.png", 7), "r/{name}/shot_07.png")
+        self.assertEqual(frame_path("r/{0}.png", 7), "r/{0}_0007.png")
+
+    def test_plan_chunks(self):
+        self.assertEqual(plan_chunks([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]])
+
+
+class TestRunSequence(unittest.IsolatedAsyncioTestCase):
+    async def test_skips_existing_frames_and_retries_failures(self):
+        calls = []
+        flaky = {3}
+
+        async def render_chunk(chunk):
+            calls.append(list(chunk))
+            results = {}
+            for frame in chunk:
+                if frame in flaky:
+                    flaky.discard(frame)
+                    results[frame] = "Render failed"
+                elif frame != 5:
+                    results[frame] = None
+            return "a:1", results
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pattern = os.path.join(tmp, "f_####.png")
+            open(frame_path(pattern, 1), "wb").close()
+            report = await run_sequence(
+                range(1, 7), pattern, render_chunk, chunk_size=2, retries=1
+            )
+        self.assertEqual(report.skipped, [1])
+        self.assertEqual(report.rendered, [2, 3, 4, 6])
+        self.assertEqual(report.failed, {5: "No result for frame"})
+        self.assertEqual(calls[0], [2, 3])
+        # Failed frames come back as their own chunks
+        self.assertIn([3], calls)
+        self.assertIn([5], calls)
+        summary = report.as_dict()
+        self.assertFalse(summary["success"])
+        self.assertEqual(summary["frames_by_endpoint"], {"a:1": 4})
+        self.assertGreater(summary["frames_per_minute"], 0)
+
+    async def test_workers_render_chunks_concurrently(self):
+        active = []
+        peak = 0
+
+        async def render_chunk(chunk):
+            nonlocal peak
+            active.append(chunk)
+            peak = max(peak, len(active))
+            await asyncio.sleep(0.01)
+            active.remove(chunk)
+            return "a:1", {frame: None for frame in chunk}
+
+        report = await run_sequence(range(12), "/nonexistent/f_#.png", render_chunk, workers=3)
+        self.assertEqual(report.rendered, list(range(12)))
+        self.assertEqual(peak, 3)
+
+
+class TestRenderSequenceTool(PluginTestCase):
+    """Two fake plugins; a saved-scene sequence is split across both."""
+
+    plugin_count = 2
+    route = True
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return reply(command, protocol=2)
+        await asyncio.sleep(0.01)
+        return reply(
+            command,
+            frames=[
+                {"frame": frame, "output_path": path}
+                for frame, path in zip(command["frames"], command["output_paths"])
+            ],
+        )
+
+    async def test_chunks_spread_over_instances(self):
+        result = await server.render_sequence(
+            0, 9, 1, "/nonexistent/shot_####.png", scene_file="/scenes/shot.c4d"
+        )
+        self.assertTrue(result["success"])
+        self.assertEqual(result["rendered"], 10)
+        self.assertEqual(len(result["frames_by_endpoint"]), 2)
+
+    async def test_invalid_range(self):
+        result = await server.render_sequence(5, 1, 1, "/tmp/x_#.png")
+        self.assertIn("error", result)
+
+
+class TestLongChunk(PluginTestCase):
+    """A chunk that outlasts the command timeout while reporting progress."""
+
+    route = True
+
+    async def respond(self, command, client):
+        if command["command"] == "hello":
+            return hello(command, "progress")
+        for frame in command["frames"]:
+            await asyncio.sleep(0.05)
+            if command.get("progress"):
+                client.send(reply(command, type="progress", phase=f"frame {frame}"))
+                await client.writer.drain()
+        return reply(command, frames=[{"frame": frame} for frame in command["frames"]])
+
+    async def test_progress_extends_the_chunk_deadline(self):
+        with patch("cinema4d_mcp.transport.command_timeout", return_value=0.12):
+            result = await server.render_sequence(
+                1, 6, 1, "/nonexistent/shot_####.png", chunk_size=6, retries=0
+            )
+        self.assertEqual(result["rendered"], 6)
+        self.assertEqual(self.plugin.commands.count("render_frames"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
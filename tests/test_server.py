@@ -1,5 +1,6 @@
 """Tests for the Cinema 4D MCP Server."""
 
+import asyncio
 import os
 import sys
 import unittest
@@ -12,7 +13,13 @@ _src = os.path.join(_repo_root, "src")
 if _src not in sys.path:
     sys.path.insert(0, _src)
 
-from cinema4d_mcp.server import send_to_c4d, C4DConnection
+from cinema4d_mcp.server import (
+    send_to_c4d,
+    C4DConnection,
+    batch_commands,
+    render_preview,
+    _pop_image,
+)
 
 class TestC4DServer(unittest.TestCase):
     """Test cases for Cinema 4D server functionality."""
@@ -46,6 +53,16 @@ class TestC4DServer(unittest.TestCase):
         self.assertEqual(result, {"result": "success"})
         self.assertEqual(mock_sock.recv.call_count, 2)
 
+    def test_send_to_c4d_keeps_bytes_after_response(self):
+        """Test that a second frame in the same chunk answers the next call."""
+        mock_sock = MagicMock()
+        mock_sock.recv.side_effect = [b'{"n": 1}\n{"n": 2}\n']
+
+        connection = C4DConnection(sock=mock_sock, connected=True)
+        self.assertEqual(send_to_c4d(connection, {"command": "a"}), {"n": 1})
+        self.assertEqual(send_to_c4d(connection, {"command": "b"}), {"n": 2})
+        self.assertEqual(mock_sock.recv.call_count, 1)
+
     def test_send_to_c4d_exception(self):
         """Test error handling when sending fails."""
         mock_sock = MagicMock()
@@ -57,6 +74,32 @@ class TestC4DServer(unittest.TestCase):
         self.assertIn("error", result)
         self.assertIn("Test error", result["error"])
 
+    def test_batch_commands_rejects_items_without_command(self):
+        """Test that malformed batch items are rejected before contacting C4D."""
+        result = asyncio.run(
+            batch_commands([{"command": "add_primitive", "type": "cube"}, {"type": "sphere"}])
+        )
+        self.assertIn("error", result)
+        self.assertIn("1", result["error"])
+
+    def test_render_preview_rejects_unknown_image_transport(self):
+        """Test that image_transport is validated before contacting C4D."""
+        result = asyncio.run(render_preview(image_transport="jpeg"))
+        self.assertIn("image_transport", result)
+
+    def test_binary_image_is_returned_as_image_content(self):
+        """Test that attachment bytes become an Image instead of staying in the JSON."""
+        info = {"format": "png", "image_data": b"\x89PNG"}
+        image = _pop_image(info)
+        self.assertEqual(image.data, b"\x89PNG")
+        self.assertEqual(info, {"format": "png", "image_size": 4})
+
+    def test_base64_image_is_left_in_place(self):
+        """Test that legacy data URIs are passed through unchanged."""
+        info = {"image_data": "data:image/png;base64,AAAA"}
+        self.assertIsNone(_pop_image(info))
+        self.assertEqual(info["image_data"], "data:image/png;base64,AAAA")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
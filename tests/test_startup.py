@@ -0,0 +1,44 @@
+"""Startup budget and lazy-import checks (see benchmarks/bench_startup.py)."""
+
+import importlib.util
+import os
+import time
+import unittest
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.dirname(_tests_dir)
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench_startup = _load("bench_startup", os.path.join(_root, "benchmarks", "bench_startup.py"))
+
+
+class TestStartup(unittest.TestCase):
+    def test_server_import_within_budget(self):
+        result = bench_startup.measure(runs=3)
+        self.assertLess(result["total_ms"], bench_startup.STARTUP_BUDGET_MS, result["slowest"][:5])
+        self.assertLess(result["own_ms"], bench_startup.OWN_BUDGET_MS)
+        # starlette's router is only built for the SSE transport
+        self.assertEqual(set(result["deferred"].values()), {False})
+
+    def test_config_does_not_import_mcp(self):
+        result = bench_startup.measure_once("cinema4d_mcp.config")
+        self.assertNotIn("mcp", result["loaded"])
+
+    def test_probe_does_not_block_startup(self):
+        main = _load("c4d_main", os.path.join(_root, "main.py"))
+        # A non-routable address holds a blocking probe for its whole timeout
+        start = time.perf_counter()
+        thread = main._probe_in_background("10.255.255.1", 9, 2)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertTrue(thread.daemon)
+
+
+if __name__ == "__main__":
+    unittest.main()